@@ -0,0 +1,3 @@
+"""
+Benchmarks measuring performance of the library.
+"""
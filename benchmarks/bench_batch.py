@@ -0,0 +1,65 @@
+"""
+Compares throughput of parsing many sets of values: new parser per item vs batch parsing with one schema.
+
+Run with: python -m benchmarks.bench_batch
+"""
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from benchmarks.common import generate_arguments, measure
+from script_args_parser import ArgumentsParser, ArgumentsSchema
+from script_args_parser.arguments import Argument
+from script_args_parser.batch import BatchItem
+
+
+def _generate_items(count: int) -> list[BatchItem]:
+    return [
+        (['--arg-0', f'value {i}', '--arg-1', str(i)] if i % 2 else [], {'arg_0': f'value {i}'})
+        for i in range(count)
+    ]
+
+
+def _parser_per_item(arguments: list[Argument], items: list[BatchItem]) -> None:
+    for cli_params, user_values in items:
+        ArgumentsParser(arguments, cli_params, user_values, env={})
+
+
+def _schema_per_batch(arguments: list[Argument], items: list[BatchItem]) -> None:
+    schema = ArgumentsSchema(arguments)
+    for cli_params, user_values in items:
+        schema.parse(cli_params, user_values, env={})
+
+
+def _batch(executor: Optional[Executor] = None) -> Callable[[list[Argument], list[BatchItem]], Any]:
+    return lambda arguments, items: ArgumentsSchema(arguments).parse_batch(items, env={}, executor=executor)
+
+
+def main() -> None:
+    """
+    Run the benchmark and print results.
+
+    Arguments of all built-in types are parsed, every second item has cli parameters.
+    Parallel variants show gain only when more than one CPU is available.
+    """
+    workers = os.cpu_count() or 1
+    items = _generate_items(2_000)
+    print(f'CPUs: {workers}, items: {len(items)}')
+    print(f'{"variant":>22} {"arguments":>10} {"items/s":>10}')
+    with ThreadPoolExecutor(workers) as threads, ProcessPoolExecutor(workers) as processes:
+        variants: dict[str, Callable[[list[Argument], list[BatchItem]], Any]] = {
+            'parser per item': _parser_per_item,
+            'schema.parse per item': _schema_per_batch,
+            'parse_batch': _batch(),
+            'parse_batch (threads)': _batch(threads),
+            'parse_batch (processes)': _batch(processes),
+        }
+        for count in [8, 64]:
+            arguments = generate_arguments(count)
+            for name, variant in variants.items():
+                elapsed = measure(lambda: variant(arguments, items), repeat=3)
+                print(f'{name:>22} {count:>10} {len(items) / elapsed:>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""
+Compares converting big lists item by item with converting them all at once.
+
+Run with: python -m benchmarks.bench_bulk_conversion
+"""
+from typing import Any
+
+from benchmarks.common import measure
+from script_args_parser.arguments import ListArgument
+
+
+def _values(items_type: str, count: int) -> list[Any]:
+    if items_type == 'int':
+        return [str(i * 7919) for i in range(count)]
+    if items_type == 'bool':
+        return [['yes', 'no', 'True', 'false', '1', '0'][i % 6] for i in range(count)]
+    return [f'some/dir/file_{i}.txt' for i in range(count)]
+
+
+def main() -> None:
+    """
+    Run the benchmark and print results.
+    """
+    print(f'{"type":>5} {"items":>8} {"per item [ms]":>14} {"bulk [ms]":>10} {"speedup":>8}')
+    for items_type in ['int', 'bool', 'path']:
+        argument = ListArgument(
+            name='list', description='List value', type=f'list[{items_type}]', cli_arg='--item'
+        )
+        converter = argument.converters[0]
+        for count in [1_000, 100_000, 1_000_000]:
+            values = _values(items_type, count)
+            per_item = measure(lambda: [converter(x) for x in values], repeat=3)
+            bulk = measure(lambda: argument.convert_value(values), repeat=3)
+            print(
+                f'{items_type:>5} {count:>8} {per_item * 1000:>14.2f} {bulk * 1000:>10.2f} '
+                f'{per_item / bulk:>8.2f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Compares time and memory of lists of tuples returned as list of rows vs columns.
+
+Run with: python -m benchmarks.bench_columns
+"""
+import tracemalloc
+from collections.abc import Iterable
+from typing import Any
+
+from benchmarks.common import measure
+from script_args_parser.arguments import ListOfTuplesArgument
+
+
+def _allocated_size(argument: ListOfTuplesArgument, parsed_value: Iterable[list[Any]]) -> tuple[int, Any]:
+    tracemalloc.start()
+    try:
+        converted = argument.convert_value(parsed_value)
+        return tracemalloc.get_traced_memory()[0], converted
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    """
+    Run the benchmark and print results.
+
+    Memory is the size of objects allocated by conversion and kept in the result,
+    parsed strings are shared by both containers.
+    """
+    print(f'{"container":>10} {"rows":>8} {"convert [ms]":>13} {"memory [MB]":>12}')
+    for count in [1_000, 100_000]:
+        argument_value = ';'.join(f'{i} name_{i} {i % 2} {i * 7}' for i in range(count))
+        for container in ['list', 'columns']:
+            argument = ListOfTuplesArgument(
+                name='table', description='Table', type='list[tuple[int, str, bool, int]]', cli_arg='--table',
+                container=container,
+            )
+            parsed_value = argument.parse_value(argument_value)
+            elapsed = measure(lambda: argument.convert_value(parsed_value), repeat=3)
+            size, _ = _allocated_size(argument, parsed_value)
+            print(f'{container:>10} {count:>8} {elapsed * 1000:>13.1f} {size / 2**20:>12.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+Measures construction time and memory of arguments definitions of big schemas.
+
+Run with: python -m benchmarks.bench_definitions
+"""
+import tracemalloc
+
+from benchmarks.common import generate_arguments, generate_definitions, measure
+from script_args_parser.arguments import argument_factory
+
+
+def _allocated_size(count: int) -> int:
+    tracemalloc.start()
+    try:
+        arguments = generate_arguments(count)
+        size = tracemalloc.get_traced_memory()[0]
+        del arguments
+        return size
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    """
+    Run the benchmark and print results.
+
+    Memory is the size of objects allocated while creating arguments (including definitions dictionaries)
+    and kept alive by them.
+    """
+    print(f'{"arguments":>10} {"construct [ms]":>15} {"argparse options [ms]":>22} {"memory [kB/arg]":>16}')
+    for count in [1_000, 10_000]:
+        definitions = generate_definitions(count)
+        construct_time = measure(lambda: [argument_factory(name, x) for name, x in definitions.items()])
+        arguments = generate_arguments(count)
+        options_time = measure(lambda: [x.argparse_options for x in arguments])
+        size = _allocated_size(count)
+        print(
+            f'{count:>10} {construct_time * 1000:>15.1f} {options_time * 1000:>22.2f} '
+            f'{size / count / 1024:>16.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Compares loading many schemas sharing most of their definitions with and without ArgumentsInterner.
+
+Run with: python -m benchmarks.bench_interning
+"""
+import tracemalloc
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Callable, Optional
+
+import toml
+
+from benchmarks.common import generate_definitions, measure
+from script_args_parser import ArgumentsInterner, ArgumentsSchema, ParsingStats
+from script_args_parser.arguments import Argument
+
+
+def _write_files(directory: Path, files_count: int, common_count: int, own_count: int) -> list[Path]:
+    common_definitions = generate_definitions(common_count)
+    paths = []
+    for i in range(files_count):
+        own_definitions = {f'own_{i}_{name}': x for name, x in generate_definitions(own_count).items()}
+        for definition in own_definitions.values():
+            definition['cli_arg'] = f'--own{definition["cli_arg"]}'
+        path = directory / f'arguments_{i}.toml'
+        path.write_text(toml.dumps({**common_definitions, **own_definitions}))
+        paths.append(path)
+    return paths
+
+
+def _load(
+    paths: list[Path], interner: Optional[ArgumentsInterner], stats: ParsingStats
+) -> list[list[Argument]]:
+    if interner is not None:
+        interner.clear()
+    return [ArgumentsSchema.from_file(x, stats=stats, interner=interner).arguments for x in paths]
+
+
+def _allocated_size(func: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        result = func()
+        size = tracemalloc.get_traced_memory()[0]
+        del result
+        return size
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    """
+    Run the benchmark and print results.
+
+    Every file has 100 common and 20 own definitions. Memory is the size of arguments of all schemas
+    (argparse parsers of schemas are dropped). Times are totals of creating all schemas, of creating arguments
+    and of creating schemas from arguments (mostly argparse parsers).
+    """
+    print(
+        f'{"variant":>10} {"files":>6} {"total [ms]":>11} {"arguments [ms]":>15} {"schemas [ms]":>13} '
+        f'{"memory [MB]":>12}'
+    )
+    with TemporaryDirectory() as directory:
+        for files_count in [10, 100]:
+            paths = _write_files(Path(directory), files_count, 100, 20)
+            for name, interner in [('plain', None), ('interned', ArgumentsInterner())]:
+                elapsed = measure(lambda: _load(paths, interner, ParsingStats()), repeat=3)
+                stats = ParsingStats()
+                _load(paths, interner, stats)
+                size = _allocated_size(lambda: _load(paths, interner, ParsingStats()))
+                print(
+                    f'{name:>10} {files_count:>6} {elapsed * 1000:>11.1f} '
+                    f'{stats.stages["create_arguments"].seconds * 1000:>15.1f} '
+                    f'{stats.stages["create_schema"].seconds * 1000:>13.1f} {size / 2**20:>12.2f}'
+                )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Compares peak memory (RSS) and time of loading a big yaml config read as a whole vs streamed from the file.
+
+Every measurement runs in a fresh process, so its peak RSS is not affected by previous ones.
+Peak RSS is read with `resource`, so the benchmark runs only on Unix systems.
+
+Run with: python -m benchmarks.bench_large_files [--size-mb 20]
+"""
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from argparse import ArgumentParser, SUPPRESS
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from script_args_parser import backends
+
+
+def _read_whole(path: Path) -> Any:
+    return backends.load_yaml(path.read_text())
+
+
+METHODS: dict[str, Callable[[Path], Any]] = {
+    'read_text': _read_whole,
+    'stream': backends.load_yaml_file,
+}  #: Map: method name -> function loading yaml file
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+
+def _generate_config(path: Path, size_mb: int) -> None:
+    line = '  - some/quite/long/path/to/processed/file/number/{0:012d}.txt\n'
+    with path.open('w') as config_file:
+        config_file.write('name: generated config\ncount: 12\nfiles:\n')
+        for i in range(size_mb * 1024 ** 2 // len(line.format(0))):
+            config_file.write(line.format(i))
+
+
+def measure_child(method: str, backend: str, path: Path) -> None:
+    """
+    Load the config once and print time and peak RSS increase (measured in the current process).
+
+    :param method: one of METHODS keys
+    :param backend: one of backends.YAML_BACKENDS keys
+    :param path: yaml config to load
+    """
+    backends.set_yaml_backend(backend)
+    backends.load_yaml('warm: up')
+    base_rss = _peak_rss_mb()
+    start = time.perf_counter()
+    METHODS[method](path)
+    print(time.perf_counter() - start, _peak_rss_mb() - base_rss)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """
+    Run the benchmark and print results.
+
+    :param argv: cli parameters, if not given sys.argv[1:] is used
+    """
+    cli_parser = ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    cli_parser.add_argument('--size-mb', type=int, default=20, help='size of generated config')
+    cli_parser.add_argument('--child', nargs=3, help=SUPPRESS)
+    args = cli_parser.parse_args(argv)
+    if args.child:
+        method, backend, path = args.child
+        measure_child(method, backend, Path(path))
+        return
+    with tempfile.TemporaryDirectory() as work_dir:
+        config_path = Path(work_dir) / 'config.yaml'
+        _generate_config(config_path, args.size_mb)
+        print(f'config size: {config_path.stat().st_size / 1024 ** 2:.0f} MB')
+        print(f'{"backend":>8} {"method":>10} {"time [s]":>9} {"peak RSS increase [MB]":>23}')
+        for backend in backends.YAML_BACKENDS:
+            backends.set_yaml_backend(backend)
+            if backends.yaml_backend() != backend:
+                continue
+            for method in METHODS:
+                result = subprocess.run(
+                    [sys.executable, '-m', 'benchmarks.bench_large_files', '--child', method, backend,
+                     str(config_path)],
+                    capture_output=True, text=True, check=True,
+                )
+                load_time, rss = (float(x) for x in result.stdout.split())
+                print(f'{backend:>8} {method:>10} {load_time:>9.2f} {rss:>23.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+Compares splitting list values with shlex.split per item vs the single pass list tokenizer.
+
+Run with: python -m benchmarks.bench_list_tokenizer
+"""
+import shlex
+from typing import Callable
+
+from benchmarks.common import measure
+from script_args_parser.tokenizers import split_by_semicolon, split_list_items
+
+
+def _shlex_split_list_items(argument_value: str) -> list[str]:
+    ret_val = []
+    for value in split_by_semicolon(argument_value):
+        parsed_value = shlex.split(value)
+        ret_val.append(parsed_value[0] if parsed_value else '')
+    return ret_val
+
+
+_WORKLOADS: dict[str, Callable[[int], str]] = {
+    'plain': lambda i: str(i),
+    'padded': lambda i: f'  item_{i} ',
+    'quoted': lambda i: f"'item; {i}'",
+    'mixed': lambda i: ['', f' {i} ', f'"item {i}"', f'item\\ {i}'][i % 4],
+}
+
+
+def main() -> None:
+    """
+    Run the benchmark and print results.
+    """
+    print(f'{"workload":>9} {"items":>8} {"shlex [ms]":>11} {"tokenizer [ms]":>15} {"speedup":>8}')
+    for count in [1_000, 100_000]:
+        for workload, item_factory in _WORKLOADS.items():
+            # Quoted item has to start right after a semicolon, so the first item is a plain one
+            argument_value = ';'.join(['first', *(item_factory(i) for i in range(count))])
+            shlex_time = measure(lambda: _shlex_split_list_items(argument_value), repeat=3)
+            tokenizer_time = measure(lambda: split_list_items(argument_value), repeat=3)
+            print(
+                f'{workload:>9} {count:>8} {shlex_time * 1000:>11.1f} {tokenizer_time * 1000:>15.1f} '
+                f'{shlex_time / tokenizer_time:>8.1f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
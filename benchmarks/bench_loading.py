@@ -0,0 +1,42 @@
+"""
+Compares load time of big definition and config files with available toml and yaml backends.
+
+Run with: python -m benchmarks.bench_loading
+"""
+import toml
+import yaml
+
+from benchmarks.common import generate_definitions, measure
+from script_args_parser import backends
+
+
+def _generate_config(count: int) -> dict[str, list[list[object]]]:
+    return {f'arg_{i}': [[f'name {j}', j, j % 2 == 0] for j in range(20)] for i in range(count)}
+
+
+def main() -> None:
+    """
+    Run the benchmark and print results.
+    """
+    print(f'{"format":>6} {"backend":>8} {"size [kB]":>10} {"load [ms]":>10}')
+    for count in [100, 1_000, 10_000]:
+        toml_document = toml.dumps(generate_definitions(count))
+        for backend in backends.TOML_BACKENDS:
+            backends.set_toml_backend(backend)
+            if backends.toml_backend() != backend:
+                continue
+            load_time = measure(lambda: backends.load_toml(toml_document), repeat=3)
+            print(f'{"toml":>6} {backend:>8} {len(toml_document) / 1024:>10.0f} {load_time * 1000:>10.1f}')
+        yaml_document = yaml.dump(_generate_config(count // 10))
+        for backend in backends.YAML_BACKENDS:
+            backends.set_yaml_backend(backend)
+            if backends.yaml_backend() != backend:
+                continue
+            load_time = measure(lambda: backends.load_yaml(yaml_document), repeat=3)
+            print(f'{"yaml":>6} {backend:>8} {len(yaml_document) / 1024:>10.0f} {load_time * 1000:>10.1f}')
+    backends.set_toml_backend(None)
+    backends.set_yaml_backend(None)
+
+
+if __name__ == '__main__':
+    main()
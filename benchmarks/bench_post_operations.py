@@ -0,0 +1,28 @@
+"""
+Compares evaluation of post operations compiled once with formatting and evaluating them every time.
+
+Run with: python -m benchmarks.bench_post_operations
+"""
+from benchmarks.common import measure
+from script_args_parser.expressions import ArithmeticExpression
+
+
+_EXPRESSIONS = ['{value} * 60', '({value} + 3) * 10 // 7', 'max({value}, 10) - abs({value} % 3)']
+_VALUES = list(range(10_000))
+
+
+def main() -> None:
+    """
+    Run the benchmark and print results.
+    """
+    print(f'{"expression":>36} {"eval [us]":>10} {"compiled [us]":>14} {"speedup":>8}')
+    for template in _EXPRESSIONS:
+        expression = ArithmeticExpression(template)
+        eval_time = measure(lambda: [int(eval(template.format(value=value))) for value in _VALUES])
+        compiled_time = measure(lambda: [int(expression.evaluate(value)) for value in _VALUES])
+        eval_time, compiled_time = eval_time / len(_VALUES) * 1e6, compiled_time / len(_VALUES) * 1e6
+        print(f'{template:>36} {eval_time:>10.2f} {compiled_time:>14.2f} {eval_time / compiled_time:>8.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Compares single pass values resolution with resolution done by five full sweeps over arguments.
+
+Resolving every argument in one place is a restructuring needed by lazy mode, executor and stats,
+not an optimization: both variants are expected to take about the same time (within measurement noise),
+the benchmark checks that the single pass does not make parsing slower.
+
+Run with: python -m benchmarks.bench_resolution
+"""
+from collections.abc import Mapping
+from typing import Any, Optional
+
+from benchmarks.common import generate_arguments, measure
+from script_args_parser import ArgumentsParser, ArgumentsSchema
+from script_args_parser.arguments import Argument
+
+
+class MultiPassArgumentsParser(ArgumentsParser):
+    """
+    Parser resolving values the way it was done before, in five sweeps over all arguments.
+
+    :param schema: schema of arguments
+    :param cli_params: list of cli parameters
+    :param user_values: dict with values provided by the user
+    :param env: environment variables
+    """
+
+    def __init__(
+        self, schema: ArgumentsSchema, cli_params: Optional[list[str]] = None,
+        user_values: Optional[dict[str, Any]] = None, env: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        self._schema = schema
+        self.user_values = user_values or {}
+        self._env = env or {}
+        self._executor = None
+        self._stats = None
+        self.arguments = schema.arguments
+        self.arguments_values = schema.read_cli_arguments(cli_params)
+        values = self.arguments_values
+        for argument in self.arguments:
+            if values[argument.name] is None:
+                values[argument.name] = self.user_values.get(argument.name)
+            if values[argument.name] is None and argument.env_var is not None:
+                values[argument.name] = self._env.get(argument.env_var)
+            if values[argument.name] is None and argument.default_value is not None:
+                values[argument.name] = argument.default_value
+        for argument in self.arguments:
+            if (argument_value := values[argument.name]) is not None:
+                values[argument.name] = argument.parse_value(argument_value)
+        for argument in self.arguments:
+            if (argument_value := values[argument.name]) is not None:
+                values[argument.name] = argument.convert_value(argument_value)
+        for argument in self.arguments:
+            if argument.required and values[argument.name] is None:
+                raise RuntimeError(f'No value supplied for argument "{argument.name}".')
+        self._post_process()
+
+
+def _string_arguments(count: int) -> list[Argument]:
+    return [
+        Argument(
+            name=f'arg_{i}', type='str', description=f'Argument {i}', cli_arg=f'--arg-{i}',
+            env_var=f'BENCHMARK_ARG_{i}', default_value=f'default {i}',
+        )
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    """
+    Run the benchmark and print results.
+
+    Mixed workload uses default values of all built-in types, so parsing and conversion
+    dominate. Strings workload reads plain strings from user values, environment variables
+    and default values (a third of arguments each), so it shows mostly the cost of sweeping
+    over arguments and falling back between sources of values.
+    """
+    print(
+        f'{"workload":>9} {"arguments":>10} {"five passes [ms]":>17} {"single pass [ms]":>17} {"ratio":>8}'
+    )
+    for count in [10, 1_000, 10_000]:
+        workloads = [
+            ('mixed', generate_arguments(count), {}, {}),
+            (
+                'strings', _string_arguments(count),
+                {f'arg_{i}': f'value {i}' for i in range(0, count, 3)},
+                {f'BENCHMARK_ARG_{i}': f'env {i}' for i in range(1, count, 3)},
+            ),
+        ]
+        for workload, arguments, user_values, env in workloads:
+            schema = ArgumentsSchema(arguments)
+            multi_pass = measure(lambda: MultiPassArgumentsParser(schema, [], user_values, env))
+            single_pass = measure(lambda: ArgumentsParser(schema, [], user_values, env))
+            print(
+                f'{workload:>9} {count:>10} {multi_pass * 1000:>17.3f} {single_pass * 1000:>17.3f} '
+                f'{multi_pass / single_pass:>8.2f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
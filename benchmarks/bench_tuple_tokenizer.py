@@ -0,0 +1,54 @@
+"""
+Compares parsing lists of tuples with shlex.split and conversion per tuple vs the records tokenizer.
+
+Run with: python -m benchmarks.bench_tuple_tokenizer
+"""
+import shlex
+from typing import Any, Callable
+
+from benchmarks.common import measure
+from script_args_parser.arguments import ListOfTuplesArgument
+from script_args_parser.tokenizers import split_by_semicolon
+
+
+def _per_tuple(argument: ListOfTuplesArgument, argument_value: str) -> list[list[Any]]:
+    tuple_argument = argument.tuple_argument
+    ret_val = []
+    for value in split_by_semicolon(argument_value):
+        parsed_value = shlex.split(value) or ['']
+        ret_val.append(tuple_argument.convert_value(parsed_value))
+    return ret_val
+
+
+def _records(argument: ListOfTuplesArgument, argument_value: str) -> Any:
+    return argument.convert_value(argument.parse_value(argument_value))
+
+
+_WORKLOADS: dict[str, Callable[[int], str]] = {
+    'plain': lambda i: f'{i} name_{i} yes',
+    'quoted': lambda i: f'{i} "name {i}" yes',
+}
+
+
+def main() -> None:
+    """
+    Run the benchmark and print results.
+    """
+    argument = ListOfTuplesArgument(
+        name='table', description='Table', type='list[tuple[int, str, bool]]', cli_arg='--table'
+    )
+    print(f'{"workload":>9} {"rows":>8} {"per tuple [ms]":>15} {"records [ms]":>13} {"speedup":>8}')
+    for count in [1_000, 100_000]:
+        for workload, row_factory in _WORKLOADS.items():
+            argument_value = ';'.join(row_factory(i) for i in range(count))
+            assert _records(argument, argument_value) == _per_tuple(argument, argument_value)
+            per_tuple_time = measure(lambda: _per_tuple(argument, argument_value), repeat=3)
+            records_time = measure(lambda: _records(argument, argument_value), repeat=3)
+            print(
+                f'{workload:>9} {count:>8} {per_tuple_time * 1000:>15.1f} {records_time * 1000:>13.1f} '
+                f'{per_tuple_time / records_time:>8.1f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Helpers shared by benchmarks.
+"""
+import timeit
+from typing import Any, Callable
+
+from script_args_parser.arguments import Argument, argument_factory
+
+
+_DEFINITIONS_TEMPLATES: list[dict[str, Any]] = [
+    {'type': 'str', 'default_value': 'some text'},
+    {'type': 'int', 'default_value': '1410'},
+    {'type': 'bool', 'default_value': 'yes'},
+    {'type': 'path', 'default_value': './some/path'},
+    {'type': 'switch', 'default_value': 'false'},
+    {'type': 'list[int]', 'default_value': '1; 2; 3; 4'},
+    {'type': 'tuple[str, int]', 'default_value': 'John 16'},
+    {'type': 'list[tuple[str, int]]', 'default_value': 'John 16; David 18'},
+]
+
+
+def generate_definitions(count: int) -> dict[str, dict[str, Any]]:
+    """
+    Generate arguments definitions of all built-in types.
+
+    :param count: number of definitions to generate
+    :return: definitions as they would be read from toml file
+    """
+    ret_val: dict[str, dict[str, Any]] = {}
+    for i in range(count):
+        definition = dict(_DEFINITIONS_TEMPLATES[i % len(_DEFINITIONS_TEMPLATES)])
+        definition['description'] = f'Generated argument number {i}'
+        definition['cli_arg'] = f'--arg-{i}'
+        ret_val[f'arg_{i}'] = definition
+    return ret_val
+
+
+def generate_arguments(count: int) -> list[Argument]:
+    """
+    Generate arguments of all built-in types.
+
+    :param count: number of arguments to generate
+    :return: generated arguments
+    """
+    return [argument_factory(name, definition) for name, definition in generate_definitions(count).items()]
+
+
+def measure(func: Callable[[], Any], repeat: int = 5) -> float:
+    """
+    Measure execution time of a function.
+
+    :param func: function to be measured
+    :param repeat: number of measurements, the best one is returned
+    :return: the shortest execution time in seconds
+    """
+    return min(timeit.repeat(func, number=1, repeat=repeat))
@@ -0,0 +1,281 @@
+"""
+Measures per-stage timings of arguments parsing for all argument types and sources of values.
+
+Definitions and configs of increasing size are generated for every source (cli, yaml, env and
+default values). Each of them covers all built-in types and a dataclass registered with
+`dataclass_argument`. Dataclass values cannot be given as strings, so they are read from defaults
+when the source is cli or env.
+
+Results can be saved as json and compared with results saved for another commit.
+
+Run with: python -m benchmarks.suite [--output results.json] [--compare baseline.json]
+"""
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from argparse import ArgumentParser
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import toml
+import yaml
+
+from benchmarks.common import measure
+from script_args_parser import ArgumentsParser, ArgumentsSchema, dataclass_argument, ParsingStats
+from script_args_parser.arguments import argument_factory
+from script_args_parser.backends import load_toml, load_yaml
+
+
+SOURCES = ['cli', 'yaml', 'env', 'default']
+SIZES = [10, 100, 1_000]
+
+
+@dataclass_argument
+@dataclass
+class BenchmarkPoint:
+    """
+    Dataclass used as a custom argument type.
+    """
+
+    name: str
+    x: int
+    y: int
+
+
+@dataclass
+class _TypeCase:
+    type: str
+    text_value: str  #: value given in env or as default
+    cli_values: list[list[str]]  #: values following cli option, the option is repeated for each of them
+    yaml_value: Any  #: value given in yaml config
+
+    @property
+    def text_source(self) -> bool:
+        """
+        Check whether value can be given as text.
+
+        :return: whether value can be given in cli, env or as string default
+        """
+        return bool(self.text_value)
+
+
+_TYPE_CASES = [
+    _TypeCase('str', 'some text', [['some text']], 'some text'),
+    _TypeCase('int', '1410', [['1410']], 1410),
+    _TypeCase('bool', 'yes', [['yes']], True),
+    _TypeCase('path', './some/path', [['./some/path']], './some/path'),
+    _TypeCase('switch', 'false', [[]], False),
+    _TypeCase('list[int]', '1; 2; 3; 4', [['1'], ['2'], ['3'], ['4']], [1, 2, 3, 4]),
+    _TypeCase(
+        'list[str]', '"some text"; other; \'quoted text\'', [['some text'], ['other'], ['quoted text']],
+        ['some text', 'other', 'quoted text'],
+    ),
+    _TypeCase('tuple[str, int, bool]', 'John 16 yes', [['John', '16', 'yes']], ['John', 16, True]),
+    _TypeCase(
+        'list[tuple[str, int]]', 'John 16; David 18; "Mary Jane" 17',
+        [['John', '16'], ['David', '18'], ['Mary Jane', '17']],
+        [['John', 16], ['David', 18], ['Mary Jane', 17]],
+    ),
+    _TypeCase('BenchmarkPoint', '', [], ['point', 1, 2]),
+    _TypeCase('list[BenchmarkPoint]', '', [], [['first', 1, 2], ['second', 3, 4]]),
+]
+
+
+@dataclass
+class Workload:
+    """
+    Generated arguments definitions with values given in one of the sources.
+    """
+
+    source: str
+    definitions: dict[str, dict[str, Any]]
+    cli_params: list[str]
+    user_values: dict[str, Any]
+    env: dict[str, str]
+
+    @classmethod
+    def generate(cls, source: str, count: int) -> 'Workload':
+        """
+        Generate workload covering all argument types.
+
+        :param source: source of values: cli, yaml, env or default
+        :param count: number of arguments
+        :return: generated workload
+        """
+        workload = cls(source, {}, [], {}, {})
+        for i in range(count):
+            case = _TYPE_CASES[i % len(_TYPE_CASES)]
+            name = f'arg_{i}'
+            definition: dict[str, Any] = {
+                'type': case.type,
+                'description': f'Generated argument number {i}',
+                'cli_arg': f'--arg-{i}',
+                'env_var': f'BENCHMARK_ARG_{i}',
+            }
+            if source == 'default' or not case.text_source and source != 'yaml':
+                definition['default_value'] = case.yaml_value if not case.text_source else case.text_value
+            elif source == 'cli':
+                for values in case.cli_values:
+                    workload.cli_params.extend([f'--arg-{i}', *values])
+            elif source == 'yaml':
+                workload.user_values[name] = case.yaml_value
+            else:
+                workload.env[f'BENCHMARK_ARG_{i}'] = case.text_value
+            workload.definitions[name] = definition
+        return workload
+
+
+def _measure_passes(schema: ArgumentsSchema, workload: Workload, repeat: int) -> dict[str, float]:
+    timings: dict[str, float] = {}
+    for _ in range(repeat):
+        stats = ParsingStats()
+        ArgumentsParser(schema, workload.cli_params, workload.user_values, workload.env, stats=stats)
+        for stage in ['resolve_values', 'post_process_values']:
+            seconds = stats.stages[stage].seconds
+            timings[stage] = min(seconds, timings.get(stage, seconds))
+    return timings
+
+
+def _measure_from_files(
+    arguments_file: Path, config_file: Optional[Path], workload: Workload, repeat: int
+) -> float:
+    old_env = {x: os.environ.get(x) for x in workload.env}
+    os.environ.update(workload.env)
+    try:
+        return measure(
+            lambda: ArgumentsParser.from_files(arguments_file, workload.cli_params, config_file), repeat
+        )
+    finally:
+        for name, value in old_env.items():
+            if value is None:
+                del os.environ[name]
+            else:
+                os.environ[name] = value
+
+
+def run_workload(workload: Workload, repeat: int, work_dir: Path) -> dict[str, float]:
+    """
+    Measure all stages of parsing for given workload.
+
+    :param workload: workload to be measured
+    :param repeat: number of measurements of every stage, the best one is reported
+    :param work_dir: directory where generated files are stored
+    :return: Map: stage name -> time in seconds
+    """
+    toml_document = toml.dumps(workload.definitions)
+    arguments_file = work_dir / f'{workload.source}_{len(workload.definitions)}.toml'
+    arguments_file.write_text(toml_document)
+    config_file = None
+    if workload.user_values:
+        yaml_document = yaml.dump(workload.user_values)
+        config_file = work_dir / f'{workload.source}_{len(workload.definitions)}.yaml'
+        config_file.write_text(yaml_document)
+    definitions = load_toml(toml_document)
+    arguments = [argument_factory(name, definition) for name, definition in definitions.items()]
+    schema = ArgumentsSchema(arguments)
+    stages: dict[str, Callable[[], Any]] = {
+        'load_toml': lambda: load_toml(toml_document),
+        'create_arguments': lambda: [argument_factory(name, x) for name, x in definitions.items()],
+        'create_schema': lambda: ArgumentsSchema(arguments),
+        'read_cli': lambda: schema.read_cli_arguments(workload.cli_params),
+    }
+    if config_file is not None:
+        stages['load_yaml'] = lambda: load_yaml(yaml_document)
+    timings = {stage: measure(func, repeat) for stage, func in stages.items()}
+    timings.update(_measure_passes(schema, workload, repeat))
+    timings['parse'] = measure(
+        lambda: ArgumentsParser(schema, workload.cli_params, workload.user_values, workload.env), repeat
+    )
+    timings['from_files'] = _measure_from_files(arguments_file, config_file, workload, repeat)
+    return timings
+
+
+def run(sizes: list[int], sources: list[str], repeat: int) -> list[dict[str, Any]]:
+    """
+    Measure all workloads.
+
+    :param sizes: numbers of arguments in generated definitions
+    :param sources: sources of values
+    :param repeat: number of measurements of every stage, the best one is reported
+    :return: results, one per measured stage
+    """
+    results: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for source in sources:
+            for size in sizes:
+                timings = run_workload(Workload.generate(source, size), repeat, Path(work_dir))
+                results.extend(
+                    {'source': source, 'arguments': size, 'stage': stage, 'seconds': seconds}
+                    for stage, seconds in timings.items()
+                )
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _result_key(result: Mapping[str, Any]) -> tuple[str, int, str]:
+    return (result['source'], result['arguments'], result['stage'])
+
+
+def print_results(results: list[dict[str, Any]], baseline: Optional[list[dict[str, Any]]] = None) -> None:
+    """
+    Print results as a table.
+
+    :param results: measured results
+    :param baseline: if given, results are compared with it
+    """
+    baseline_times = {_result_key(x): x['seconds'] for x in baseline or []}
+    header = f'{"source":>8} {"arguments":>10} {"stage":>19} {"time [ms]":>10}'
+    print(header + (f' {"baseline [ms]":>14} {"ratio":>6}' if baseline else ''))
+    for result in results:
+        line = (
+            f'{result["source"]:>8} {result["arguments"]:>10} {result["stage"]:>19} '
+            f'{result["seconds"] * 1000:>10.3f}'
+        )
+        if (baseline_time := baseline_times.get(_result_key(result))) is not None:
+            line += f' {baseline_time * 1000:>14.3f} {result["seconds"] / baseline_time:>6.2f}'
+        print(line)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """
+    Run the benchmark, print results and optionally save them.
+
+    :param argv: command line arguments, if not given sys.argv[1:] is used
+    """
+    cli_parser = ArgumentParser(description=__doc__.splitlines()[1])
+    cli_parser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help='numbers of arguments')
+    cli_parser.add_argument(
+        '--sources', nargs='+', choices=SOURCES, default=SOURCES, help='sources of values'
+    )
+    cli_parser.add_argument('--repeat', type=int, default=5, help='number of measurements of every stage')
+    cli_parser.add_argument('--output', type=Path, help='json file where results are saved')
+    cli_parser.add_argument('--compare', type=Path, help='json file with results to compare with')
+    args = cli_parser.parse_args(argv)
+    results = run(args.sizes, args.sources, args.repeat)
+    baseline = json.loads(args.compare.read_text())['results'] if args.compare else None
+    print_results(results, baseline)
+    if args.output:
+        args.output.write_text(json.dumps({
+            'commit': _git_commit(),
+            'python': sys.version,
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'results': results,
+        }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,70 @@
-from .arguments import CUSTOM_ARGUMENTS_TYPES, CUSTOM_TYPES_MAPPING
-from .decorators import dataclass_argument
-from .parser import ArgumentsParser
+"""
+Parser of script arguments given in cli, config file, environment variables or as defaults.
+
+Public names are imported on first access, so importing the package does not load modules
+that a script does not use.
+"""
+from importlib import import_module
+from typing import Any, TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from .arguments import CUSTOM_ARGUMENTS_TYPES, CUSTOM_TYPES_MAPPING
+    from .batch import BatchResult
+    from .cache import DefinitionsCache
+    from .decorators import dataclass_argument, parallel_converter
+    from .interning import ArgumentsInterner
+    from .parser import ArgumentsParser, ArgumentsSchema
+    from .profiling import ParsingStats
 
 
 __all__ = [
+    'ArgumentsInterner',
     'ArgumentsParser',
+    'ArgumentsSchema',
+    'BatchResult',
     'CUSTOM_ARGUMENTS_TYPES',
     'CUSTOM_TYPES_MAPPING',
+    'DefinitionsCache',
     'dataclass_argument',
+    'parallel_converter',
+    'ParsingStats',
 ]
+
+_EXPORTS_MODULES = {
+    'ArgumentsInterner': '.interning',
+    'ArgumentsParser': '.parser',
+    'ArgumentsSchema': '.parser',
+    'BatchResult': '.batch',
+    'CUSTOM_ARGUMENTS_TYPES': '.arguments',
+    'CUSTOM_TYPES_MAPPING': '.arguments',
+    'DefinitionsCache': '.cache',
+    'dataclass_argument': '.decorators',
+    'parallel_converter': '.decorators',
+    'ParsingStats': '.profiling',
+}  #: Map: public name -> module defining it
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import public name from the module defining it.
+
+    :param name: name to be imported
+    :return: imported object
+
+    :raises AttributeError: when the name is not public
+    """
+    if (module_name := _EXPORTS_MODULES.get(name)) is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+    List module attributes, including not yet imported public names.
+
+    :return: attributes names
+    """
+    return sorted({*globals(), *__all__})
@@ -2,24 +2,27 @@
 Defines arguments' types.
 """
 import re
-import shlex
-from copy import deepcopy
-from dataclasses import asdict, dataclass
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from importlib import import_module
+from importlib.util import find_spec
 from itertools import chain
-from pathlib import Path
-from typing import Any, Callable, Optional, Type, Union
+from typing import Any, Callable, Optional, Type, TYPE_CHECKING, TypeVar, Union
 
+from script_args_parser.tokenizers import (
+    files_paths,
+    split_files_lines,
+    split_list_items,
+    split_records,
+    split_shell_words,
+)
+from script_args_parser.type_descriptors import parse_type
 
-def _split_string_by_semicolon(argument_value: str) -> list[Any]:
-    if argument_value == '':
-        return ['']
-    argument_value = ' ' + argument_value + ' '
-    while argument_value.find(';;') != -1:
-        argument_value = argument_value.replace(';;', '; ;', 1)
-    parser = shlex.shlex(argument_value)
-    parser.whitespace_split = True
-    parser.whitespace = ';'
-    return list(parser)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from script_args_parser.expressions import ArithmeticExpression
 
 
 def _str_to_bool(value: str) -> bool:
@@ -39,18 +42,209 @@ def _str_to_bool(value: str) -> bool:
     return bool(value)
 
 
+def _to_path(value: Any) -> 'Path':
+    """
+    Convert value into path, importing pathlib only when the first path is created.
+
+    :param value: value to be converted
+    :return: path
+    """
+    from pathlib import Path
+    return Path(value)
+
+
+def _compile_expression(template: str) -> 'ArithmeticExpression':
+    """
+    Compile post operations, importing expressions module only when the first one is compiled.
+
+    :param template: expression with {value} placeholder
+    :return: compiled expression
+    """
+    from script_args_parser.expressions import ArithmeticExpression
+    return ArithmeticExpression(template)
+
+
 _BASIC_TYPES_MAPPING: dict[str, Callable[[Any], Any]] = {
     'str': str,
     'int': int,
     'bool': _str_to_bool,
-    'path': Path,
+    'path': _to_path,
 }  #: Built-in map: string value -> types to actual converter
+_PURE_CONVERTERS = tuple(_BASIC_TYPES_MAPPING.values())  #: Built-in converters, safe to run concurrently
+
+_BOOL_TABLE: dict[Any, bool] = {
+    '': False, False: False, True: True,
+    **{
+        x: value
+        for words, value in [(['0', 'false', 'no'], False), (['1', 'true', 'yes'], True)]
+        for word in words
+        for x in (word, word.capitalize(), word.upper())
+    },
+}  #: Precomputed results of _str_to_bool for common values
+
+
+def _bulk_str(values: list[Any]) -> list[str]:
+    return list(map(str, values))
+
+
+def _bulk_int(values: list[Any]) -> list[int]:
+    return list(map(int, values))
+
+
+def _bulk_str_to_bool(values: list[Any]) -> list[bool]:
+    """
+    Convert values with _str_to_bool, taking common values from precomputed table.
+
+    :param values: values to be converted
+    :return: converted values
+    """
+    try:
+        ret_val: list[Any] = list(map(_BOOL_TABLE.get, values))
+    except TypeError:  # unhashable value, e.g. a list from yaml
+        return [_str_to_bool(x) for x in values]
+    if None in ret_val:
+        ret_val = [_str_to_bool(value) if x is None else x for x, value in zip(ret_val, values)]
+    return ret_val
+
+
+def _bulk_to_path(values: list[Any]) -> list['Path']:
+    from pathlib import Path
+    return list(map(Path, values))
+
+
+_BULK_CONVERTERS: dict[Callable[[Any], Any], Callable[[list[Any]], list[Any]]] = {
+    str: _bulk_str,
+    int: _bulk_int,
+    _str_to_bool: _bulk_str_to_bool,
+    _to_path: _bulk_to_path,
+}  #: Map: converter -> function converting many values at once with the same results
+
+
+_ARRAY_TYPECODES = {'int': 'q', 'bool': 'B'}  #: Map: list items type -> array.array typecode
+_NUMPY_DTYPES = {'int': 'int64', 'bool': 'bool_'}  #: Map: list items type -> numpy dtype name
+
+
+def _to_array(items_type: str, values: Iterable[Any]) -> Any:
+    from array import array
+    return array(_ARRAY_TYPECODES[items_type], values)
+
+
+def _to_numpy_array(items_type: str, values: Iterable[Any]) -> Any:
+    numpy = import_module('numpy')
+    return numpy.fromiter(values, dtype=getattr(numpy, _NUMPY_DTYPES[items_type]))
+
+
+_LIST_CONTAINERS: dict[str, Callable[[str, Iterable[Any]], Any]] = {
+    'array': _to_array,
+    'numpy': _to_numpy_array,
+}  #: Map: container name -> function packing converted list values into it
+
+_COLUMNS_CONTAINERS = {
+    'columns': 'array',
+    'numpy_columns': 'numpy',
+}  #: Map: list of tuples container name -> container of its int and bool columns
+
+
+class _VersionedMapping(dict[str, Callable[[Any], Any]]):
+    """
+    Dictionary that counts its modifications, so views built from it can be cached.
+    """
+
+    version = 0  #: bumped on every modification of the mapping
+
+    def __setitem__(self, key: str, value: Callable[[Any], Any]) -> None:
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    def __ior__(self, other: Any) -> '_VersionedMapping':  # type: ignore[override,misc]
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+    def pop(self, *args: Any) -> Any:
+        ret_val = super().pop(*args)
+        self.version += 1
+        return ret_val
+
+    def popitem(self) -> tuple[str, Callable[[Any], Any]]:
+        ret_val = super().popitem()
+        self.version += 1
+        return ret_val
+
+    def setdefault(self, *args: Any) -> Any:
+        ret_val = super().setdefault(*args)
+        self.version += 1
+        return ret_val
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self.version += 1
+
+
+CUSTOM_TYPES_MAPPING = _VersionedMapping()  #: Maps string values of types to actual converters
+
+_merged_types_mapping: tuple[int, dict[str, Callable[[Any], Any]]] = (-1, {})
+
 
+def _get_types_mapping() -> dict[str, Callable[[Any], Any]]:
+    """
+    Return single mapping for all available types.
+
+    The mapping is rebuilt only when CUSTOM_TYPES_MAPPING has changed since the last call,
+    so the returned dictionary is shared and must not be modified.
+
+    :return: available types mapping
+    """
+    global _merged_types_mapping
+    version, mapping = _merged_types_mapping
+    if version != CUSTOM_TYPES_MAPPING.version:
+        mapping = dict(_BASIC_TYPES_MAPPING)
+        mapping.update(CUSTOM_TYPES_MAPPING)
+        _merged_types_mapping = (CUSTOM_TYPES_MAPPING.version, mapping)
+    return mapping
+
+
+ArgumentT = TypeVar('ArgumentT', bound='Argument')
+
+_NOT_RESOLVED_CONVERTERS: tuple[int, list[Callable[[Any], Any]]] = (-1, [])  #: shared by all new arguments
 
-CUSTOM_TYPES_MAPPING: dict[str, Callable[[Any], Any]] = {
-}  #: Maps string values of types to actual converters
 
+def _slotted(*derived: str) -> Callable[[Type[ArgumentT]], Type[ArgumentT]]:
+    """
+    Create decorator recreating a dataclass with __slots__, so its instances have no __dict__.
+
+    Slots hold fields defined by the class and given attributes derived from them in __post_init__.
+    Works like dataclass(slots=True), which is not available in Python 3.9, but also points
+    zero-argument super() of methods to the recreated class.
 
+    :param derived: names of attributes which are not fields
+    :return: class decorator
+    """
+    def decorator(cls: Type[ArgumentT]) -> Type[ArgumentT]:
+        own_fields = cls.__dict__.get('__annotations__', {})
+        namespace = {
+            name: value for name, value in cls.__dict__.items()
+            if name not in own_fields and name not in ('__dict__', '__weakref__')
+        }
+        namespace['__slots__'] = (*own_fields, *derived)
+        slotted: Type[ArgumentT] = type(cls.__name__, cls.__bases__, namespace)
+        for value in namespace.values():
+            for function in (value, getattr(value, 'fget', None), getattr(value, '__func__', None)):
+                for cell in getattr(function, '__closure__', None) or ():
+                    if cell.cell_contents is cls:
+                        cell.cell_contents = slotted
+        return slotted
+    return decorator
+
+
+@_slotted('_converters', '_argparse_options')
 @dataclass
 class Argument:
     """
@@ -71,6 +265,29 @@ class Argument:
         """
         if isinstance(self.required, str):  # type: ignore
             self.required = _str_to_bool(self.required)  # type: ignore
+        self._converters: tuple[int, list[Callable[[Any], Any]]] = _NOT_RESOLVED_CONVERTERS
+        self._argparse_options: Optional[tuple[list[str], dict[str, Any]]] = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Return state for pickling, without resolved converters as those may not be picklable.
+
+        :return: argument state
+        """
+        slots = chain.from_iterable(x.__dict__.get('__slots__', ()) for x in type(self).__mro__)
+        state = {name: getattr(self, name) for name in slots if hasattr(self, name)}
+        state.update(getattr(self, '__dict__', {}))
+        state['_converters'] = _NOT_RESOLVED_CONVERTERS
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """
+        Restore pickled state.
+
+        :param state: argument state
+        """
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
 
     def parse_value(self, argument_value: Any) -> Any:
         """
@@ -88,7 +305,7 @@ class Argument:
         :param argument_value: parsed argument value
         :return: casted argument value
         """
-        return self.types_mapping[self.type](argument_value)
+        return self.converters[0](argument_value)
 
     def post_process(self, argument_value: Any, arguments: dict[str, Any]) -> Any:
         """
@@ -100,8 +317,39 @@ class Argument:
         """
         return argument_value
 
+    @property
+    def dependencies(self) -> list[str]:
+        """
+        List names of arguments which values are used to post process this argument.
+
+        :return: names of other arguments
+        """
+        return []
+
+    @property
+    def has_post_processing(self) -> bool:
+        """
+        Check whether post_process can change the value, so it is worth running on an executor.
+
+        :return: True if the class overrides post_process
+        """
+        return type(self).post_process is not Argument.post_process
+
     @property
     def argparse_options(self) -> tuple[list[str], dict[str, Any]]:
+        """
+        Options to parse argument, built on first access.
+
+        Options are built once, so the definition shall not be changed after the first parser was created
+        with it. Returned options are shared and must not be modified.
+
+        :return: args and kwargs that can be used in argparse.ArgumentParser.add_argument
+        """
+        if (options := self._argparse_options) is None:
+            options = self._argparse_options = self._build_argparse_options()
+        return options
+
+    def _build_argparse_options(self) -> tuple[list[str], dict[str, Any]]:
         """
         Generate options to parse argument.
 
@@ -122,9 +370,53 @@ class Argument:
 
         :return: available types mapping
         """
-        ret_val = deepcopy(_BASIC_TYPES_MAPPING)
-        ret_val.update(CUSTOM_TYPES_MAPPING)
-        return ret_val
+        return dict(_get_types_mapping())
+
+    @property
+    def converters_types(self) -> list[str]:
+        """
+        List names of types that values of this argument are converted with.
+
+        :return: types names in the order used by convert_value
+        """
+        return [self.type]
+
+    @property
+    def converters(self) -> list[Callable[[Any], Any]]:
+        """
+        Resolve converters for converters_types.
+
+        Resolved callables are kept on the argument and looked up again only when
+        registered types change.
+
+        :return: converters in the same order as converters_types
+        """
+        version, converters = self._converters
+        if version != CUSTOM_TYPES_MAPPING.version:
+            types_mapping = _get_types_mapping()
+            converters = [types_mapping[x] for x in self.converters_types]
+            self._converters = (CUSTOM_TYPES_MAPPING.version, converters)
+        return converters
+
+    @property
+    def parallel_convertible(self) -> bool:
+        """
+        Check whether values can be converted on an executor, concurrently with other arguments.
+
+        At least one converter has to be marked with parallel_converter and the rest has to be built-in.
+        Arguments converted without types mapping (e.g. switch) or which types are not registered
+        are converted in the current thread.
+
+        :return: True if converters can be run concurrently
+        """
+        from script_args_parser.decorators import is_parallel_converter
+        try:
+            converters = self.converters
+        except KeyError:
+            return False
+        return any(map(is_parallel_converter, converters)) and all(
+            is_parallel_converter(x) or x in _PURE_CONVERTERS for x in converters
+        )
 
     @staticmethod
     def matcher(arg_type: str) -> bool:
@@ -134,21 +426,18 @@ class Argument:
         :param arg_type: argument type string
         :return: whether provided type is supported
         """
-        lower_arg_type = arg_type.lower()
-        return (
-            arg_type in chain(_BASIC_TYPES_MAPPING, CUSTOM_TYPES_MAPPING)
-            or lower_arg_type in chain(_BASIC_TYPES_MAPPING, CUSTOM_TYPES_MAPPING)
-        )
+        types_mapping = _get_types_mapping()
+        return arg_type in types_mapping or arg_type.lower() in types_mapping
 
 
+@_slotted()
 @dataclass
 class SwitchArgument(Argument):
     """
     Represents switch (bool) arguments.
     """
 
-    @property
-    def argparse_options(self) -> tuple[list[str], dict[str, Any]]:
+    def _build_argparse_options(self) -> tuple[list[str], dict[str, Any]]:
         """
         Generate options to parse argument.
 
@@ -172,6 +461,15 @@ class SwitchArgument(Argument):
         """
         return _str_to_bool(argument_value)
 
+    @property
+    def converters_types(self) -> list[str]:
+        """
+        List names of types that values of this argument are converted with.
+
+        :return: empty list, switch values are converted without types mapping
+        """
+        return []
+
     @staticmethod
     def matcher(arg_type: str) -> bool:
         """
@@ -183,6 +481,7 @@ class SwitchArgument(Argument):
         return arg_type.lower() == 'switch'
 
 
+@_slotted()
 @dataclass
 class PathArgument(Argument):
     """
@@ -191,14 +490,41 @@ class PathArgument(Argument):
 
     parent_path: Optional[str] = None  #: name of an argument holding parent path
 
-    def convert_value(self, argument_value: Any) -> Path:
+    def convert_value(self, argument_value: Any) -> 'Path':
         """
         Cast argument value into proper type.
 
         :param argument_value: parsed argument value
         :return: casted argument value
         """
-        return Path(argument_value)
+        return _to_path(argument_value)
+
+    @property
+    def converters_types(self) -> list[str]:
+        """
+        List names of types that values of this argument are converted with.
+
+        :return: empty list, path values are converted without types mapping
+        """
+        return []
+
+    @property
+    def dependencies(self) -> list[str]:
+        """
+        List names of arguments which values are used to post process this argument.
+
+        :return: name of parent path argument if it is set
+        """
+        return [] if self.parent_path is None else [self.parent_path]
+
+    @property
+    def has_post_processing(self) -> bool:
+        """
+        Check whether post_process can change the value, so it is worth running on an executor.
+
+        :return: True if parent path is set
+        """
+        return self.parent_path is not None
 
     @staticmethod
     def matcher(arg_type: str) -> bool:
@@ -210,7 +536,7 @@ class PathArgument(Argument):
         """
         return arg_type.lower() == 'path'
 
-    def post_process(self, argument_value: Path, arguments: dict[str, Any]) -> Path:
+    def post_process(self, argument_value: 'Path', arguments: dict[str, Any]) -> 'Path':
         """
         Prepend the path with parent path if required.
 
@@ -221,6 +547,7 @@ class PathArgument(Argument):
         :raises ValueError: if parent path is not a path
         """
         if self.parent_path is not None:
+            from pathlib import Path
             if not isinstance(parent_path_value := arguments.get(self.parent_path), Path):
                 raise ValueError(f'Parent path has to be a Path not {type(parent_path_value)}')
             return parent_path_value / argument_value
@@ -228,6 +555,7 @@ class PathArgument(Argument):
             return argument_value
 
 
+@_slotted('_post_operations_expression')
 @dataclass
 class IntArgument(Argument):
     """
@@ -236,6 +564,17 @@ class IntArgument(Argument):
 
     post_operations: Optional[str] = None  #: expression to calulate final value; {value} will be substituted
 
+    def __post_init__(self) -> None:
+        """
+        Perform post init argument processing.
+
+        Post operations are compiled here, so invalid expression raises ValueError.
+        """
+        super().__post_init__()
+        self._post_operations_expression: Optional['ArithmeticExpression'] = None
+        if self.post_operations is not None:
+            self._post_operations_expression = _compile_expression(self.post_operations)
+
     def convert_value(self, argument_value: Any) -> int:
         """
         Cast argument value into proper type.
@@ -245,6 +584,15 @@ class IntArgument(Argument):
         """
         return int(argument_value)
 
+    @property
+    def converters_types(self) -> list[str]:
+        """
+        List names of types that values of this argument are converted with.
+
+        :return: empty list, integer values are converted without types mapping
+        """
+        return []
+
     @staticmethod
     def matcher(arg_type: str) -> bool:
         """
@@ -255,76 +603,128 @@ class IntArgument(Argument):
         """
         return arg_type.lower() == 'int'
 
+    @property
+    def has_post_processing(self) -> bool:
+        """
+        Check whether post_process can change the value, so it is worth running on an executor.
+
+        :return: True if post operations are set
+        """
+        return self.post_operations is not None
+
     def post_process(self, argument_value: int, arguments: dict[str, Any]) -> int:
         """
         Evaluate the post operations to establish new argument value.
 
+        The expression is compiled once and compiled again only if post_operations has changed.
+
         :param argument_value: argument value
         :param arguments: values of all parsed arguments
         :return: new argument value
         """
-        if self.post_operations is not None:
-            return int(eval(self.post_operations.format(value=argument_value)))
-        else:
+        if self.post_operations is None or argument_value is None:
             return argument_value
+        expression = self._post_operations_expression
+        if expression is None or expression.template != self.post_operations:
+            expression = self._post_operations_expression = _compile_expression(self.post_operations)
+        return int(expression.evaluate(argument_value))
 
 
+@_slotted('items_type')
+@dataclass
 class ListArgument(Argument):
     """
     Represents argument that is a list of values of the same type.
     """
 
+    container: str = 'list'  #: type of returned value: list, iterator, array (array.array) or numpy
+    from_file: bool = False  #: if set to True the value is a path (or list of paths) of files with items
+
     _TYPE_REGEX = re.compile(r'list\[(.+)\]')
 
     def __post_init__(self) -> None:
         """
         Perform post init argument processing.
 
-        :raises ValueError: if the argument type does not match list type regex
+        :raises ValueError: if the argument type does not match list type regex or container is not supported
         """
         super().__post_init__()
         match = self._TYPE_REGEX.match(self.type)
         if match is None:
             raise ValueError(f'List type has to match regexp {self._TYPE_REGEX.pattern}. Found {self.type}.')
         self.items_type = match[1]
-
-    def parse_value(self, argument_value: Union[str, list[str]]) -> list[Any]:
+        if isinstance(self.from_file, str):  # type: ignore
+            self.from_file = _str_to_bool(self.from_file)  # type: ignore
+        if self.container not in ('list', 'iterator'):
+            if self.container not in _LIST_CONTAINERS:
+                raise ValueError(
+                    f'List container has to be one of: list, iterator, {", ".join(_LIST_CONTAINERS)}. '
+                    f'Found {self.container}.'
+                )
+            if self.items_type.lower() not in _ARRAY_TYPECODES:
+                raise ValueError(
+                    f'Container {self.container} can hold only {", ".join(_ARRAY_TYPECODES)} values. '
+                    f'Found {self.items_type}.'
+                )
+            if self.container == 'numpy' and find_spec('numpy') is None:
+                raise ValueError('Container numpy requires numpy package to be installed.')
+
+    def parse_value(self, argument_value: Union[str, list[str]]) -> Iterable[Any]:
         """
         Parse the value into list of values.
 
+        If values are read from files, returned iterator reads them line by line.
+
         :param argument_value: read value of the argument
         :return: parsed value of argument
 
         :raises TypeError: the input value is of not supported type
         """
+        if self.from_file:
+            return split_files_lines(files_paths(argument_value))
         if isinstance(argument_value, list):
             return argument_value
         elif not isinstance(argument_value, str):
             raise TypeError(
                 f'Value for list type has to be either list or string. Found {type(argument_value)}.'
             )
-        ret_val: list[str] = []
-        for value in _split_string_by_semicolon(argument_value):
-            parsed_value = shlex.split(value)
-            if len(parsed_value) == 0:
-                ret_val.append('')
-            else:
-                ret_val.append(parsed_value[0])
-        return ret_val
+        return split_list_items(argument_value)
 
-    def convert_value(self, argument_value: list[Any]) -> list[Any]:
+    def convert_value(self, argument_value: Iterable[Any]) -> Any:
         """
         Cast argument list values into proper type.
 
+        Values of built-in types are converted all at once, unless the type is overridden
+        in CUSTOM_TYPES_MAPPING. Values read from files are converted one by one as they are read.
+        Converted values are packed into the container if it is not a list.
+
         :param argument_value: parsed argument value
         :return: casted argument value
         """
-        return [
-            self.types_mapping[self.items_type](x) for x in argument_value
-        ]
+        converter = self.converters[0]
+        converted: Iterable[Any]
+        if self.container == 'iterator' or not isinstance(argument_value, list):
+            converted = map(converter, argument_value)
+        elif (bulk_converter := _BULK_CONVERTERS.get(converter)) is not None:
+            converted = bulk_converter(argument_value)
+        else:
+            converted = [converter(x) for x in argument_value]
+        if self.container == 'iterator':
+            return converted
+        if self.container == 'list':
+            return converted if isinstance(converted, list) else list(converted)
+        return _LIST_CONTAINERS[self.container](self.items_type.lower(), converted)
 
     @property
-    def argparse_options(self) -> tuple[list[str], dict[str, Any]]:
+    def converters_types(self) -> list[str]:
+        """
+        List names of types that values of this argument are converted with.
+
+        :return: list items type name
+        """
+        return [self.items_type]
+
+    def _build_argparse_options(self) -> tuple[list[str], dict[str, Any]]:
         """
         Generate options to parse argument.
 
@@ -348,6 +748,8 @@ class ListArgument(Argument):
         return arg_type.lower().startswith('list[')
 
 
+@_slotted('items_types')
+@dataclass
 class TupleArgument(Argument):
     """
     Represents argument that is a tuple of values.
@@ -383,7 +785,7 @@ class TupleArgument(Argument):
             raise TypeError(
                 f'Value for tuple type has to be either list or string. Found {type(argument_value)}.'
             )
-        ret_val = shlex.split(argument_value)
+        ret_val = split_shell_words(argument_value)
         if len(ret_val) == 0:
             return ['']
         expected_number = len(self.items_types)
@@ -402,13 +804,20 @@ class TupleArgument(Argument):
         :param argument_value: parsed argument value
         :return: casted argument value
         """
-        converters = [self.types_mapping[x] for x in self.items_types]
         return [
-            conv(value) for conv, value in zip(converters, argument_value)
+            conv(value) for conv, value in zip(self.converters, argument_value)
         ]
 
     @property
-    def argparse_options(self) -> tuple[list[str], dict[str, Any]]:
+    def converters_types(self) -> list[str]:
+        """
+        List names of types that values of this argument are converted with.
+
+        :return: tuple items types names
+        """
+        return self.items_types
+
+    def _build_argparse_options(self) -> tuple[list[str], dict[str, Any]]:
         """
         Generate options to parse argument.
 
@@ -432,18 +841,24 @@ class TupleArgument(Argument):
         return arg_type.lower().startswith('tuple[')
 
 
+@_slotted('tuple_argument')
+@dataclass
 class ListOfTuplesArgument(Argument):
     """
     Represents argument that is a list of tuples.
     """
 
+    container: str = 'list'  #: type of returned value: list, iterator, columns or numpy_columns
+    from_file: bool = False  #: if set to True the value is a path (or list of paths) of files with tuples
+
     _TYPE_REGEX = re.compile(r'list\[(tuple\[(.+)\])\]')
 
     def __post_init__(self) -> None:
         """
         Perform post init argument processing.
 
-        :raises ValueError: if the argument type does not match list of tuples type regex
+        :raises ValueError: if the argument type does not match list of tuples type regex or container
+            is not supported
         """
         super().__post_init__()
         match = self._TYPE_REGEX.match(self.type)
@@ -451,52 +866,144 @@ class ListOfTuplesArgument(Argument):
             raise ValueError(
                 f'List of tuples type has to match regexp {self._TYPE_REGEX.pattern}. Found {self.type}.'
             )
-        definition = asdict(self)
-        definition['type'] = match[1]
-        self.tuple_argument = TupleArgument(**definition)
+        if isinstance(self.from_file, str):  # type: ignore
+            self.from_file = _str_to_bool(self.from_file)  # type: ignore
+        if self.container not in ('list', 'iterator', *_COLUMNS_CONTAINERS):
+            raise ValueError(
+                'List of tuples container has to be one of: list, iterator, '
+                f'{", ".join(_COLUMNS_CONTAINERS)}. Found {self.container}.'
+            )
+        if self.container == 'numpy_columns' and find_spec('numpy') is None:
+            raise ValueError('Container numpy_columns requires numpy package to be installed.')
+        self.tuple_argument = TupleArgument(
+            self.name, match[1], self.description, self.cli_arg, self.required, self.env_var,
+            self.default_value,
+        )
 
-    def parse_value(self, argument_value: Union[str, Union[list[list[Any]], str]]) -> list[list[Any]]:
+    def parse_value(self, argument_value: Union[str, Union[list[list[Any]], str]]) -> Iterable[list[Any]]:
         """
         Parse the value into list of list of values.
 
+        If values are read from files, returned iterator reads them line by line, one tuple per line.
+        Rows with wrong number of values raise RuntimeError reporting index of the row.
+
         :param argument_value: read value of the argument
         :return: parsed value of argument
 
         :raises TypeError: input value is of not supported type
         """
+        if self.from_file:
+            return self._parse_lines(split_files_lines(files_paths(argument_value)))
         if isinstance(argument_value, list):
             return argument_value
         elif not isinstance(argument_value, str):
             raise TypeError(
                 f'Value for list of tuples has to be either list or string. Found {type(argument_value)}.'
             )
-        ret_val: list[list[Any]] = []
-        for value in _split_string_by_semicolon(argument_value):
-            ret_val.append(self.tuple_argument.parse_value(value))
+        ret_val = split_records(argument_value)
+        if set(map(len, ret_val)) - {len(self.tuple_argument.items_types)}:
+            for index, row in enumerate(ret_val):
+                self._check_arity(index, row)
         return ret_val
 
-    def convert_value(self, argument_value: list[list[Any]]) -> list[list[Any]]:
+    def convert_value(self, argument_value: Iterable[list[Any]]) -> Iterable[Any]:
         """
         Cast tuples' items into proper types.
 
+        With columns containers values are converted straight into columns, one per tuple position.
+
         :param argument_value: parsed argument value
         :return: casted argument value
         """
-        return [self.tuple_argument.convert_value(item_value) for item_value in argument_value]
+        if self.container in _COLUMNS_CONTAINERS:
+            return self._convert_to_columns(argument_value)
+        converters = self.tuple_argument.converters
+        if self.container == 'iterator' or not isinstance(argument_value, list):
+            converted = map(lambda row: [conv(value) for conv, value in zip(converters, row)], argument_value)
+            return converted if self.container == 'iterator' else list(converted)
+        if set(map(len, argument_value)) == {len(converters)}:
+            # All rows are complete, so values are converted column by column and zipped back into rows
+            return list(map(list, zip(*map(map, converters, zip(*argument_value)))))
+        return [[conv(value) for conv, value in zip(converters, row)] for row in argument_value]
+
+    def _convert_to_columns(self, argument_value: Iterable[list[Any]]) -> list[Any]:
+        converters = self.tuple_argument.converters
+        items_types = [x.lower() for x in self.tuple_argument.items_types]
+        pack = _LIST_CONTAINERS[_COLUMNS_CONTAINERS[self.container]]
+        if isinstance(argument_value, list) and set(map(len, argument_value)) <= {len(converters)}:
+            # All rows are complete, so whole columns are converted at once
+            values = zip(*argument_value) if argument_value else [()] * len(converters)
+            return [
+                pack(items_type, map(conv, column))
+                if items_type in _ARRAY_TYPECODES else list(map(conv, column))
+                for conv, items_type, column in zip(converters, items_types, values)
+            ]
+        columns = self._read_columns(argument_value, converters, items_types)
+        if self.container == 'columns':
+            return columns
+        return [
+            pack(items_type, column) if items_type in _ARRAY_TYPECODES else column
+            for items_type, column in zip(items_types, columns)
+        ]
+
+    def _read_columns(
+        self, rows: Iterable[list[Any]], converters: list[Callable[[Any], Any]], items_types: list[str]
+    ) -> list[Any]:
+        # Rows are consumed one by one, int and bool values are stored in arrays right away.
+        # Empty rows (e.g. between ;;) are skipped, so all columns keep the same length.
+        from array import array
+        columns: list[Any] = [
+            array(_ARRAY_TYPECODES[items_type]) if items_type in _ARRAY_TYPECODES else []
+            for items_type in items_types
+        ]
+        appends = [column.append for column in columns]
+        for index, row in enumerate(rows):
+            if len(row) != len(converters):
+                if not row or row == ['']:
+                    continue
+                self._raise_arity_error(index, row)
+            for append, conv, value in zip(appends, converters, row):
+                append(conv(value))
+        return columns
+
+    def _parse_lines(self, lines: Iterable[str]) -> Iterator[list[str]]:
+        for index, line in enumerate(lines):
+            row = split_shell_words(line) or ['']
+            self._check_arity(index, row)
+            yield row
+
+    def _check_arity(self, index: int, row: list[str]) -> None:
+        if len(row) != len(self.tuple_argument.items_types) and row != ['']:
+            self._raise_arity_error(index, row)
+
+    def _raise_arity_error(self, index: int, row: list[Any]) -> None:
+        raise RuntimeError(
+            f'List of tuples {self.name} expected {len(self.tuple_argument.items_types)} values in every row '
+            f'and got {len(row)} in row {index}: {row}.'
+        )
 
     @property
-    def argparse_options(self) -> tuple[list[str], dict[str, Any]]:
+    def converters_types(self) -> list[str]:
+        """
+        List names of types that values of this argument are converted with.
+
+        :return: tuples items types names
+        """
+        return self.tuple_argument.converters_types
+
+    def _build_argparse_options(self) -> tuple[list[str], dict[str, Any]]:
         """
         Generate options to parse argument.
 
         :return: args and kwargs that can be used in argparse.ArgumentParser.add_argument
         """
         args = [self.cli_arg]
-        kwargs = {
+        kwargs: dict[str, Any] = {
             'dest': self.name,
-            'nargs': len(self.tuple_argument.items_types),
             'action': 'append',
         }
+        if not self.from_file:
+            kwargs['nargs'] = len(self.tuple_argument.items_types)
         return (args, kwargs)
 
     @staticmethod
@@ -510,10 +1017,102 @@ class ListOfTuplesArgument(Argument):
         return arg_type.lower().startswith('list[tuple[')
 
 
+class _VersionedList(list[Type[Argument]]):
+    """
+    List that counts its modifications, so views built from it can be cached.
+    """
+
+    version = 0  #: bumped on every modification of the list
+
+    def __setitem__(self, *args: Any) -> None:
+        super().__setitem__(*args)
+        self.version += 1
+
+    def __delitem__(self, *args: Any) -> None:
+        super().__delitem__(*args)
+        self.version += 1
+
+    def __iadd__(self, other: Any) -> '_VersionedList':  # type: ignore[override,misc]
+        self.extend(other)
+        return self
+
+    def __imul__(self, other: Any) -> '_VersionedList':  # type: ignore[misc]
+        super().__imul__(other)
+        self.version += 1
+        return self
+
+    def append(self, *args: Any) -> None:
+        super().append(*args)
+        self.version += 1
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+    def extend(self, *args: Any) -> None:
+        super().extend(*args)
+        self.version += 1
+
+    def insert(self, *args: Any) -> None:
+        super().insert(*args)
+        self.version += 1
+
+    def pop(self, *args: Any) -> Type[Argument]:
+        ret_val = super().pop(*args)
+        self.version += 1
+        return ret_val
+
+    def remove(self, *args: Any) -> None:
+        super().remove(*args)
+        self.version += 1
+
+    def reverse(self) -> None:
+        super().reverse()
+        self.version += 1
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self.version += 1
+
+
 _BUILT_IN_ARGUMENTS_TYPES: list[Type[Argument]] = [
     ListOfTuplesArgument, ListArgument, TupleArgument, SwitchArgument, PathArgument, IntArgument, Argument
 ]
-CUSTOM_ARGUMENTS_TYPES: list[Type[Argument]] = []
+CUSTOM_ARGUMENTS_TYPES = _VersionedList()  #: Argument classes checked before built-in ones
+
+_BUILT_IN_ARGUMENTS_TYPES_INDEX: dict[str, list[Type[Argument]]] = {
+    'list': [ListOfTuplesArgument, ListArgument, Argument],
+    'tuple': [TupleArgument, Argument],
+    'switch': [SwitchArgument, Argument],
+    'path': [PathArgument, Argument],
+    'int': [IntArgument, Argument],
+}  #: Map: outer type constructor -> built-in classes that may match it (others can match only Argument)
+_argument_classes: dict[str, Optional[Type[Argument]]] = {}
+_argument_classes_version = (-1, -1)
+
+
+def _find_argument_class(arg_type: str) -> Optional[Type[Argument]]:
+    """
+    Find argument class handling given type.
+
+    Results are cached per type string until custom types or custom arguments types change.
+
+    :param arg_type: argument type string
+    :return: found class or None, if no class supports the type
+    """
+    global _argument_classes_version
+    version = (CUSTOM_ARGUMENTS_TYPES.version, CUSTOM_TYPES_MAPPING.version)
+    if version != _argument_classes_version:
+        _argument_classes.clear()
+        _argument_classes_version = version
+    if arg_type in _argument_classes:
+        return _argument_classes[arg_type]
+    candidates = _BUILT_IN_ARGUMENTS_TYPES_INDEX.get(parse_type(arg_type).constructor, [Argument])
+    argument_class = next(
+        (x for x in chain(CUSTOM_ARGUMENTS_TYPES, candidates) if x.matcher(arg_type)), None
+    )
+    _argument_classes[arg_type] = argument_class
+    return argument_class
 
 
 def argument_factory(name: str, definition: dict[str, Any]) -> Argument:
@@ -526,7 +1125,6 @@ def argument_factory(name: str, definition: dict[str, Any]) -> Argument:
     :param definition: definition of created argument
     :return: created argument
     """
-    for argument_class in chain(CUSTOM_ARGUMENTS_TYPES, _BUILT_IN_ARGUMENTS_TYPES):
-        if argument_class.matcher(definition['type']):
-            return argument_class(name=name, **definition)
-    raise ValueError(f'Unknown argument type: {definition["type"]}')
+    if (argument_class := _find_argument_class(definition['type'])) is None:
+        raise ValueError(f'Unknown argument type: {definition["type"]}')
+    return argument_class(name=name, **definition)
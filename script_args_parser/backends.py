@@ -0,0 +1,167 @@
+"""
+Defines backends used to load toml and yaml files.
+"""
+import logging
+import os
+from importlib import import_module
+from typing import Any, Callable, IO, Optional, Union
+
+
+_LOGGER = logging.getLogger(__name__)
+
+YamlInput = Union[str, bytes, IO[str], IO[bytes]]
+
+
+def _tomllib_loads(content: str) -> dict[str, Any]:
+    ret_val: dict[str, Any] = import_module('tomllib').loads(content)
+    return ret_val
+
+
+def _tomli_loads(content: str) -> dict[str, Any]:
+    ret_val: dict[str, Any] = import_module('tomli').loads(content)
+    return ret_val
+
+
+def _rtoml_loads(content: str) -> dict[str, Any]:
+    ret_val: dict[str, Any] = import_module('rtoml').loads(content)
+    return ret_val
+
+
+def _toml_loads(content: str) -> dict[str, Any]:
+    ret_val: dict[str, Any] = import_module('toml').loads(content)
+    return ret_val
+
+
+def _libyaml_load(content: YamlInput) -> Any:
+    yaml = import_module('yaml')
+    return yaml.load(content, Loader=yaml.CSafeLoader)
+
+
+def _pyyaml_load(content: YamlInput) -> Any:
+    yaml = import_module('yaml')
+    return yaml.load(content, Loader=yaml.SafeLoader)
+
+
+TOML_BACKENDS: dict[str, tuple[str, Callable[[str], dict[str, Any]]]] = {
+    'tomllib': ('tomllib', _tomllib_loads),
+    'rtoml': ('rtoml', _rtoml_loads),
+    'tomli': ('tomli', _tomli_loads),
+    'toml': ('toml', _toml_loads),
+}  #: Map: toml backend name -> (required module, loader)
+
+YAML_BACKENDS: dict[str, tuple[str, Callable[[YamlInput], Any]]] = {
+    'libyaml': ('yaml.CSafeLoader', _libyaml_load),
+    'pyyaml': ('yaml.SafeLoader', _pyyaml_load),
+}  #: Map: yaml backend name -> (required module attribute, loader)
+
+_DEFAULT_TOML_BACKENDS = ['tomllib', 'toml']
+_DEFAULT_YAML_BACKENDS = ['libyaml', 'pyyaml']
+
+_preferred_backends: dict[str, Optional[str]] = {'toml': None, 'yaml': None}
+_resolved_backends: dict[str, str] = {}
+
+
+def set_toml_backend(name: Optional[str]) -> None:
+    """
+    Choose backend used to load toml files.
+
+    If chosen backend is not installed, the default one is used.
+
+    :param name: one of TOML_BACKENDS keys, None restores the default (tomllib if available, else toml)
+
+    :raises ValueError: when the backend is not known
+    """
+    if name is not None and name not in TOML_BACKENDS:
+        raise ValueError(f'Unknown toml backend: {name}. Available: {", ".join(TOML_BACKENDS)}.')
+    _preferred_backends['toml'] = name
+    _resolved_backends.pop('toml', None)
+
+
+def set_yaml_backend(name: Optional[str]) -> None:
+    """
+    Choose backend used to load yaml files.
+
+    If chosen backend is not installed, the default one is used.
+
+    :param name: one of YAML_BACKENDS keys, None restores the default (libyaml if available, else pyyaml)
+
+    :raises ValueError: when the backend is not known
+    """
+    if name is not None and name not in YAML_BACKENDS:
+        raise ValueError(f'Unknown yaml backend: {name}. Available: {", ".join(YAML_BACKENDS)}.')
+    _preferred_backends['yaml'] = name
+    _resolved_backends.pop('yaml', None)
+
+
+def toml_backend() -> str:
+    """
+    Return name of backend used to load toml files.
+
+    :return: one of TOML_BACKENDS keys
+    """
+    return _resolve_backend('toml', TOML_BACKENDS, _DEFAULT_TOML_BACKENDS)
+
+
+def yaml_backend() -> str:
+    """
+    Return name of backend used to load yaml files.
+
+    :return: one of YAML_BACKENDS keys
+    """
+    return _resolve_backend('yaml', YAML_BACKENDS, _DEFAULT_YAML_BACKENDS)
+
+
+def load_toml(content: str) -> dict[str, Any]:
+    """
+    Load toml document with the chosen backend.
+
+    :param content: toml document
+    :return: loaded document
+    """
+    return TOML_BACKENDS[toml_backend()][1](content)
+
+
+def load_yaml(content: YamlInput) -> Any:
+    """
+    Load yaml document with the chosen backend.
+
+    :param content: yaml document or stream with it
+    :return: loaded document
+    """
+    return YAML_BACKENDS[yaml_backend()][1](content)
+
+
+def load_yaml_file(path: Union[str, os.PathLike[str]]) -> Any:
+    """
+    Load yaml file with the chosen backend.
+
+    The file is opened in binary mode and the loader reads it in chunks, so the whole content is never held
+    in memory as str or bytes (encoding is detected by the loader, as in yaml specification).
+
+    :param path: path to the yaml file
+    :return: loaded document
+    """
+    with open(path, 'rb') as yaml_file:
+        return load_yaml(yaml_file)
+
+
+def _is_available(requirement: str) -> bool:
+    module_name, _, attribute = requirement.partition('.')
+    try:
+        module = import_module(module_name)
+    except ImportError:
+        return False
+    return not attribute or hasattr(module, attribute)
+
+
+def _resolve_backend(kind: str, backends: dict[str, Any], defaults: list[str]) -> str:
+    if (resolved := _resolved_backends.get(kind)) is not None:
+        return resolved
+    preferred = _preferred_backends[kind]
+    candidates = defaults if preferred is None else [preferred, *defaults]
+    for candidate in candidates:
+        if _is_available(backends[candidate][0]):
+            break
+        _LOGGER.debug('The %s backend %s is not available', kind, candidate)
+    _resolved_backends[kind] = candidate
+    return candidate
@@ -0,0 +1,98 @@
+"""
+Defines helpers of parsing many sets of values against one schema.
+"""
+from argparse import ArgumentError, ArgumentParser
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, NoReturn, Optional, TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from script_args_parser.parser import ArgumentsSchema
+
+
+BatchItem = tuple[Optional[list[str]], Optional[dict[str, Any]]]  #: cli parameters and user values
+
+
+@dataclass
+class BatchResult:
+    """
+    Result of parsing a single item of a batch.
+    """
+
+    values: Optional[dict[str, Any]] = None  #: values of arguments, None when parsing failed
+    error: Optional[BaseException] = None  #: error raised when parsing the item, None when parsed
+
+
+def parse_chunk(
+    schema: 'ArgumentsSchema', items: Iterable[BatchItem], env: Optional[Mapping[str, str]] = None
+) -> list[BatchResult]:
+    """
+    Parse items one by one, storing errors in results of failing items.
+
+    Invalid cli parameters raise argparse.ArgumentError, so argparse does not print usage and errors
+    of every failing item to stderr. Module level function, so it can be sent to worker processes.
+
+    :param schema: schema of arguments, shared by all items
+    :param items: pairs of cli parameters and user values, None cli parameters mean no parameters
+    :param env: environment variables, if not given os.environ is used
+    :return: results in the order of items
+    """
+    from script_args_parser.parser import ArgumentsParser
+    batch_schema = _without_exiting(schema)
+    results = []
+    for cli_params, user_values in items:
+        try:
+            values = ArgumentsParser(batch_schema, cli_params or [], user_values, env).arguments_values
+        except (Exception, SystemExit) as error:  # argparse still exits after printing help for -h
+            results.append(BatchResult(error=error))
+        else:
+            results.append(BatchResult(values))
+    return results
+
+
+def split_into_chunks(items: Iterable[BatchItem], chunk_size: int) -> Iterator[list[BatchItem]]:
+    """
+    Split items into lists of given size (the last one may be shorter).
+
+    :param items: items to be split
+    :param chunk_size: number of items in a chunk
+    :yield: consecutive chunks
+    """
+    iterator = iter(items)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+class _RaisingArgumentParser(ArgumentParser):
+    """
+    Cli parser raising errors instead of printing usage and exiting.
+    """
+
+    def error(self, message: str) -> NoReturn:
+        """
+        Raise error of parsing cli parameters.
+
+        :param message: error message
+
+        :raises ArgumentError: always
+        """
+        raise ArgumentError(None, message)
+
+
+def _without_exiting(schema: 'ArgumentsSchema') -> 'ArgumentsSchema':
+    """
+    Create a shallow copy of schema which cli parser raises errors instead of exiting.
+
+    The raising cli parser is created once and stored in the schema, so it is reused by all chunks.
+
+    :param schema: schema of arguments
+    :return: schema sharing arguments with given one
+    """
+    if schema._batch_cli_parser is None:
+        schema._batch_cli_parser = schema._create_cli_parser(_RaisingArgumentParser)
+    batch_schema = object.__new__(type(schema))
+    batch_schema.__dict__.update(schema.__dict__)
+    batch_schema._cli_parser = schema._batch_cli_parser
+    return batch_schema
@@ -0,0 +1,123 @@
+"""
+Defines persistent cache of arguments read from definition files.
+"""
+import hashlib
+import logging
+import os
+import pickle
+import sys
+from functools import lru_cache
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, Callable, Optional, Union
+
+from script_args_parser.arguments import Argument, CUSTOM_ARGUMENTS_TYPES, CUSTOM_TYPES_MAPPING
+
+
+_LOGGER = logging.getLogger(__name__)
+_CACHE_FORMAT_VERSION = 4
+
+
+def default_cache_dir() -> Path:
+    """
+    Find user cache directory for the library.
+
+    :return: path to the cache directory (may not exist yet)
+    """
+    if sys.platform == 'win32':
+        base_dir = Path(os.getenv('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local')
+    elif sys.platform == 'darwin':
+        base_dir = Path.home() / 'Library' / 'Caches'
+    else:
+        base_dir = Path(os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache')
+    return base_dir / 'script_args_parser'
+
+
+@lru_cache(maxsize=None)
+def _package_version() -> Optional[str]:
+    """
+    Find installed version of the library, so entries are not reused after an upgrade.
+
+    :return: version of installed package or None if it is used without installing
+    """
+    from importlib.metadata import PackageNotFoundError, version
+    try:
+        return version('script-args-parser')
+    except PackageNotFoundError:
+        return None
+
+
+class DefinitionsCache:
+    """
+    Stores arguments built from definition files, so the files do not have to be parsed again.
+
+    Arguments are stored with pickle, so the cache directory shall be writable only by its owner.
+    Cache entry is used only if size, modification time and content hash of the definition file
+    did not change, the same version of the library is used and the same custom argument types
+    and custom types are registered.
+
+    :param cache_dir: directory for cache files, if not given user cache directory is used
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None) -> None:
+        self.cache_dir = default_cache_dir() if cache_dir is None else Path(cache_dir)
+
+    def get_arguments(
+        self, arguments_file: Path, arguments_factory: Callable[[str], list[Argument]]
+    ) -> list[Argument]:
+        """
+        Return arguments for given definition file, building and storing them when not cached.
+
+        :param arguments_file: file with arguments definition
+        :param arguments_factory: creates arguments from the content of definition file
+        :return: arguments defined in the file
+        """
+        content = arguments_file.read_bytes()
+        stat = arguments_file.stat()
+        key = {
+            'format': _CACHE_FORMAT_VERSION,
+            'version': _package_version(),
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+            'hash': hashlib.sha256(content).hexdigest(),
+            'custom_types': [f'{x.__module__}.{x.__qualname__}' for x in CUSTOM_ARGUMENTS_TYPES],
+            'custom_types_names': sorted(CUSTOM_TYPES_MAPPING),
+        }
+        entry_path = self._entry_path(arguments_file)
+        if (arguments := self._load(entry_path, key)) is not None:
+            return arguments
+        arguments = arguments_factory(content.decode('utf-8'))
+        self._store(entry_path, key, arguments)
+        return arguments
+
+    def _entry_path(self, arguments_file: Path) -> Path:
+        file_id = hashlib.sha256(str(arguments_file.resolve()).encode()).hexdigest()
+        return self.cache_dir / f'{file_id}.pickle'
+
+    @staticmethod
+    def _load(entry_path: Path, key: dict[str, Any]) -> Optional[list[Argument]]:
+        try:
+            with entry_path.open('rb') as entry_file:
+                entry = pickle.load(entry_file)
+        except FileNotFoundError:
+            return None
+        except Exception:  # corrupted or outdated entries are rebuilt
+            _LOGGER.debug('Cannot load definitions cache entry %s', entry_path, exc_info=True)
+            return None
+        if not isinstance(entry, dict) or entry.get('key') != key:
+            return None
+        arguments: list[Argument] = entry['arguments']
+        return arguments
+
+    def _store(self, entry_path: Path, key: dict[str, Any], arguments: list[Argument]) -> None:
+        temp_path: Optional[str] = None
+        try:
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            with NamedTemporaryFile('wb', dir=self.cache_dir, delete=False) as entry_file:
+                temp_path = entry_file.name
+                pickle.dump({'key': key, 'arguments': arguments}, entry_file, pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, entry_path)
+        except Exception:  # cache is an optimization, failing to write it is not an error
+            _LOGGER.debug('Cannot store definitions cache entry %s', entry_path, exc_info=True)
+            if temp_path is not None:
+                Path(temp_path).unlink(missing_ok=True)
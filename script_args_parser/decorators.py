@@ -1,23 +1,92 @@
 """
 Decorators that helps defining argument types.
 """
-from typing import Any, Type, Union
+from functools import partial
+from inspect import iscoroutinefunction
+from typing import Any, Callable, Optional, overload, Type, TypeVar, Union
 
 from script_args_parser.arguments import CUSTOM_TYPES_MAPPING
 
 
+_PARALLEL_ATTRIBUTE = '__script_args_parser_parallel__'
+
+ConverterT = TypeVar('ConverterT', bound=Callable[[Any], Any])
+
+
+def parallel_converter(converter: ConverterT) -> ConverterT:
+    """
+    Mark converter as pure (or at least thread-safe), so it can be run concurrently with other converters.
+
+    Values of arguments which converters are marked (or built-in, with at least one marked) are converted
+    on the executor given to the parser.
+    To be run on a process pool, the converter has to be registered also in worker processes
+    (e.g. registered on import of a module or inherited by forked workers).
+
+    :param converter: converter to be marked
+    :return: the same converter
+    """
+    setattr(converter, _PARALLEL_ATTRIBUTE, True)
+    return converter
+
+
+def is_parallel_converter(converter: Callable[[Any], Any]) -> bool:
+    """
+    Check if converter was marked with parallel_converter.
+
+    :param converter: converter to be checked
+    :return: True if converter can be run concurrently
+    """
+    return getattr(converter, _PARALLEL_ATTRIBUTE, False) is True
+
+
+@overload
 def dataclass_argument(decorated: Type[Any]) -> Type[Any]:
+    ...
+
+
+@overload
+def dataclass_argument(*, parallel: bool = False) -> Callable[[Type[Any]], Type[Any]]:
+    ...
+
+
+def dataclass_argument(
+    decorated: Optional[Type[Any]] = None, *, parallel: bool = False
+) -> Union[Type[Any], Callable[[Type[Any]], Type[Any]]]:
     """
     Register decorated dataclass as supported argument type.
 
+    If the dataclass defines `async def async_post_init(self)`, it is awaited after creating the instance.
+    Such types can be used only when parsing asynchronously (e.g. with ArgumentsParser.from_files_async).
+
+    Can be used with parameters, e.g. `@dataclass_argument(parallel=True)`.
+
     :param decorated: dataclass to be registered
+    :param parallel: if True, instances are created with parallel converter (see parallel_converter),
+                     ignored for dataclasses defining async_post_init
 
-    :return: decorated class, but a little bit modified
+    :return: decorated class, but a little bit modified (or decorator if the class was not given)
     """
+    if decorated is None:
+        return partial(_register_dataclass, parallel=parallel)
+    return _register_dataclass(decorated, parallel)
+
+
+def _register_dataclass(decorated: Type[Any], parallel: bool) -> Type[Any]:
     def argument_factory(definition: Union[dict[str, Any], list[Any]]) -> Any:
         if isinstance(definition, dict):
             return decorated(**definition)
         if isinstance(definition, list):
             return decorated(*definition)
-    CUSTOM_TYPES_MAPPING[decorated.__name__] = argument_factory
+
+    async def async_argument_factory(definition: Union[dict[str, Any], list[Any]]) -> Any:
+        instance = argument_factory(definition)
+        await instance.async_post_init()
+        return instance
+
+    if iscoroutinefunction(getattr(decorated, 'async_post_init', None)):
+        CUSTOM_TYPES_MAPPING[decorated.__name__] = async_argument_factory
+    elif parallel:
+        CUSTOM_TYPES_MAPPING[decorated.__name__] = parallel_converter(argument_factory)
+    else:
+        CUSTOM_TYPES_MAPPING[decorated.__name__] = argument_factory
     return decorated
@@ -0,0 +1,54 @@
+"""
+Defines graph of references between arguments.
+"""
+from script_args_parser.arguments import Argument
+
+
+class DependencyGraph:
+    """
+    Graph of references between arguments (e.g. parent_path), sorted topologically.
+
+    Arguments are split into levels: each argument depends only on arguments from previous levels,
+    so arguments from the same level can be processed independently. Within a level arguments
+    keep the order of definition. References to not defined arguments are ignored.
+
+    :param arguments: arguments which references are analysed
+
+    :raises ValueError: when arguments reference each other in a cycle
+    """
+
+    def __init__(self, arguments: list[Argument]) -> None:
+        names = {argument.name for argument in arguments}
+        self.dependencies: dict[str, list[str]] = {
+            argument.name: [x for x in argument.dependencies if x in names] for argument in arguments
+        }  #: Map: argument name -> names of arguments it depends on
+        self.levels: list[list[str]] = []  #: names of arguments in groups processed one after another
+        dependents: dict[str, list[str]] = {name: [] for name in self.dependencies}
+        missing_count: dict[str, int] = {}
+        for name, dependencies in self.dependencies.items():
+            missing_count[name] = len(dependencies)
+            for dependency in dependencies:
+                dependents[dependency].append(name)
+        order = {name: i for i, name in enumerate(self.dependencies)}
+        level = [name for name, count in missing_count.items() if count == 0]
+        while level:
+            self.levels.append(level)
+            next_level: list[str] = []
+            for name in level:
+                for dependent in dependents[name]:
+                    missing_count[dependent] -= 1
+                    if missing_count[dependent] == 0:
+                        next_level.append(dependent)
+            level = sorted(next_level, key=order.__getitem__)
+        if len(self.order) != len(self.dependencies):
+            not_sorted = [name for name, count in missing_count.items() if count > 0]
+            raise ValueError(f'Arguments reference each other in a cycle, check: {", ".join(not_sorted)}.')
+
+    @property
+    def order(self) -> list[str]:
+        """
+        List names of all arguments in order in which they can be processed.
+
+        :return: arguments names
+        """
+        return [name for level in self.levels for name in level]
@@ -0,0 +1,95 @@
+"""
+Defines restricted arithmetic expressions used to post process argument values.
+"""
+import ast
+from typing import Any, Callable
+
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Constant, ast.Load,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow, ast.UAdd, ast.USub,
+)
+_FUNCTIONS: dict[str, Callable[..., Any]] = {
+    'abs': abs,
+    'int': int,
+    'max': max,
+    'min': min,
+    'round': round,
+}  #: Functions that can be called in expressions
+_VARIABLE_NAME = 'value'
+_MAX_EXPONENT = 100  #: Exponents are limited, so evaluation of the expression cannot hang
+
+
+class ArithmeticExpression:
+    """
+    Arithmetic expression validated and compiled once, then evaluated for many values.
+
+    Expression can use numbers, arithmetic operators, parentheses, the value (given as `{value}`)
+    and functions: abs, int, max, min, round. Exponent of `**` has to be a number not greater than 100
+    (in absolute value) and its base cannot contain other `**`.
+
+    :param template: expression with `{value}` token, e.g. `({value} + 3) * 10`
+
+    :raises ValueError: when the expression is not a valid arithmetic expression
+    """
+
+    def __init__(self, template: str) -> None:
+        self.template = template
+        try:
+            tree = ast.parse(template.format(value=_VARIABLE_NAME).strip(), mode='eval')
+        except (SyntaxError, KeyError, IndexError, ValueError) as ex:
+            raise ValueError(f'Invalid expression "{template}": {ex}') from ex
+        for node in ast.walk(tree):
+            self._validate_node(node)
+        self._code = compile(tree, f'<expression {template}>', 'eval')
+        self._globals: dict[str, Any] = {'__builtins__': {}, **_FUNCTIONS}
+
+    def __reduce__(self) -> tuple[type['ArithmeticExpression'], tuple[str]]:
+        """
+        Pickle the expression as its template, because compiled code cannot be pickled.
+
+        :return: class and arguments needed to create the expression again
+        """
+        return (ArithmeticExpression, (self.template,))
+
+    def evaluate(self, value: Any) -> Any:
+        """
+        Evaluate the expression for given value.
+
+        :param value: value substituted for `{value}` token
+        :return: result of the expression
+        """
+        return eval(self._code, self._globals, {_VARIABLE_NAME: value})
+
+    def _validate_node(self, node: ast.AST) -> None:
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f'Invalid expression "{self.template}": {type(node).__name__} is not allowed.')
+        if isinstance(node, ast.Constant) and (
+            isinstance(node.value, bool) or not isinstance(node.value, (int, float))
+        ):
+            raise ValueError(f'Invalid expression "{self.template}": only numbers are allowed.')
+        if isinstance(node, ast.Name) and node.id != _VARIABLE_NAME and node.id not in _FUNCTIONS:
+            raise ValueError(f'Invalid expression "{self.template}": unknown name {node.id}.')
+        if isinstance(node, ast.Call) and (
+            not isinstance(node.func, ast.Name) or node.func.id not in _FUNCTIONS or node.keywords
+        ):
+            raise ValueError(
+                f'Invalid expression "{self.template}": only {", ".join(_FUNCTIONS)} can be called.'
+            )
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+            self._validate_power(node)
+
+    def _validate_power(self, node: ast.BinOp) -> None:
+        exponent = node.right
+        if isinstance(exponent, ast.UnaryOp) and isinstance(exponent.op, (ast.UAdd, ast.USub)):
+            exponent = exponent.operand
+        if (
+            not isinstance(exponent, ast.Constant)
+            or not isinstance(exponent.value, (int, float))
+            or abs(exponent.value) > _MAX_EXPONENT
+            or any(isinstance(x, ast.Pow) for x in ast.walk(node.left))
+        ):
+            raise ValueError(
+                f'Invalid expression "{self.template}": exponent has to be a number not greater than '
+                f'{_MAX_EXPONENT} and base cannot contain other power.'
+            )
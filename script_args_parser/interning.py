@@ -0,0 +1,202 @@
+"""
+Defines sharing of arguments created from identical definitions.
+"""
+from collections.abc import Hashable, Iterable
+from dataclasses import fields, FrozenInstanceError
+from typing import Any, Type
+
+from script_args_parser.arguments import (
+    Argument,
+    argument_factory,
+    CUSTOM_ARGUMENTS_TYPES,
+    CUSTOM_TYPES_MAPPING,
+)
+
+
+class ArgumentsInterner:
+    """
+    Shares arguments between schemas created from identical definitions.
+
+    Identical pairs of name and definition (e.g. common logging or credentials blocks of many definition
+    files) resolve to one argument, so it is created once and kept in memory once. Interned arguments
+    are frozen: setting their fields raises dataclasses.FrozenInstanceError, so changing an argument
+    of one schema cannot change other schemas. Type strings of arguments are parsed into shared type
+    descriptors (see type_descriptors.parse_type) anyway.
+
+    Interned arguments are kept until the interner is cleared or removed, or until custom types
+    or custom arguments types change.
+    """
+
+    def __init__(self) -> None:
+        self._arguments: dict[Hashable, Argument] = {}
+        self._version = (CUSTOM_ARGUMENTS_TYPES.version, CUSTOM_TYPES_MAPPING.version)
+
+    def __len__(self) -> int:
+        """
+        Count interned arguments.
+
+        :return: number of distinct arguments
+        """
+        self._check_version()
+        return len({id(x) for x in self._arguments.values()})
+
+    def get_argument(self, name: str, definition: dict[str, Any]) -> Argument:
+        """
+        Return argument for given definition, creating it only if identical one was not created before.
+
+        :param name: name of the argument
+        :param definition: definition of the argument
+        :return: shared argument
+        """
+        self._check_version()
+        return self._get_argument(name, definition)
+
+    def get_arguments(self, definitions: dict[str, dict[str, Any]]) -> list[Argument]:
+        """
+        Return arguments for definitions read from a file.
+
+        :param definitions: map: argument name -> definition
+        :return: shared arguments in order of definitions
+        """
+        self._check_version()
+        return [self._get_argument(name, definition) for name, definition in definitions.items()]
+
+    def intern(self, argument: Argument) -> Argument:
+        """
+        Return shared argument equal to the given one, e.g. loaded from DefinitionsCache.
+
+        The given argument is frozen when it is interned for the first time.
+
+        :param argument: argument to be interned
+        :return: previously interned equal argument or the given one
+        """
+        self._check_version()
+        argument_class = _unfrozen_class(type(argument))
+        values = tuple([getattr(argument, name) for name in _fields_names(argument_class)])
+        key: Hashable = (argument_class, values, tuple([type(value) for value in values]))
+        try:
+            interned = self._arguments.setdefault(key, argument)
+        except TypeError:
+            try:
+                key = (argument_class, _freeze(values))
+            except TypeError:
+                return argument
+            interned = self._arguments.setdefault(key, argument)
+        if interned is argument:
+            _freeze_argument(argument)
+        return interned
+
+    def intern_all(self, arguments: Iterable[Argument]) -> list[Argument]:
+        """
+        Return shared arguments equal to the given ones.
+
+        :param arguments: arguments to be interned
+        :return: shared arguments in the same order
+        """
+        return [self.intern(x) for x in arguments]
+
+    def clear(self) -> None:
+        """
+        Forget all interned arguments.
+        """
+        self._arguments.clear()
+
+    def _get_argument(self, name: str, definition: dict[str, Any]) -> Argument:
+        # Definitions read from files hold mostly strings and bools, those are used in the key as they are
+        key: Hashable = (name, tuple(sorted([(x, type(value), value) for x, value in definition.items()])))
+        try:
+            argument = self._arguments.get(key)
+        except TypeError:
+            try:
+                key = (name, _freeze(definition))
+            except TypeError:  # not hashable values are rare, such arguments are just not shared
+                return argument_factory(name, definition)
+            argument = self._arguments.get(key)
+        if argument is None:
+            argument = self._arguments.setdefault(key, self.intern(argument_factory(name, definition)))
+        return argument
+
+    def _check_version(self) -> None:
+        # Registered types decide which class handles a definition, so arguments are created again
+        version = (CUSTOM_ARGUMENTS_TYPES.version, CUSTOM_TYPES_MAPPING.version)
+        if version != self._version:
+            self._arguments.clear()
+            self._version = version
+
+
+_FIELDS_NAMES: dict[Type[Argument], tuple[str, ...]] = {}  #: Map: argument class -> names of its fields
+_FROZEN_CLASSES: dict[Type[Argument], Type[Argument]] = {}  #: Map: argument class -> its frozen subclass
+_UNFROZEN_CLASSES: dict[type, Type[Argument]] = {}  #: Map: frozen subclass -> argument class
+
+
+def _fields_names(argument_class: Type[Argument]) -> tuple[str, ...]:
+    if (names := _FIELDS_NAMES.get(argument_class)) is None:
+        names = _FIELDS_NAMES[argument_class] = tuple(x.name for x in fields(argument_class))
+    return names
+
+
+def _freeze(value: Any) -> Hashable:
+    # Types are part of the key, so e.g. 1 and True (equal in Python) are not shared
+    if isinstance(value, dict):
+        return dict, tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze(item) for item in value)
+    hash(value)
+    return type(value), value
+
+
+def _unfrozen_class(argument_class: Type[Argument]) -> Type[Argument]:
+    return _UNFROZEN_CLASSES.get(argument_class, argument_class)
+
+
+def _freeze_argument(argument: Argument) -> None:
+    """
+    Make fields of the argument read only, by switching its class to a frozen subclass.
+
+    Frozen subclass has no own slots, so arguments keep their layout and derived (underscored) attributes
+    can still be cached. Frozen arguments are equal to not frozen ones and are pickled as not frozen.
+
+    :param argument: interned argument
+    """
+    argument_class = type(argument)
+    if argument_class in _UNFROZEN_CLASSES:
+        return
+    if (frozen_class := _FROZEN_CLASSES.get(argument_class)) is None:
+        frozen_class = _FROZEN_CLASSES[argument_class] = _create_frozen_class(argument_class)
+        _UNFROZEN_CLASSES[frozen_class] = argument_class
+    object.__setattr__(argument, '__class__', frozen_class)
+
+
+def _create_frozen_class(argument_class: Type[Argument]) -> Type[Argument]:
+    names = frozenset(_fields_names(argument_class))
+
+    def __setattr__(self: Argument, name: str, value: Any) -> None:
+        if name in names:
+            raise FrozenInstanceError(f'cannot assign to field {name!r} of interned argument')
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self: Argument, name: str) -> None:
+        if name in names:
+            raise FrozenInstanceError(f'cannot delete field {name!r} of interned argument')
+        object.__delattr__(self, name)
+
+    def __eq__(self: Argument, other: object) -> bool:
+        if _UNFROZEN_CLASSES.get(type(other), type(other)) is not argument_class:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in _fields_names(argument_class))
+
+    def __reduce_ex__(self: Argument, protocol: Any) -> tuple[Any, ...]:
+        return _new_argument, (argument_class,), self.__getstate__()
+
+    namespace = {
+        '__slots__': (), '__setattr__': __setattr__, '__delattr__': __delattr__, '__eq__': __eq__,
+        '__hash__': None, '__reduce_ex__': __reduce_ex__, '__qualname__': argument_class.__qualname__,
+        '__module__': argument_class.__module__,
+    }
+    return type(argument_class.__name__, (argument_class,), namespace)
+
+
+def _new_argument(argument_class: Type[Argument]) -> Argument:
+    # Frozen arguments are unpickled as not frozen instances of their argument class
+    argument: Argument = object.__new__(argument_class)
+    return argument
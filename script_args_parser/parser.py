@@ -2,14 +2,244 @@
 Defines parser class.
 """
 import os
-from argparse import ArgumentParser
-from pathlib import Path
-from typing import Any, Optional, Union
+from collections.abc import Iterable, Iterator, Mapping
+from functools import partial
+from typing import Any, Callable, Optional, TYPE_CHECKING, Union
 
-import toml
-import yaml
+from script_args_parser.arguments import Argument, argument_factory, CUSTOM_TYPES_MAPPING
+from script_args_parser.dependencies import DependencyGraph
+from script_args_parser.profiling import measure_stage, ParsingStats
 
-from script_args_parser.arguments import Argument, argument_factory
+
+# Modules below are imported where they are used, so scripts not using them do not pay for the import
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+    from concurrent.futures import Executor, Future
+    from pathlib import Path
+
+    from script_args_parser.batch import BatchItem, BatchResult
+    from script_args_parser.cache import DefinitionsCache
+    from script_args_parser.interning import ArgumentsInterner
+
+
+class ArgumentsSchema:
+    """
+    Arguments definitions prepared once to be used for parsing many sets of values.
+
+    :param arguments: definitions of arguments
+
+    :raises ValueError: when arguments reference each other in a cycle
+    """
+
+    def __init__(self, arguments: list[Argument]) -> None:
+        self.arguments = arguments
+        self.arguments_by_name = {argument.name: argument for argument in arguments}
+        self.dependency_graph = DependencyGraph(arguments)
+        self._cli_parser: Optional['ArgumentParser'] = self._create_cli_parser()
+        self._batch_cli_parser: Optional['ArgumentParser'] = None  # raising errors, created by parse_batch
+        self._empty_cli_values: Optional[dict[str, Any]] = None
+        self._async_arguments: tuple[int, list[Argument]] = (-1, [])
+        self._parallel_arguments: tuple[int, list[Argument]] = (-1, [])
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Return state for pickling (e.g. to send the schema to worker processes), without cli parsers.
+
+        Cli parsers are created again on first use, so workers parsing batches build only the one they use.
+
+        :return: schema state
+        """
+        state = self.__dict__.copy()
+        state['_cli_parser'] = None
+        state['_batch_cli_parser'] = None
+        state['_async_arguments'] = (-1, [])  # types registered in other processes may differ
+        state['_parallel_arguments'] = (-1, [])
+        return state
+
+    @property
+    def cli_parser(self) -> 'ArgumentParser':
+        """
+        Get parser of cli parameters, creating it if the schema was unpickled.
+
+        :return: cli parser
+        """
+        if self._cli_parser is None:
+            self._cli_parser = self._create_cli_parser()
+        return self._cli_parser
+
+    @classmethod
+    def from_file(
+        cls, arguments_file: Union[str, 'Path'], definitions_cache: Optional['DefinitionsCache'] = None,
+        stats: Optional[ParsingStats] = None, interner: Optional['ArgumentsInterner'] = None,
+    ) -> 'ArgumentsSchema':
+        """
+        Create ArgumentsSchema based on toml file with arguments definition.
+
+        :param arguments_file: file with arguments definition
+        :param definitions_cache: cache of arguments, if not given the file is always parsed
+        :param stats: if given, time spent in loading stages is recorded in it
+        :param interner: if given, arguments are shared with other schemas created with it
+        :return: created schema
+        """
+        from pathlib import Path
+        arguments_file = Path(arguments_file)
+        arguments_factory: Callable[[str], list[Argument]] = cls._parse_toml_definitions
+        if interner is not None:
+            arguments_factory = partial(cls._parse_toml_definitions, interner=interner)
+        if stats is not None:
+            arguments_factory = partial(cls._parse_toml_definitions_measured, stats, interner=interner)
+        if definitions_cache is None:
+            with measure_stage(stats, 'read_file'):
+                toml_string = arguments_file.read_text(encoding='utf-8')
+            arguments = arguments_factory(toml_string)
+        else:
+            with measure_stage(stats, 'load_cached_definitions'):
+                arguments = definitions_cache.get_arguments(arguments_file, arguments_factory)
+                if interner is not None:
+                    arguments = interner.intern_all(arguments)
+        with measure_stage(stats, 'create_schema'):
+            return cls(arguments)
+
+    def parse(
+        self, cli_params: Optional[list[str]] = None, user_values: Optional[dict[str, Any]] = None,
+        env: Optional[Mapping[str, str]] = None, lazy: bool = False, executor: Optional['Executor'] = None,
+        stats: Optional[ParsingStats] = None,
+    ) -> 'ArgumentsParser':
+        """
+        Parse arguments values according to the schema.
+
+        :param cli_params: list of cli parameters, if not given sys.arg[1:] is used
+        :param user_values: dict with values provided by the user (e.g. as yaml file)
+        :param env: environment variables, if not given os.environ is used
+        :param lazy: if True, values are resolved on first access
+        :param executor: if given, parallel converters and independent post processing run on it
+        :param stats: if given, time spent in parsing stages is recorded in it
+        :return: parser holding arguments values
+        """
+        return ArgumentsParser(self, cli_params, user_values, env, lazy, executor, stats)
+
+    def parse_batch(
+        self, items: Iterable['BatchItem'], env: Optional[Mapping[str, str]] = None,
+        executor: Optional['Executor'] = None, chunk_size: int = 256,
+    ) -> list['BatchResult']:
+        """
+        Parse many pairs of cli parameters and user values according to the schema.
+
+        Errors are stored in results of failing items, so the rest of items is parsed. Invalid cli parameters
+        raise argparse.ArgumentError instead of printing usage and exiting.
+
+        :param items: pairs of cli parameters and user values, None cli parameters mean no parameters
+        :param env: environment variables, if not given os.environ is used
+        :param executor: if given, chunks of items are parsed concurrently with it (for process pool
+                         executor custom types and values of arguments have to be picklable)
+        :param chunk_size: number of items parsed by a single executor task
+        :return: results in the order of items
+
+        :raises ValueError: when chunk size is not positive
+        """
+        from script_args_parser.batch import parse_chunk, split_into_chunks
+        if chunk_size < 1:
+            raise ValueError(f'Chunk size has to be positive, got {chunk_size}.')
+        if executor is None:
+            return parse_chunk(self, items, env)
+        futures = [
+            executor.submit(parse_chunk, self, chunk, env) for chunk in split_into_chunks(items, chunk_size)
+        ]
+        return [result for future in futures for result in future.result()]
+
+    async def parse_async(
+        self, cli_params: Optional[list[str]] = None, user_values: Optional[dict[str, Any]] = None,
+        env: Optional[Mapping[str, str]] = None, executor: Optional['Executor'] = None,
+        stats: Optional[ParsingStats] = None,
+    ) -> 'ArgumentsParser':
+        """
+        Parse arguments values according to the schema without blocking the event loop.
+
+        :param cli_params: list of cli parameters, if not given sys.arg[1:] is used
+        :param user_values: dict with values provided by the user (e.g. as yaml file)
+        :param env: environment variables, if not given os.environ is used
+        :param executor: if given, parallel converters and independent post processing run on it
+        :param stats: if given, time spent in parsing stages is recorded in it
+        :return: parser holding arguments values
+        """
+        return await ArgumentsParser.create_async(self, cli_params, user_values, env, executor, stats)
+
+    def read_cli_arguments(self, cli_params: Optional[list[str]] = None) -> dict[str, Any]:
+        """
+        Read values of arguments given as cli parameters.
+
+        :param cli_params: list of cli parameters, if not given sys.arg[1:] is used
+        :return: values of all arguments, None for those not given
+        """
+        if cli_params is not None and not cli_params:
+            # Result for no parameters is always the same, so it is computed once (e.g. for batches)
+            if self._empty_cli_values is None:
+                self._empty_cli_values = vars(self.cli_parser.parse_args([]))
+            return dict(self._empty_cli_values)
+        return vars(self.cli_parser.parse_args(cli_params))
+
+    def async_arguments(self) -> list[Argument]:
+        """
+        Find arguments converted with coroutine functions, which values have to be awaited.
+
+        Arguments are found again only when registered types change. Arguments which types are not
+        registered (yet) are skipped, those cannot be converted anyway.
+
+        :return: arguments with async converters
+        """
+        from inspect import iscoroutinefunction
+        version, arguments = self._async_arguments
+        if version != CUSTOM_TYPES_MAPPING.version:
+            arguments = []
+            for argument in self.arguments:
+                try:
+                    converters = argument.converters
+                except KeyError:
+                    continue
+                if any(iscoroutinefunction(x) for x in converters):
+                    arguments.append(argument)
+            self._async_arguments = (CUSTOM_TYPES_MAPPING.version, arguments)
+        return arguments
+
+    def parallel_arguments(self) -> list[Argument]:
+        """
+        Find arguments which values can be converted on an executor (see Argument.parallel_convertible).
+
+        Arguments are found again only when registered types change.
+
+        :return: arguments with parallel converters
+        """
+        version, arguments = self._parallel_arguments
+        if version != CUSTOM_TYPES_MAPPING.version:
+            arguments = [x for x in self.arguments if x.parallel_convertible]
+            self._parallel_arguments = (CUSTOM_TYPES_MAPPING.version, arguments)
+        return arguments
+
+    def _create_cli_parser(self, parser_class: Optional[type['ArgumentParser']] = None) -> 'ArgumentParser':
+        import argparse
+        cli_parser = (parser_class or argparse.ArgumentParser)()
+        for argument in self.arguments:
+            args, kwargs = argument.argparse_options
+            cli_parser.add_argument(*args, **kwargs)
+        return cli_parser
+
+    @staticmethod
+    def _parse_toml_definitions(
+        toml_string: str, interner: Optional['ArgumentsInterner'] = None,
+    ) -> list[Argument]:
+        from script_args_parser.backends import load_toml
+        parsed_toml = load_toml(toml_string)
+        return _create_arguments(parsed_toml, interner)
+
+    @staticmethod
+    def _parse_toml_definitions_measured(
+        stats: ParsingStats, toml_string: str, interner: Optional['ArgumentsInterner'] = None,
+    ) -> list[Argument]:
+        from script_args_parser.backends import load_toml
+        with stats.measure('load_toml'):
+            parsed_toml = load_toml(toml_string)
+        with stats.measure('create_arguments'):
+            return _create_arguments(parsed_toml, interner)
 
 
 class ArgumentsParser:
@@ -18,23 +248,44 @@ class ArgumentsParser:
 
     Values for arguments are stored in arguments_values dictionary.
 
-    :param arguments_definitions: toml string containing arguments definition
+    In lazy mode only cli parameters are read at creation. Value of an argument (and of arguments
+    it depends on) is resolved on the first access to the attribute with its name and stored
+    in arguments_values. Missing required values can be checked with validate_required.
+
+    :param arguments: definitions of arguments or schema prepared from them
     :param cli_params: list of cli parameters, if not given sys.arg[1:] is used
     :param user_values: dict with values provided by the user (e.g. as yaml file)
+    :param env: environment variables, if not given os.environ is used
+    :param lazy: if True, values are resolved on first access
+    :param executor: if given, parallel converters and independent post processing run on it
+    :param stats: if given, time spent in parsing stages is recorded in it, also for lazily resolved values
     """
 
     def __init__(
-        self, arguments: list[Argument], cli_params: Optional[list[str]] = None,
-        user_values: Optional[dict[str, Any]] = None
+        self, arguments: Union[list[Argument], ArgumentsSchema], cli_params: Optional[list[str]] = None,
+        user_values: Optional[dict[str, Any]] = None, env: Optional[Mapping[str, str]] = None,
+        lazy: bool = False, executor: Optional['Executor'] = None, stats: Optional[ParsingStats] = None,
     ) -> None:
+        if isinstance(arguments, ArgumentsSchema):
+            self._schema = arguments
+        else:
+            with measure_stage(stats, 'create_schema'):
+                self._schema = ArgumentsSchema(arguments)
         self.user_values = user_values or {}
-        self.arguments = arguments
-        self.arguments_values = self._read_cli_arguments(cli_params)
-        self._fallback_values()
-        self._parse_values()
-        self._convert_values()
-        self._validate_required()
-        self._post_process()
+        self._env = os.environ if env is None else env
+        self._lazy = lazy
+        self._executor = executor
+        self._stats = stats
+        self.arguments = self._schema.arguments
+        with measure_stage(stats, 'read_cli'):
+            self._cli_values = self._schema.read_cli_arguments(cli_params)
+        if lazy:
+            self.arguments_values: dict[str, Any] = {}
+        else:
+            self.arguments_values = self._cli_values
+            self._resolve_values()
+            _reject_async_values(self._schema.async_arguments(), self.arguments_values)
+            self._post_process()
 
     def __getattr__(self, name: str) -> Any:
         """
@@ -45,8 +296,10 @@ class ArgumentsParser:
 
         :raises AttributeError: when argument with given name is not found
         """
-        if name != 'arguments_values' and name in self.arguments_values:
-            return self.arguments_values[name]
+        if name != 'arguments_values' and name in (values := self.__dict__.get('arguments_values', {})):
+            return values[name]
+        if self.__dict__.get('_lazy') and name in self._schema.arguments_by_name:
+            return self._resolve_lazily(name)
         raise AttributeError(f'No attribute named "{name}"')
 
     def __setattr__(self, name: str, value: Any) -> None:
@@ -56,15 +309,18 @@ class ArgumentsParser:
         :param name: the name of argument to be overwritten
         :param value: the value to be set for the argument
         """
-        if name != 'arguments_values' and name in getattr(self, 'arguments_values', ''):
+        if 'arguments_values' in self.__dict__ and name in self._schema.arguments_by_name:
             self.arguments_values[name] = value
         else:
             super().__setattr__(name, value)
 
     @classmethod
     def from_files(
-        cls, arguments_file: Union[str, Path], cli_params: Optional[list[str]] = None,
-        yaml_config: Optional[Union[str, Path]] = None
+        cls, arguments_file: Union[str, 'Path'], cli_params: Optional[list[str]] = None,
+        yaml_config: Optional[Union[str, 'Path']] = None,
+        definitions_cache: Optional['DefinitionsCache'] = None, lazy: bool = False,
+        executor: Optional['Executor'] = None, stats: Optional[ParsingStats] = None,
+        interner: Optional['ArgumentsInterner'] = None,
     ) -> 'ArgumentsParser':
         """
         Create ArgumentsParser based on provided files.
@@ -72,64 +328,321 @@ class ArgumentsParser:
         :param arguments_file: file with arguments definition
         :param cli_params: list of cli parameters, if not given sys.arg[1:] is used
         :param yaml_config: file with values provided by user
+        :param definitions_cache: cache of arguments, if not given arguments file is always parsed
+        :param lazy: if True, values are resolved on first access
+        :param executor: if given, parallel converters and independent post processing run on it
+        :param stats: if given, time spent in loading and parsing stages is recorded in it
+        :param interner: if given, arguments are shared with other schemas created with it
         :return: created parser
         """
-        if isinstance(arguments_file, str):
-            arguments_file = Path(arguments_file)
-        if isinstance(yaml_config, str):
-            yaml_config = Path(yaml_config)
-        arguments = cls._parse_toml_definitions(arguments_file.read_text())
+        schema = ArgumentsSchema.from_file(arguments_file, definitions_cache, stats, interner)
+        user_values = None if yaml_config is None else _load_user_values(yaml_config, stats)
+        return cls(schema, cli_params, user_values, lazy=lazy, executor=executor, stats=stats)
+
+    @classmethod
+    async def from_files_async(
+        cls, arguments_file: Union[str, 'Path'], cli_params: Optional[list[str]] = None,
+        yaml_config: Optional[Union[str, 'Path']] = None,
+        definitions_cache: Optional['DefinitionsCache'] = None,
+        executor: Optional['Executor'] = None, stats: Optional[ParsingStats] = None,
+        interner: Optional['ArgumentsInterner'] = None,
+    ) -> 'ArgumentsParser':
+        """
+        Create ArgumentsParser based on provided files without blocking the event loop.
+
+        Definition and config files are loaded concurrently in worker threads.
+
+        :param arguments_file: file with arguments definition
+        :param cli_params: list of cli parameters, if not given sys.arg[1:] is used
+        :param yaml_config: file with values provided by user
+        :param definitions_cache: cache of arguments, if not given arguments file is always parsed
+        :param executor: if given, parallel converters and independent post processing run on it
+        :param stats: if given, time spent in loading and parsing stages is recorded in it
+        :param interner: if given, arguments are shared with other schemas created with it
+        :return: created parser
+        """
+        import asyncio
+        schema_loading = asyncio.to_thread(
+            ArgumentsSchema.from_file, arguments_file, definitions_cache, stats, interner,
+        )
         if yaml_config is None:
-            user_values = None
+            schema, user_values = await schema_loading, None
         else:
-            user_values = yaml.load(yaml_config.read_text(), Loader=yaml.SafeLoader)
-        return cls(arguments, cli_params, user_values)
+            schema, user_values = await asyncio.gather(
+                schema_loading, asyncio.to_thread(_load_user_values, yaml_config, stats),
+            )
+        return await cls.create_async(schema, cli_params, user_values, executor=executor, stats=stats)
 
-    @staticmethod
-    def _parse_toml_definitions(toml_string: str) -> list[Argument]:
-        parsed_toml = toml.loads(toml_string)
-        return [argument_factory(arg_name, arg_def) for arg_name, arg_def in parsed_toml.items()]
+    @classmethod
+    async def create_async(
+        cls, arguments: Union[list[Argument], ArgumentsSchema], cli_params: Optional[list[str]] = None,
+        user_values: Optional[dict[str, Any]] = None, env: Optional[Mapping[str, str]] = None,
+        executor: Optional['Executor'] = None, stats: Optional[ParsingStats] = None,
+    ) -> 'ArgumentsParser':
+        """
+        Create ArgumentsParser without blocking the event loop.
 
-    def _read_cli_arguments(self, cli_params: Optional[list[str]] = None) -> dict[str, Any]:
-        cli_parser = ArgumentParser()
-        for argument in self.arguments:
-            args, kwargs = argument.argparse_options
-            cli_parser.add_argument(*args, **kwargs)
-        return vars(cli_parser.parse_args(cli_params))
+        Values are resolved and post processed in a worker thread. Values returned by converters
+        being coroutine functions (e.g. of dataclasses defining async_post_init) are awaited
+        concurrently on the event loop, before post processing.
 
-    def _fallback_values(self) -> None:
-        for argument in self.arguments:
-            if self.arguments_values[argument.name] is None:
-                self.arguments_values[argument.name] = self.user_values.get(argument.name)
-            if self.arguments_values[argument.name] is None and argument.env_var is not None:
-                self.arguments_values[argument.name] = os.getenv(argument.env_var)
-            if self.arguments_values[argument.name] is None and argument.default_value is not None:
-                self.arguments_values[argument.name] = argument.default_value
-
-    def _parse_values(self) -> None:
-        for argument in self.arguments:
-            if (argument_value := self.arguments_values[argument.name]) is not None:
-                self.arguments_values[argument.name] = argument.parse_value(argument_value)
+        :param arguments: definitions of arguments or schema prepared from them
+        :param cli_params: list of cli parameters, if not given sys.arg[1:] is used
+        :param user_values: dict with values provided by the user (e.g. as yaml file)
+        :param env: environment variables, if not given os.environ is used
+        :param executor: if given, parallel converters and independent post processing run on it
+        :param stats: if given, time spent in parsing stages is recorded in it
+        :return: created parser
+        """
+        import asyncio
+        parser = await asyncio.to_thread(cls, arguments, cli_params, user_values, env, True, executor, stats)
+        super(ArgumentsParser, parser).__setattr__('_lazy', False)
+        super(ArgumentsParser, parser).__setattr__('arguments_values', parser._cli_values)
+        await asyncio.to_thread(parser._resolve_values)
+        with measure_stage(stats, 'await_values'):
+            await parser._await_values()
+        await asyncio.to_thread(parser._post_process)
+        return parser
 
-    def _convert_values(self) -> None:
+    def validate_required(self) -> None:
+        """
+        Check that all required arguments have values, without resolving other arguments.
+
+        In eager mode it is done during parser creation.
+
+        :raises RuntimeError: when required argument has no value
+        """
         for argument in self.arguments:
-            if (argument_value := self.arguments_values[argument.name]) is not None:
-                self.arguments_values[argument.name] = argument.convert_value(argument_value)
-
-    def _validate_required(self) -> None:
-        for arg in self.arguments:
-            if arg.required and self.arguments_values[arg.name] is None:
-                error_msg = f'No value supplied for argument "{arg.name}". You can set it in config file'
-                if arg.cli_arg is not None:
-                    error_msg += f' or by using cli option: "{arg.cli_arg}"'
-                if arg.env_var is not None:
-                    error_msg += f' or by setting env variable: "{arg.env_var}"'
-                error_msg += '.'
-                raise RuntimeError(error_msg)
+            if not argument.required or argument.name in self.arguments_values:
+                continue
+            if self._fallback_value(argument, self._cli_values[argument.name]) is None:
+                raise RuntimeError(_missing_value_message(argument))
+
+    def _resolve_values(self) -> None:
+        values = self.arguments_values
+        resolve_value = self._value_resolver()
+        with measure_stage(self._stats, 'resolve_values'):
+            if self._executor is None or not (conversions := self._submit_conversions(self._executor)):
+                for argument in self.arguments:
+                    values[argument.name] = resolve_value(argument, values[argument.name])
+                return
+            try:
+                for argument in self.arguments:
+                    if (conversion := conversions.get(argument.name)) is None:
+                        values[argument.name] = resolve_value(argument, values[argument.name])
+                    elif (argument_value := conversion.result()) is None and argument.required:
+                        raise RuntimeError(_missing_value_message(argument))
+                    else:
+                        values[argument.name] = argument_value
+            finally:
+                for conversion in conversions.values():
+                    conversion.cancel()
+
+    def _submit_conversions(self, executor: 'Executor') -> dict[str, 'Future[Any]']:
+        """
+        Start conversion of values of arguments which converters can be run in parallel.
+
+        Errors of parsing are stored in returned futures, so all errors are raised in definition order
+        when results are collected.
+
+        :param executor: executor running the conversions
+        :return: Map: argument name -> future of its converted value
+        """
+        from concurrent.futures import Future
+        conversions: dict[str, 'Future[Any]'] = {}
+        for argument in self._schema.parallel_arguments():
+            argument_value = self._fallback_value(argument, self.arguments_values[argument.name])
+            if argument_value is None:  # resolved with other arguments to report missing required value
+                continue
+            try:
+                parsed_value = argument.parse_value(argument_value)
+            except Exception as error:
+                conversions[argument.name] = Future()
+                conversions[argument.name].set_exception(error)
+            else:
+                conversions[argument.name] = executor.submit(argument.convert_value, parsed_value)
+        return conversions
+
+    def _resolve_value(self, argument: Argument, argument_value: Any) -> Any:
+        """
+        Run fallback, parsing, conversion and validation of a single argument.
+
+        :param argument: argument which value is resolved
+        :param argument_value: value read from cli
+        :return: converted value of argument
+
+        :raises RuntimeError: when required argument has no value
+        """
+        argument_value = self._fallback_value(argument, argument_value)
+        if argument_value is not None:
+            argument_value = argument.convert_value(argument.parse_value(argument_value))
+        if argument.required and argument_value is None:
+            raise RuntimeError(_missing_value_message(argument))
+        return argument_value
+
+    def _resolve_value_measured(self, stats: ParsingStats, argument: Argument, argument_value: Any) -> Any:
+        """
+        Do the same as _resolve_value, recording time of every step in stats.
+
+        :param stats: stats to record the time in
+        :param argument: argument which value is resolved
+        :param argument_value: value read from cli
+        :return: converted value of argument
+
+        :raises RuntimeError: when required argument has no value
+        """
+        with stats.measure('fallback', argument.name):
+            argument_value = self._fallback_value(argument, argument_value)
+        if argument_value is not None:
+            with stats.measure('parse', argument.name):
+                argument_value = argument.parse_value(argument_value)
+            with stats.measure('convert', argument.name):
+                argument_value = argument.convert_value(argument_value)
+        if argument.required and argument_value is None:
+            raise RuntimeError(_missing_value_message(argument))
+        return argument_value
+
+    async def _await_values(self) -> None:
+        import asyncio
+        values = self.arguments_values
+        names = [
+            argument.name for argument in self._schema.async_arguments() if values[argument.name] is not None
+        ]
+        awaited = await asyncio.gather(*(_await_value(values[name]) for name in names))
+        values.update(zip(names, awaited))
+
+    def _fallback_value(self, argument: Argument, argument_value: Any) -> Any:
+        if argument_value is None:
+            argument_value = self.user_values.get(argument.name)
+        if argument_value is None and argument.env_var is not None:
+            argument_value = self._env.get(argument.env_var)
+        if argument_value is None and argument.default_value is not None:
+            argument_value = argument.default_value
+        return argument_value
+
+    def _resolve_lazily(self, name: str) -> Any:
+        argument = self._schema.arguments_by_name[name]
+        for dependency in argument.dependencies:
+            if dependency not in self.arguments_values and dependency in self._schema.arguments_by_name:
+                self._resolve_lazily(dependency)
+        resolve_value = self._value_resolver()
+        argument_value = resolve_value(argument, self._cli_values[name])
+        if argument in self._schema.async_arguments():
+            _reject_async_values([argument], {name: argument_value})
+        argument_value = self._post_processor(argument)(argument_value, self.arguments_values)
+        self.arguments_values[name] = argument_value
+        return argument_value
 
     def _post_process(self) -> None:
-        for argument in self.arguments:
-            self.arguments_values[argument.name] = argument.post_process(
-                self.arguments_values[argument.name],
-                self.arguments_values,
-            )
+        values = self.arguments_values
+        arguments = self._schema.arguments_by_name
+        post_processor = self._post_processor
+        executor = self._executor
+        with measure_stage(self._stats, 'post_process_values'):
+            for level in self._schema.dependency_graph.levels:
+                # Only arguments really changing values are worth sending (with all values) to the executor
+                submitted = [] if executor is None else [
+                    name for name in level if arguments[name].has_post_processing
+                ]
+                if executor is None or len(submitted) < 2:
+                    for name in level:
+                        values[name] = post_processor(arguments[name])(values[name], values)
+                    continue
+                futures = {
+                    name: executor.submit(post_processor(arguments[name]), values[name], values)
+                    for name in submitted
+                }
+                for name in level:
+                    if name not in futures:
+                        values[name] = post_processor(arguments[name])(values[name], values)
+                for name, future in futures.items():
+                    values[name] = future.result()
+
+    def _value_resolver(self) -> Callable[[Argument, Any], Any]:
+        # Stats are checked once per parsing, so parsing without them is not slowed down
+        if self._stats is None:
+            return self._resolve_value
+        return partial(self._resolve_value_measured, self._stats)
+
+    def _post_processor(self, argument: Argument) -> Callable[[Any, dict[str, Any]], Any]:
+        if self._stats is None:
+            return argument.post_process
+        return partial(_post_process_measured, self._stats, argument)
+
+
+def _post_process_measured(
+    stats: ParsingStats, argument: Argument, argument_value: Any, arguments: dict[str, Any]
+) -> Any:
+    with stats.measure('post_process', argument.name):
+        return argument.post_process(argument_value, arguments)
+
+
+def _create_arguments(
+    definitions: dict[str, dict[str, Any]], interner: Optional['ArgumentsInterner']
+) -> list[Argument]:
+    if interner is None:
+        return [argument_factory(arg_name, arg_def) for arg_name, arg_def in definitions.items()]
+    return interner.get_arguments(definitions)
+
+
+def _load_user_values(yaml_config: Union[str, 'Path'], stats: Optional[ParsingStats]) -> Any:
+    from script_args_parser.backends import load_yaml_file
+    with measure_stage(stats, 'load_yaml'):
+        return load_yaml_file(yaml_config)
+
+
+async def _await_value(value: Any) -> Any:
+    """
+    Await value returned by async converter, also when it is nested in lists (e.g. of lists and tuples).
+
+    :param value: converted value
+    :return: value with all awaitables replaced by their results
+    """
+    import asyncio
+    from inspect import isawaitable
+    if isawaitable(value):
+        return await value
+    if isinstance(value, (list, Iterator)):
+        return list(await asyncio.gather(*(_await_value(x) for x in value)))
+    return value
+
+
+def _reject_async_values(arguments: Iterable[Argument], values: Mapping[str, Any]) -> None:
+    """
+    Check that none of values has to be awaited, as it cannot be done when parsing synchronously.
+
+    :param arguments: arguments with async converters
+    :param values: converted values of arguments
+
+    :raises TypeError: when argument with async converter has a value
+    """
+    names = [x.name for x in arguments if values.get(x.name) is not None]
+    if not names:
+        return
+    for name in names:
+        _close_coroutines(values[name])
+    raise TypeError(
+        f'Values of arguments {", ".join(names)} are created asynchronously (e.g. by dataclasses defining '
+        'async_post_init), use ArgumentsParser.create_async, ArgumentsParser.from_files_async '
+        'or ArgumentsSchema.parse_async to parse them.'
+    )
+
+
+def _close_coroutines(value: Any) -> None:
+    # Coroutines that will never be awaited are closed, so they do not emit warnings
+    from inspect import iscoroutine
+    if iscoroutine(value):
+        value.close()
+    elif isinstance(value, list):
+        for item in value:
+            _close_coroutines(item)
+
+
+def _missing_value_message(argument: Argument) -> str:
+    error_msg = f'No value supplied for argument "{argument.name}". You can set it in config file'
+    if argument.cli_arg is not None:
+        error_msg += f' or by using cli option: "{argument.cli_arg}"'
+    if argument.env_var is not None:
+        error_msg += f' or by setting env variable: "{argument.env_var}"'
+    error_msg += '.'
+    return error_msg
@@ -0,0 +1,99 @@
+"""
+Defines statistics of time spent in parsing stages.
+"""
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from threading import Lock
+from typing import Any, Optional
+
+
+@dataclass
+class StageStats:
+    """
+    Time spent in a stage and number of its calls.
+    """
+
+    seconds: float = 0.0  #: total wall time in seconds
+    calls: int = 0  #: number of calls
+
+
+class ParsingStats:
+    """
+    Collects wall time and number of calls of parsing stages, in total and per argument.
+
+    Stages of the whole parsing: read_file, load_cached_definitions, load_toml, create_arguments,
+    create_schema, load_yaml, read_cli, resolve_values, post_process_values.
+    Stages of a single argument: fallback, parse, convert, post_process.
+
+    Override record to forward measurements somewhere else as they are taken.
+    """
+
+    def __init__(self) -> None:
+        self.stages: dict[str, StageStats] = {}  #: Map: stage name -> stats of the stage
+        self.arguments: dict[str, dict[str, StageStats]] = {}  #: Map: argument name -> stage name -> stats
+        self._lock = Lock()
+
+    def record(self, stage: str, seconds: float, argument: Optional[str] = None) -> None:
+        """
+        Add single call of a stage.
+
+        :param stage: name of the stage
+        :param seconds: wall time of the call
+        :param argument: name of argument processed in the stage, if the stage is done per argument
+        """
+        with self._lock:
+            stage_stats = self.stages.setdefault(stage, StageStats())
+            stage_stats.seconds += seconds
+            stage_stats.calls += 1
+            if argument is not None:
+                stage_stats = self.arguments.setdefault(argument, {}).setdefault(stage, StageStats())
+                stage_stats.seconds += seconds
+                stage_stats.calls += 1
+
+    @contextmanager
+    def measure(self, stage: str, argument: Optional[str] = None) -> Iterator[None]:
+        """
+        Record wall time of the code run in the context.
+
+        :param stage: name of the stage
+        :param argument: name of argument processed in the stage, if the stage is done per argument
+        :yield: nothing, time is recorded when the context is exited
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start, argument)
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Export collected stats, e.g. to be logged.
+
+        :return: dict with `stages` and `arguments` keys, each stats as dict with seconds and calls
+        """
+        with self._lock:
+            return {
+                'stages': {stage: asdict(x) for stage, x in self.stages.items()},
+                'arguments': {
+                    name: {stage: asdict(x) for stage, x in stages.items()}
+                    for name, stages in self.arguments.items()
+                },
+            }
+
+
+def measure_stage(
+    stats: Optional[ParsingStats], stage: str, argument: Optional[str] = None
+) -> AbstractContextManager[None]:
+    """
+    Record wall time of the code run in the context, if stats are collected.
+
+    :param stats: stats to record the time in, if None nothing is recorded
+    :param stage: name of the stage
+    :param argument: name of argument processed in the stage, if the stage is done per argument
+    :return: context manager measuring the time
+    """
+    if stats is None:
+        return nullcontext()
+    return stats.measure(stage, argument)
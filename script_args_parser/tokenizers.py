@@ -0,0 +1,227 @@
+"""
+Defines tokenizers splitting string values of complex arguments.
+"""
+import os
+import re
+from collections.abc import Iterator
+from typing import Any, Union
+
+
+_QUOTES = '\'"'
+_SPECIAL_CHARS_REGEX = re.compile(r'[\'"#]')
+_WORD_END_REGEX = re.compile(r'[;#]')
+_REPEATED_SEMICOLON_REGEX = re.compile(r';(?=;)')
+
+# Shell words are split like shlex.split does it (posix mode, no comments), whitespaces are ' \t\r\n'
+_SHELL_SPECIAL_CHARS_REGEX = re.compile(r'[\'"\\]')
+_SHELL_WORD_REGEX = re.compile(r'[^ \t\r\n]+')
+_SHELL_TOKEN_PART_REGEX = re.compile(r'''
+    (?P<word>[^ \t\r\n'"\\]+)
+    |'(?P<single>[^']*)'
+    |"(?P<double>(?:[^"\\]|\\[\s\S])*)"
+    |\\(?P<escaped>[\s\S])
+    |(?P<space>[ \t\r\n]+)
+''', re.VERBOSE)
+_DOUBLE_QUOTED_ESCAPE_REGEX = re.compile(r'\\([\\"])')
+_TRAILING_BACKSLASHES_REGEX = re.compile(r'\\*\Z')
+_LIST_SPECIAL_CHARS_REGEX = re.compile(r'[\'"#\\]')
+_LIST_ITEMS_FIRST_WORDS_REGEX = re.compile(r'(?:^|;)[ \t\r\n]*([^; \t\r\n]*)[^;]*')
+
+
+def split_by_semicolon(argument_value: str) -> list[str]:
+    """
+    Split string into items separated by semicolons.
+
+    Items keep surrounding whitespaces and quotes. Item starting with a quote lasts until
+    the closing quote, so it can contain semicolons. Comments (from `#` to the end of line)
+    are skipped. Two semicolons next to each other produce an item with a single space.
+
+    The string is scanned once, so the time is linear to its length. ValueError is raised
+    when a quotation is not closed.
+
+    :param argument_value: string to be split
+    :return: list of found items
+    """
+    if argument_value == '':
+        return ['']
+    argument_value = ' ' + argument_value + ' '
+    if _SPECIAL_CHARS_REGEX.search(argument_value) is None:
+        return [item or ' ' for item in argument_value.split(';')]
+    return _split_with_quotes(_REPEATED_SEMICOLON_REGEX.sub('; ', argument_value))
+
+
+def split_list_items(argument_value: str) -> list[str]:
+    """
+    Split string into unquoted items of a list.
+
+    Items are split with split_by_semicolon and only the first shell word (see split_shell_words)
+    of every item is kept, empty string for items without words. Values without quotes, backslashes
+    and comments are split and unquoted with a single regular expression scan.
+
+    :param argument_value: string to be split
+    :return: list of found items
+    """
+    if _LIST_SPECIAL_CHARS_REGEX.search(argument_value) is None:
+        return _LIST_ITEMS_FIRST_WORDS_REGEX.findall(argument_value)
+    ret_val: list[str] = []
+    for item in split_by_semicolon(argument_value):
+        quote = item[:1]
+        # Items starting with a quote end with the closing one, so they hold a single quoted word
+        if quote and quote in _QUOTES and (quote == '\'' or '\\' not in item):
+            ret_val.append(item[1:-1])
+        else:
+            words = split_shell_words(item)
+            ret_val.append(words[0] if words else '')
+    return ret_val
+
+
+def split_shell_words(value: str) -> list[str]:
+    """
+    Split string into words using shell-like syntax, with the same result as shlex.split.
+
+    Words are separated with spaces, tabs and new lines. Single quotes keep everything literally,
+    in double quotes backslash escapes only double quote and backslash, outside quotes it escapes
+    any character. Adjacent quoted and not quoted parts form a single word.
+
+    :param value: string to be split
+    :return: list of found words
+
+    :raises ValueError: when quotation is not closed or there is no character after escaping backslash
+    """
+    if _SHELL_SPECIAL_CHARS_REGEX.search(value) is None:
+        return _SHELL_WORD_REGEX.findall(value)
+    words: list[str] = []
+    word_parts: list[str] = []
+    in_word = False
+    position = 0
+    length = len(value)
+    while position < length:
+        match = _SHELL_TOKEN_PART_REGEX.match(value, position)
+        if match is None:
+            raise ValueError(_shell_error_message(value, position))
+        _, single_quoted, double_quoted, escaped, spaces = match.groups()
+        position = match.end()
+        if spaces is not None:
+            if in_word:
+                words.append(''.join(word_parts))
+                word_parts.clear()
+                in_word = False
+            continue
+        in_word = True
+        if double_quoted is not None:
+            word_parts.append(_DOUBLE_QUOTED_ESCAPE_REGEX.sub(r'\1', double_quoted))
+        elif single_quoted is not None:
+            word_parts.append(single_quoted)
+        elif escaped is not None:
+            word_parts.append(escaped)
+        else:
+            word_parts.append(match[0])
+    if in_word:
+        words.append(''.join(word_parts))
+    return words
+
+
+def split_records(argument_value: str) -> list[list[str]]:
+    """
+    Split string into records (rows of a table) of shell words.
+
+    Records are split with split_by_semicolon and every record is split into words
+    with split_shell_words. Records without words are returned as a single empty string,
+    the same way a single tuple value is parsed. Values without quotes, backslashes and comments
+    are split with str.split and a single regular expression per record.
+
+    :param argument_value: string to be split
+    :return: list of found records, words of every record in order
+    """
+    if _LIST_SPECIAL_CHARS_REGEX.search(argument_value) is None:
+        return [words or [''] for words in map(_SHELL_WORD_REGEX.findall, argument_value.split(';'))]
+    return [split_shell_words(item) or [''] for item in split_by_semicolon(argument_value)]
+
+
+def files_paths(argument_value: Any) -> list[Union[str, os.PathLike[str]]]:
+    """
+    Read paths of files from argument value.
+
+    :param argument_value: path of a file or list of paths
+    :return: paths of files
+
+    :raises TypeError: value is not a path or a list of paths
+    :raises FileNotFoundError: one of the files does not exist
+    """
+    paths = [argument_value] if isinstance(argument_value, (str, os.PathLike)) else argument_value
+    if not isinstance(paths, list) or not all(isinstance(x, (str, os.PathLike)) for x in paths):
+        raise TypeError(
+            f'Value read from files has to be either a path or list of paths. Found {argument_value}.'
+        )
+    for path in paths:
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f'File with argument values not found: {path}.')
+    return paths
+
+
+def split_files_lines(paths: list[Union[str, os.PathLike[str]]]) -> Iterator[str]:
+    """
+    Read lines of files one by one, without reading whole files into memory.
+
+    Line endings are removed and blank lines are skipped. Files are opened when iteration
+    reaches them and closed when they are read.
+
+    :param paths: paths of files to be read, in order
+    :yield: lines of files
+    """
+    for path in paths:
+        with open(path, encoding='utf-8') as file:
+            for line in file:
+                if line.isspace():
+                    continue
+                yield line.rstrip('\r\n')
+
+
+def _shell_error_message(value: str, position: int) -> str:
+    # Parts not matching at the position start with a not closed quote or a backslash at the end
+    char = value[position]
+    if char == '\'':
+        return 'No closing quotation'
+    if char == '"':
+        trailing_backslashes = _TRAILING_BACKSLASHES_REGEX.search(value, position + 1)
+        if trailing_backslashes is None or len(trailing_backslashes[0]) % 2 == 0:
+            return 'No closing quotation'
+    return 'No escaped character'
+
+
+def _skip_comment(value: str, position: int) -> int:
+    end = value.find('\n', position)
+    return len(value) if end == -1 else end + 1
+
+
+def _split_with_quotes(value: str) -> list[str]:
+    ret_val: list[str] = []
+    length = len(value)
+    position = 0
+    while position < length:
+        char = value[position]
+        if char == ';':
+            position += 1
+        elif char == '#':
+            position = _skip_comment(value, position)
+        elif char in _QUOTES:
+            end = value.find(char, position + 1)
+            if end == -1:
+                raise ValueError('No closing quotation')
+            ret_val.append(value[position:end + 1])
+            position = end + 1
+        else:
+            token_parts: list[str] = []
+            while True:
+                match = _WORD_END_REGEX.search(value, position)
+                if match is None:
+                    token_parts.append(value[position:])
+                    position = length
+                    break
+                token_parts.append(value[position:match.start()])
+                if match[0] == ';':
+                    position = match.start()
+                    break
+                position = _skip_comment(value, match.start())
+            ret_val.append(''.join(token_parts))
+    return ret_val
@@ -0,0 +1,66 @@
+"""
+Defines parsing of arguments' type strings.
+"""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class TypeDescriptor:
+    """
+    Parsed type string of an argument, e.g. `list[tuple[str, int]]`.
+    """
+
+    type_string: str  #: type string as given in the definition
+    constructor: str  #: normalized (lowercase, stripped) outer type, e.g. `list`, `tuple`, `int`
+    parameters: tuple[str, ...] = ()  #: stripped type strings given in square brackets
+
+    @property
+    def parameters_descriptors(self) -> tuple['TypeDescriptor', ...]:
+        """
+        Parse types given in square brackets.
+
+        :return: descriptors of parameters
+        """
+        return tuple(parse_type(x) for x in self.parameters)
+
+
+_TYPE_DESCRIPTORS: dict[str, TypeDescriptor] = {}
+
+
+def parse_type(type_string: str) -> TypeDescriptor:
+    """
+    Parse type string into descriptor.
+
+    Descriptors are cached, so parsing the same string returns the same object.
+
+    Type string not closed properly with a square bracket has no parameters, its constructor is the
+    text before the first bracket.
+
+    :param type_string: type string to be parsed
+    :return: type descriptor
+    """
+    if (descriptor := _TYPE_DESCRIPTORS.get(type_string)) is not None:
+        return descriptor
+    constructor, bracket, rest = type_string.partition('[')
+    parameters: tuple[str, ...] = ()
+    if bracket and rest.endswith(']'):
+        parameters = tuple(x.strip() for x in _split_parameters(rest[:-1]))
+    descriptor = TypeDescriptor(type_string, constructor.strip().lower(), parameters)
+    _TYPE_DESCRIPTORS[type_string] = descriptor
+    return descriptor
+
+
+def _split_parameters(parameters: str) -> list[str]:
+    ret_val: list[str] = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(parameters):
+        if char == '[':
+            depth += 1
+        elif char == ']':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            ret_val.append(parameters[start:i])
+            start = i + 1
+    ret_val.append(parameters[start:])
+    return ret_val
@@ -0,0 +1,134 @@
+from collections.abc import Generator
+from itertools import chain
+from typing import Any, Optional, Type
+
+import pytest
+
+from script_args_parser.arguments import (
+    _BUILT_IN_ARGUMENTS_TYPES,
+    _find_argument_class,
+    _VersionedList,
+    Argument,
+    argument_factory,
+    CUSTOM_ARGUMENTS_TYPES,
+    CUSTOM_TYPES_MAPPING,
+    ListArgument,
+    ListOfTuplesArgument,
+    SwitchArgument,
+)
+from script_args_parser.type_descriptors import parse_type
+
+
+class StringsListArgument(ListArgument):
+    @staticmethod
+    def matcher(arg_type: str) -> bool:
+        return arg_type == 'list[str]'
+
+
+@pytest.fixture
+def custom_argument_type() -> Generator[Type[Argument], None, None]:
+    yield StringsListArgument
+    if StringsListArgument in CUSTOM_ARGUMENTS_TYPES:
+        CUSTOM_ARGUMENTS_TYPES.remove(StringsListArgument)
+
+
+@pytest.fixture
+def custom_type() -> Generator[str, None, None]:
+    yield 'UtFactoryType'
+    CUSTOM_TYPES_MAPPING.pop('UtFactoryType', None)
+
+
+def definition(arg_type: str) -> dict[str, Any]:
+    return {'type': arg_type, 'description': 'Some description', 'cli_arg': '--cli-arg'}
+
+
+def linear_scan(arg_type: str) -> Optional[Type[Argument]]:
+    for argument_class in chain(CUSTOM_ARGUMENTS_TYPES, _BUILT_IN_ARGUMENTS_TYPES):
+        if argument_class.matcher(arg_type):
+            return argument_class
+    return None
+
+
+@pytest.mark.parametrize('arg_type', [
+    'str', 'STR', 'int', 'Int', 'bool', 'path', 'PATH', 'switch', 'Switch',
+    'list[int]', 'LIST[str]', 'list[tuple[str, int]]', 'List[Tuple[str]]', 'list[ tuple[str]]',
+    'tuple[int, str]', 'TUPLE[path]', 'list', 'tuple', 'switch[int]', 'unknown', 'int[', ' int',
+])
+def test_same_class_as_linear_scan(arg_type):
+    assert _find_argument_class(arg_type) is linear_scan(arg_type)
+
+
+@pytest.mark.parametrize('arg_type', ['list[int]', 'list[tuple[str, int]]', 'tuple[int, str]', 'path', 'int'])
+def test_argument_factory(arg_type):
+    assert type(argument_factory('name', definition(arg_type))) is linear_scan(arg_type)
+
+
+@pytest.mark.parametrize('arg_type', ['unknown', 'int[', 'list_of_int', 'switch[int]'])
+def test_unknown_type(arg_type):
+    assert linear_scan(arg_type) is None
+    with pytest.raises(ValueError):
+        argument_factory('name', definition(arg_type))
+
+
+def test_custom_argument_type_registered_later(custom_argument_type):
+    assert type(argument_factory('name', definition('list[str]'))) is ListArgument
+    CUSTOM_ARGUMENTS_TYPES.append(custom_argument_type)
+    assert type(argument_factory('name', definition('list[str]'))) is custom_argument_type
+    CUSTOM_ARGUMENTS_TYPES.remove(custom_argument_type)
+    assert type(argument_factory('name', definition('list[str]'))) is ListArgument
+
+
+def test_custom_type_registered_later(custom_type):
+    with pytest.raises(ValueError):
+        argument_factory('name', definition(custom_type))
+    CUSTOM_TYPES_MAPPING[custom_type] = str
+    assert type(argument_factory('name', definition(custom_type))) is Argument
+
+
+@pytest.mark.parametrize('type_string, constructor, parameters', [
+    ('str', 'str', ()),
+    ('MyDataClass', 'mydataclass', ()),
+    ('List[int]', 'list', ('int',)),
+    ('tuple[int, str ,bool]', 'tuple', ('int', 'str', 'bool')),
+    ('list[tuple[str, int]]', 'list', ('tuple[str, int]',)),
+    ('tuple[list[int], str]', 'tuple', ('list[int]', 'str')),
+    ('list[int', 'list', ()),
+])
+def test_parse_type(type_string, constructor, parameters):
+    descriptor = parse_type(type_string)
+    assert descriptor.constructor == constructor
+    assert descriptor.parameters == parameters
+    assert parse_type(type_string) is descriptor
+
+
+def test_parameters_descriptors():
+    descriptor = parse_type('list[tuple[str, int]]')
+    (inner,) = descriptor.parameters_descriptors
+    assert inner.constructor == 'tuple'
+    assert inner.parameters == ('str', 'int')
+
+
+def test_list_of_tuples_and_switch_dispatch():
+    assert type(argument_factory('name', definition('list[tuple[int]]'))) is ListOfTuplesArgument
+    assert type(argument_factory('name', definition('switch'))) is SwitchArgument
+
+
+@pytest.mark.parametrize('modify', [
+    lambda x: x.__setitem__(0, ListArgument),
+    lambda x: x.__delitem__(0),
+    lambda x: x.__iadd__([ListArgument]),
+    lambda x: x.__imul__(2),
+    lambda x: x.append(ListArgument),
+    lambda x: x.clear(),
+    lambda x: x.extend([ListArgument]),
+    lambda x: x.insert(0, ListArgument),
+    lambda x: x.pop(),
+    lambda x: x.remove(SwitchArgument),
+    lambda x: x.reverse(),
+    lambda x: x.sort(key=id),
+])
+def test_list_modification_changes_version(modify):
+    argument_types = _VersionedList([SwitchArgument, Argument])
+    version = argument_types.version
+    modify(argument_types)
+    assert argument_types.version != version
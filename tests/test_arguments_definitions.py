@@ -0,0 +1,97 @@
+import pickle
+from dataclasses import dataclass
+
+import pytest
+
+from script_args_parser import ArgumentsParser
+from script_args_parser.arguments import (
+    Argument,
+    argument_factory,
+    CUSTOM_ARGUMENTS_TYPES,
+    IntArgument,
+    ListArgument,
+    ListOfTuplesArgument,
+)
+
+
+@dataclass
+class LimitedListArgument(ListArgument):
+    limit: int = 10
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self.limit_text = f'up to {self.limit}'
+
+    @staticmethod
+    def matcher(arg_type: str) -> bool:
+        return arg_type == 'list[str]'
+
+
+@pytest.fixture
+def custom_argument_type():
+    CUSTOM_ARGUMENTS_TYPES.append(LimitedListArgument)
+    yield LimitedListArgument
+    CUSTOM_ARGUMENTS_TYPES.remove(LimitedListArgument)
+
+
+@pytest.mark.parametrize('arg_type', [
+    'str', 'int', 'bool', 'path', 'switch', 'list[int]', 'tuple[str, int]', 'list[tuple[str, int]]',
+])
+def test_built_in_arguments_have_slots(arg_type):
+    argument = argument_factory('name', {'type': arg_type, 'description': 'Description', 'cli_arg': '--arg'})
+    assert not hasattr(argument, '__dict__')
+
+
+def test_argparse_options_built_once():
+    argument = argument_factory(
+        'name', {'type': 'list[tuple[str, int]]', 'description': 'Description', 'cli_arg': '--arg'},
+    )
+    assert argument.argparse_options is argument.argparse_options
+    assert argument.argparse_options == (['--arg'], {'dest': 'name', 'action': 'append', 'nargs': 2})
+
+
+def test_inner_tuple_argument():
+    argument = ListOfTuplesArgument(
+        name='people', type='list[tuple[str, int]]', description='People', cli_arg='--person', required=True,
+        env_var='UT_PEOPLE', default_value='John 16',
+    )
+    assert argument.tuple_argument.type == 'tuple[str, int]'
+    assert argument.tuple_argument.items_types == ['str', 'int']
+    assert (argument.tuple_argument.name, argument.tuple_argument.required) == ('people', True)
+
+
+def test_changing_definition_before_parsing():
+    argument = IntArgument(name='number', type='int', description='Number', cli_arg='--number')
+    argument.default_value = '2'
+    argument.cli_arg = '--other-number'
+    parser = ArgumentsParser([argument], ['--other-number', '3'], env={})
+    assert parser.number == 3
+
+
+@pytest.mark.parametrize('arg_type', ['int', 'list[int]', 'tuple[str, int]', 'list[tuple[str, int]]'])
+def test_pickle(arg_type):
+    argument = argument_factory('name', {'type': arg_type, 'description': 'Description', 'cli_arg': '--arg'})
+    argument.argparse_options
+    argument.converters
+    unpickled = pickle.loads(pickle.dumps(argument))
+    assert unpickled == argument
+    assert unpickled.argparse_options == argument.argparse_options
+    assert unpickled.converters == argument.converters
+
+
+def test_custom_argument_class(custom_argument_type):
+    argument = argument_factory('names', {
+        'type': 'list[str]', 'description': 'Names', 'cli_arg': '--name', 'limit': 3,
+    })
+    assert isinstance(argument, custom_argument_type)
+    assert argument.limit_text == 'up to 3'
+    unpickled = pickle.loads(pickle.dumps(argument))
+    assert (unpickled.limit, unpickled.limit_text, unpickled.items_type) == (3, 'up to 3', 'str')
+    parser = ArgumentsParser([argument], ['--name', 'John'], env={})
+    assert parser.names == ['John']
+
+
+def test_base_argument_is_dataclass():
+    argument = Argument(name='name', type='str', description='Description', cli_arg='--arg')
+    assert argument == Argument('name', 'str', 'Description', '--arg', False, None, None)
+    assert repr(argument).startswith("Argument(name='name', type='str'")
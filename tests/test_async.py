@@ -0,0 +1,208 @@
+import asyncio
+import gc
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+import toml
+import yaml
+
+from script_args_parser import ArgumentsParser, ArgumentsSchema, dataclass_argument, ParsingStats
+from script_args_parser.arguments import (
+    Argument,
+    argument_factory,
+    CUSTOM_TYPES_MAPPING,
+    ListArgument,
+    TupleArgument,
+)
+
+
+@dataclass_argument
+@dataclass
+class AsyncDataClass:
+    name: str
+    loaded: bool = field(default=False, compare=False)
+
+    async def async_post_init(self) -> None:
+        await asyncio.sleep(0)
+        self.loaded = True
+
+
+@pytest.fixture
+def files(tmp_path):
+    arguments_file = tmp_path / 'arguments.toml'
+    arguments_file.write_text(toml.dumps({
+        'name': {'type': 'str', 'description': 'String value', 'cli_arg': '--name'},
+        'count': {'type': 'int', 'description': 'Integer value', 'cli_arg': '--count', 'env_var': 'UT_COUNT'},
+        'file': {
+            'type': 'path', 'description': 'Path value', 'cli_arg': '--file', 'default_value': 'file.txt',
+            'parent_path': 'folder',
+        },
+        'folder': {'type': 'path', 'description': 'Parent folder', 'cli_arg': '--folder'},
+        'item': {'type': 'AsyncDataClass', 'description': 'Async value', 'cli_arg': '--item'},
+    }))
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text(yaml.dump({'count': 3, 'folder': 'data', 'item': {'name': 'first'}}))
+    return arguments_file, config_file
+
+
+@pytest.fixture
+def arguments():
+    return [
+        Argument(name='single', description='Single value', type='AsyncDataClass', cli_arg='--single'),
+        ListArgument(name='list', description='List value', type='list[AsyncDataClass]', cli_arg='--list'),
+        TupleArgument(
+            name='tuple', description='Tuple value', type='tuple[AsyncDataClass, int]', cli_arg='--tuple',
+        ),
+        Argument(name='name', description='String value', type='str', cli_arg='--name'),
+    ]
+
+
+@pytest.fixture
+def user_values():
+    return {
+        'single': {'name': 'first'},
+        'list': [['second'], {'name': 'third'}],
+        'tuple': [{'name': 'fourth'}, '4'],
+    }
+
+
+def test_from_files_async(files):
+    arguments_file, config_file = files
+    parser = asyncio.run(ArgumentsParser.from_files_async(arguments_file, ['--name', 'value'], config_file))
+    assert parser.arguments_values == {
+        'name': 'value', 'count': 3, 'file': parser.folder / 'file.txt', 'folder': parser.folder,
+        'item': AsyncDataClass('first'),
+    }
+    assert parser.item.loaded
+    assert not parser._lazy
+
+
+def test_from_files_async_without_config(files):
+    arguments_file, _ = files
+    cli_params = ['--count', '2', '--folder', 'data']
+    parser = asyncio.run(ArgumentsParser.from_files_async(arguments_file, cli_params))
+    assert parser.count == 2
+    assert parser.item is None
+
+
+def test_async_converters(arguments, user_values):
+    parser = asyncio.run(ArgumentsParser.create_async(arguments, [], user_values, env={}))
+    assert parser.single == AsyncDataClass('first')
+    assert parser.list == [AsyncDataClass('second'), AsyncDataClass('third')]
+    assert parser.tuple == [AsyncDataClass('fourth'), 4]
+    assert all(x.loaded for x in [parser.single, *parser.list, parser.tuple[0]])
+    assert parser.name is None
+
+
+def test_iterator_with_async_converter(arguments, user_values):
+    arguments[1].container = 'iterator'
+    parser = asyncio.run(ArgumentsParser.create_async(arguments, [], user_values, env={}))
+    assert parser.list == [AsyncDataClass('second'), AsyncDataClass('third')]
+
+
+def test_async_converters_awaited_concurrently(arguments):
+    started = 0
+    all_started = asyncio.Event()
+
+    async def wait_for_others(value):
+        nonlocal started
+        started += 1
+        if started == 3:
+            all_started.set()
+        await all_started.wait()
+        return value.upper()
+
+    async def parse() -> ArgumentsParser:
+        names = ListArgument(name='names', description='List', type='list[upper]', cli_arg='--names')
+        return await asyncio.wait_for(ArgumentsParser.create_async(
+            [arguments[-1], names], [], {'name': 'first', 'names': ['second', 'third']}, env={},
+        ), timeout=5)
+
+    CUSTOM_TYPES_MAPPING['upper'] = wait_for_others
+    arguments[-1].type = 'upper'
+    try:
+        parser = asyncio.run(parse())
+    finally:
+        del CUSTOM_TYPES_MAPPING['upper']
+    assert parser.name == 'FIRST'
+    assert parser.names == ['SECOND', 'THIRD']
+
+
+def test_values_resolved_off_the_loop(arguments):
+    threads = []
+
+    def record_thread(value):
+        threads.append(threading.get_ident())
+        return value
+
+    CUSTOM_TYPES_MAPPING['recorded'] = record_thread
+    arguments[-1].type = 'recorded'
+    try:
+        asyncio.run(ArgumentsParser.create_async(arguments, ['--name', 'value'], env={}))
+    finally:
+        del CUSTOM_TYPES_MAPPING['recorded']
+    assert threads and threading.get_ident() not in threads
+
+
+def test_schema_parse_async(arguments, user_values):
+    schema = ArgumentsSchema(arguments)
+    first = asyncio.run(schema.parse_async(['--name', 'first'], user_values, env={}))
+    second = asyncio.run(schema.parse_async(['--name', 'second'], user_values, env={}))
+    assert (first.name, second.name) == ('first', 'second')
+    assert first.single == second.single == AsyncDataClass('first')
+
+
+def test_missing_required_value(arguments):
+    arguments[-1].required = True
+    with pytest.raises(RuntimeError):
+        asyncio.run(ArgumentsParser.create_async(arguments, [], env={}))
+
+
+def test_async_stats(files):
+    arguments_file, config_file = files
+    stats = ParsingStats()
+    asyncio.run(ArgumentsParser.from_files_async(arguments_file, [], config_file, stats=stats))
+    assert {
+        'read_file', 'load_toml', 'load_yaml', 'read_cli', 'resolve_values', 'await_values',
+        'post_process_values',
+    } <= set(stats.stages)
+
+
+@pytest.mark.parametrize('definition, cli_params, expected', [
+    ({'type': 'switch'}, ['--value'], True),
+    ({'type': 'Path'}, ['--value', 'file.txt'], Path('file.txt')),
+    ({'type': 'Int', 'post_operations': '{value} * 2'}, ['--value', '2'], 4),
+])
+def test_types_without_types_mapping_converters(arguments, user_values, definition, cli_params, expected):
+    other = argument_factory('value', {'description': 'Other value', 'cli_arg': '--value', **definition})
+    schema = ArgumentsSchema([*arguments, other])
+    parser = asyncio.run(schema.parse_async(cli_params, user_values, env={}))
+    assert parser.value == expected
+    assert parser.single == AsyncDataClass('first')
+
+
+def test_not_registered_type_without_value(arguments, user_values):
+    arguments.append(
+        Argument(name='value', description='Other value', type='NotRegistered', cli_arg='--value'),
+    )
+    parser = asyncio.run(ArgumentsParser.create_async(arguments, [], user_values, env={}))
+    assert parser.value is None
+    assert parser.single == AsyncDataClass('first')
+
+
+@pytest.mark.filterwarnings('error::RuntimeWarning')
+def test_sync_parser_rejects_async_values(arguments, user_values):
+    with pytest.raises(TypeError, match='single, list, tuple.*create_async'):
+        ArgumentsParser(arguments, [], user_values, env={})
+    parser = ArgumentsParser(arguments, ['--name', 'value'], user_values, env={}, lazy=True)
+    assert parser.name == 'value'
+    with pytest.raises(TypeError, match='list.*parse_async'):
+        parser.list
+    gc.collect()
+
+
+def test_sync_parser_without_async_values(arguments):
+    parser = ArgumentsParser(arguments, ['--name', 'value'], env={})
+    assert parser.arguments_values == {'single': None, 'list': None, 'tuple': None, 'name': 'value'}
@@ -0,0 +1,115 @@
+import sys
+from collections.abc import Generator
+from importlib import import_module
+from io import StringIO
+
+import pytest
+import yaml
+
+from script_args_parser import backends
+
+
+TOML_DOCUMENT = '''
+[first_arg]
+type = "list[int]"
+description = "Some fancy description"
+cli_arg = "--cli-option-name"
+required = true
+'''
+
+YAML_DOCUMENT = '''
+string_arg: some (not so) random string
+int_arg: 123
+list_of_tuples_arg:
+  - [123, 156]
+  - [12, 14]
+'''
+
+
+@pytest.fixture(autouse=True)
+def restore_backends() -> Generator[None, None, None]:
+    yield
+    backends.set_toml_backend(None)
+    backends.set_yaml_backend(None)
+
+
+def test_default_toml_backend():
+    expected = 'tomllib' if sys.version_info >= (3, 11) else 'toml'
+    assert backends.toml_backend() == expected
+
+
+def test_default_yaml_backend():
+    expected = 'libyaml' if hasattr(yaml, 'CSafeLoader') else 'pyyaml'
+    assert backends.yaml_backend() == expected
+
+
+@pytest.mark.parametrize('backend', list(backends.TOML_BACKENDS))
+def test_toml_backends_give_same_result(backend):
+    backends.set_toml_backend(backend)
+    assert backends.load_toml(TOML_DOCUMENT) == {
+        'first_arg': {
+            'type': 'list[int]',
+            'description': 'Some fancy description',
+            'cli_arg': '--cli-option-name',
+            'required': True,
+        },
+    }
+
+
+@pytest.mark.parametrize('backend', list(backends.YAML_BACKENDS))
+@pytest.mark.parametrize('document_factory', [str, str.encode, StringIO])
+def test_yaml_backends_give_same_result(backend, document_factory):
+    backends.set_yaml_backend(backend)
+    assert backends.load_yaml(document_factory(YAML_DOCUMENT)) == {
+        'string_arg': 'some (not so) random string',
+        'int_arg': 123,
+        'list_of_tuples_arg': [[123, 156], [12, 14]],
+    }
+
+
+@pytest.mark.parametrize('backend', list(backends.YAML_BACKENDS))
+@pytest.mark.parametrize('encoding, newline', [
+    ('utf-8', '\n'), ('utf-8', '\r\n'), ('utf-8-sig', '\n'), ('utf-16', '\n'),
+])
+def test_yaml_file(backend, encoding, newline, tmp_path):
+    backends.set_yaml_backend(backend)
+    yaml_file = tmp_path / 'config.yaml'
+    yaml_file.write_text(YAML_DOCUMENT + 'unicode_arg: zażółć\n', encoding=encoding, newline=newline)
+    assert backends.load_yaml_file(yaml_file) == {
+        'string_arg': 'some (not so) random string',
+        'int_arg': 123,
+        'list_of_tuples_arg': [[123, 156], [12, 14]],
+        'unicode_arg': 'zażółć',
+    }
+
+
+@pytest.mark.parametrize('backend', list(backends.YAML_BACKENDS))
+def test_empty_yaml_file(backend, tmp_path):
+    backends.set_yaml_backend(backend)
+    yaml_file = tmp_path / 'config.yaml'
+    yaml_file.touch()
+    assert backends.load_yaml_file(str(yaml_file)) is None
+
+
+def test_not_installed_backend_falls_back(monkeypatch):
+    def failing_import(name):
+        if name == 'rtoml':
+            raise ImportError(name)
+        return import_module(name)
+    monkeypatch.setattr('script_args_parser.backends.import_module', failing_import)
+    backends.set_toml_backend('rtoml')
+    assert backends.toml_backend() in ('tomllib', 'toml')
+    assert backends.load_toml('value = 1') == {'value': 1}
+
+
+def test_not_available_yaml_loader_falls_back(monkeypatch):
+    monkeypatch.delattr(yaml, 'CSafeLoader', raising=False)
+    backends.set_yaml_backend('libyaml')
+    assert backends.yaml_backend() == 'pyyaml'
+    assert backends.load_yaml('value: 1') == {'value': 1}
+
+
+@pytest.mark.parametrize('setter', [backends.set_toml_backend, backends.set_yaml_backend])
+def test_unknown_backend(setter):
+    with pytest.raises(ValueError):
+        setter('not_existing')
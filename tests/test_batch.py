@@ -0,0 +1,136 @@
+import pickle
+from argparse import ArgumentError
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from script_args_parser import ArgumentsSchema, BatchResult
+from script_args_parser.arguments import Argument, IntArgument, ListArgument, PathArgument
+from script_args_parser.batch import BatchItem, split_into_chunks
+
+
+@pytest.fixture
+def schema():
+    return ArgumentsSchema([
+        Argument(name='name', description='String value', type='str', cli_arg='--name', required=True),
+        IntArgument(
+            name='count', description='Integer value', type='int', cli_arg='--count', default_value='1',
+        ),
+        PathArgument(
+            name='file', description='Path value', type='path', cli_arg='--file', default_value='file.txt',
+            parent_path='folder',
+        ),
+        PathArgument(
+            name='folder', description='Parent path', type='path', cli_arg='--folder', default_value='.',
+        ),
+        ListArgument(name='ids', description='List value', type='list[int]', cli_arg='--id'),
+    ])
+
+
+@pytest.fixture
+def items():
+    return [
+        (['--name', 'first'], None),
+        (None, {'name': 'second', 'count': 2, 'ids': [1, 2]}),
+        (['--name', 'third', '--id', '3', '--folder', 'data'], {'count': '3'}),
+        ([], None),
+        (['--name', 'fifth', '--not-existing'], None),
+        (['--name', 'sixth', '--count', 'six'], None),
+        (['--name', 'seventh', '--id', '7'], {'file': 'other.txt'}),
+    ]
+
+
+def check_results(results: list[BatchResult], items: list[BatchItem]) -> None:
+    assert len(results) == len(items)
+    assert all(isinstance(x, BatchResult) for x in results)
+    names = [x.values['name'] for x in results if x.values is not None]
+    assert names == ['first', 'second', 'third', 'seventh']
+    assert results[1].values == {
+        'name': 'second', 'count': 2, 'file': Path('file.txt'), 'folder': Path('.'), 'ids': [1, 2],
+    }
+    assert results[2].values is not None
+    assert results[2].values['file'] == Path('data/file.txt')
+    assert results[2].values['ids'] == [3]
+    assert [type(x.error) for x in results] == [
+        type(None), type(None), type(None), RuntimeError, ArgumentError, ValueError, type(None),
+    ]
+
+
+def test_sequential(schema, items):
+    check_results(schema.parse_batch(items, env={}), items)
+
+
+def test_generator(schema, items):
+    check_results(schema.parse_batch((x for x in items), env={}), items)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 100])
+def test_thread_pool(schema, items, chunk_size):
+    with ThreadPoolExecutor(2) as executor:
+        results = schema.parse_batch(iter(items), env={}, executor=executor, chunk_size=chunk_size)
+    check_results(results, items)
+
+
+def test_process_pool(schema, items):
+    with ProcessPoolExecutor(2) as executor:
+        results = schema.parse_batch(items, env={}, executor=executor, chunk_size=3)
+    check_results(results, items)
+
+
+def test_empty_batch(schema):
+    with ThreadPoolExecutor(2) as executor:
+        assert schema.parse_batch([], executor=executor) == []
+    assert schema.parse_batch([]) == []
+
+
+@pytest.mark.parametrize('chunk_size', [0, -1])
+def test_wrong_chunk_size(schema, items, chunk_size):
+    with pytest.raises(ValueError):
+        schema.parse_batch(items, chunk_size=chunk_size)
+
+
+def test_split_into_chunks():
+    items = [(None, {'value': i}) for i in range(5)]
+    assert list(split_into_chunks(items, 2)) == [items[:2], items[2:4], items[4:]]
+
+
+def test_pickled_schema(schema):
+    restored = pickle.loads(pickle.dumps(schema))
+    assert restored.parse(['--name', 'value', '--count', '3'], env={}).count == 3
+    assert list(restored.arguments_by_name) == list(schema.arguments_by_name)
+
+
+def test_batch_cli_parser_created_once(schema, items, monkeypatch):
+    created = []
+    original_create = ArgumentsSchema._create_cli_parser
+
+    def counting_create(self, parser_class=None):
+        created.append(parser_class)
+        return original_create(self, parser_class)
+    monkeypatch.setattr(ArgumentsSchema, '_create_cli_parser', counting_create)
+    with ThreadPoolExecutor(2) as executor:
+        schema.parse_batch(items, env={}, executor=executor, chunk_size=1)
+    schema.parse_batch(items, env={})
+    assert len(created) == 1
+    assert schema.parse(['--name', 'value'], env={}).name == 'value'
+
+
+def test_pickled_schema_creates_cli_parsers_on_use(schema, items):
+    schema.parse_batch(items, env={})
+    restored = pickle.loads(pickle.dumps(schema))
+    assert restored._cli_parser is None and restored._batch_cli_parser is None
+    assert [x.error is None for x in restored.parse_batch(items, env={})] == [
+        x.error is None for x in schema.parse_batch(items, env={})
+    ]
+    assert restored._cli_parser is None
+    assert restored.cli_parser is restored.cli_parser
+
+
+def test_invalid_cli_params_not_printed(schema, items, capsys):
+    results = schema.parse_batch(items, env={})
+    assert 'unrecognized arguments: --not-existing' in str(results[4].error)
+    assert capsys.readouterr().err == ''
+    with pytest.raises(SystemExit):
+        schema.parse(['--not-existing'], env={})
+    assert 'unrecognized arguments' in capsys.readouterr().err
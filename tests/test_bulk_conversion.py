@@ -0,0 +1,87 @@
+import random
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from script_args_parser import ArgumentsParser
+from script_args_parser.arguments import _BASIC_TYPES_MAPPING, CUSTOM_TYPES_MAPPING, ListArgument
+
+
+BOOL_WORDS = ['0', '1', 'false', 'true', 'no', 'yes', 'FALSE', 'True', 'yEs', 'No', '', 'other', ' yes']
+
+
+@pytest.fixture
+def overridden_int() -> Generator[None, None, None]:
+    CUSTOM_TYPES_MAPPING['int'] = lambda x: int(x) * 10
+    yield
+    del CUSTOM_TYPES_MAPPING['int']
+
+
+def list_argument(items_type: str) -> ListArgument:
+    return ListArgument(name='list', description='List value', type=f'list[{items_type}]', cli_arg='--item')
+
+
+def per_element(items_type: str, values: list[Any]) -> list[Any]:
+    converter = _BASIC_TYPES_MAPPING[items_type]
+    return [converter(x) for x in values]
+
+
+def random_values(seed: int) -> dict[str, list[Any]]:
+    rng = random.Random(seed)
+    count = rng.randint(0, 200)
+    return {
+        'int': [rng.choice([str(rng.randint(-10**20, 10**20)), f' {rng.randint(0, 99)} ', rng.randint(0, 9)])
+                for _ in range(count)],
+        'bool': [rng.choice([*BOOL_WORDS, True, False, 0, 1, 2, 0.0, None, []]) for _ in range(count)],
+        'path': [rng.choice(['file.txt', 'dir/file', '/abs/path/', '.', '']) for _ in range(count)],
+        'str': [rng.choice(['text', '', 1, 2.5, None]) for _ in range(count)],
+    }
+
+
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('items_type', ['int', 'bool', 'path', 'str'])
+def test_same_as_per_element(seed, items_type):
+    values = random_values(seed)[items_type]
+    converted = list_argument(items_type).convert_value(values)
+    expected = per_element(items_type, values)
+    assert converted == expected
+    assert [type(x) for x in converted] == [type(x) for x in expected]
+
+
+@pytest.mark.parametrize('items_type, values, error', [
+    ('int', ['1', '2', 'three'], ValueError),
+    ('int', ['1', None], TypeError),
+    ('int', ['1.5'], ValueError),
+    ('path', ['file', None], TypeError),
+])
+def test_same_errors_as_per_element(items_type, values, error):
+    with pytest.raises(error):
+        per_element(items_type, values)
+    with pytest.raises(error):
+        list_argument(items_type).convert_value(values)
+
+
+def test_uncommon_bool_values():
+    assert list_argument('bool').convert_value(['yes', 'yES', 'other', '', 2, 0, None]) == [
+        True, True, True, False, True, False, False,
+    ]
+
+
+def test_unhashable_bool_values():
+    assert list_argument('bool').convert_value(['yes', [], [1], {}]) == [True, False, True, False]
+
+
+def test_overridden_type_not_converted_in_bulk(overridden_int):
+    assert list_argument('int').convert_value(['1', '2']) == [10, 20]
+
+
+def test_parsed_values():
+    paths_argument = ListArgument(name='paths', description='Paths', type='list[path]', cli_arg='--path')
+    parser = ArgumentsParser(
+        [list_argument('bool'), paths_argument],
+        ['--item', 'yes', '--item', 'No', '--path', 'a', '--path', 'b/c'], env={},
+    )
+    assert parser.list == [True, False]
+    assert parser.paths == [Path('a'), Path('b/c')]
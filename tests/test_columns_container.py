@@ -0,0 +1,156 @@
+from array import array
+from importlib.util import find_spec
+from pathlib import Path
+
+import pytest
+
+from script_args_parser import ArgumentsParser
+from script_args_parser.arguments import argument_factory, ListOfTuplesArgument
+
+
+@pytest.fixture
+def arguments_definition():
+    return [ListOfTuplesArgument(
+        name='people',
+        description='People',
+        type='list[tuple[str, int, bool]]',
+        cli_arg='--person',
+        env_var='UT_COLUMNS_PEOPLE',
+        container='columns',
+    )]
+
+
+@pytest.fixture
+def people_file(tmp_path):
+    path = tmp_path / 'people.txt'
+    path.write_text('John 16 yes\n"Mary Jane" 17 no\n\nDavid 18 yes\n')
+    return path
+
+
+def test_container_from_definition():
+    argument = argument_factory('people', {
+        'type': 'list[tuple[str, int]]', 'description': 'People', 'cli_arg': '--person',
+        'container': 'columns',
+    })
+    assert isinstance(argument, ListOfTuplesArgument)
+    assert argument.container == 'columns'
+
+
+def test_cli_values(arguments_definition):
+    parser = ArgumentsParser(
+        arguments_definition, ['--person', 'John', '16', 'yes', '--person', 'Mary', '17', 'no'], env={},
+    )
+    assert parser.people == [['John', 'Mary'], array('q', [16, 17]), array('B', [1, 0])]
+
+
+def test_user_values(arguments_definition):
+    parser = ArgumentsParser(arguments_definition, [], {'people': [['John', 16, True]]}, env={})
+    assert parser.people == [['John'], array('q', [16]), array('B', [1])]
+
+
+def test_semicolon_separated_values(arguments_definition):
+    parser = ArgumentsParser(
+        arguments_definition, [], env={'UT_COLUMNS_PEOPLE': 'John 16 yes; "Mary Jane" 17 no'},
+    )
+    assert parser.people == [['John', 'Mary Jane'], array('q', [16, 17]), array('B', [1, 0])]
+
+
+def test_empty_list(arguments_definition):
+    parser = ArgumentsParser(arguments_definition, [], {'people': []}, env={})
+    assert parser.people == [[], array('q'), array('B')]
+
+
+def test_many_rows(arguments_definition):
+    arguments_definition[0].default_value = ';'.join(f'name{i} {i} {i % 2}' for i in range(10_000))
+    names, ages, flags = ArgumentsParser(arguments_definition, [], env={}).people
+    assert names == [f'name{i}' for i in range(10_000)]
+    assert ages == array('q', range(10_000))
+    assert flags == array('B', [i % 2 for i in range(10_000)])
+
+
+@pytest.mark.parametrize('container', ['list', 'iterator', 'columns', 'numpy_columns'])
+@pytest.mark.parametrize('user_values, env', [
+    ({}, {'UT_COLUMNS_PEOPLE': 'John 16 yes;; Mary 17 no'}),
+    ({'people': [['John', '16', 'yes'], [''], ['Mary', '17', 'no'], []]}, {}),
+])
+def test_empty_row(arguments_definition, container, user_values, env):
+    if container == 'numpy_columns':
+        pytest.importorskip('numpy')
+    arguments_definition[0].container = container
+    people = ArgumentsParser(arguments_definition, [], user_values, env=env).people
+    if container in ('list', 'iterator'):
+        assert [x for x in people if x] == [['John', 16, True], [''], ['Mary', 17, False]]
+    else:
+        assert [list(x) for x in people] == [['John', 'Mary'], [16, 17], [True, False]]
+
+
+@pytest.mark.parametrize('container', ['columns', 'numpy_columns'])
+@pytest.mark.parametrize('items_types, value, expected', [
+    ('str, int', 'a 1;;b 2;;', [['a', 'b'], [1, 2]]),
+    ('str, int', [['a', '1'], [], ['b', '2'], ['']], [['a', 'b'], [1, 2]]),
+    ('int, str', '1 a;;2 b', [[1, 2], ['a', 'b']]),
+    ('int, str', [[], ['1', 'a'], [''], ['2', 'b']], [[1, 2], ['a', 'b']]),
+])
+def test_empty_rows_keep_columns_aligned(container, items_types, value, expected):
+    if container == 'numpy_columns':
+        pytest.importorskip('numpy')
+    argument = ListOfTuplesArgument(
+        name='pairs', description='Pairs', type=f'list[tuple[{items_types}]]', cli_arg='--pair',
+        container=container,
+    )
+    columns = list(argument.convert_value(argument.parse_value(value)))
+    assert [len(x) for x in columns] == [2, 2]
+    assert [list(x) for x in columns] == expected
+
+
+def test_incomplete_user_row(arguments_definition):
+    user_values = {'people': [['John', 16, True], ['Mary', 17]]}
+    with pytest.raises(RuntimeError, match='got 2 in row 1'):
+        ArgumentsParser(arguments_definition, [], user_values, env={})
+
+
+def test_values_from_file(arguments_definition, people_file):
+    arguments_definition[0].from_file = True
+    parser = ArgumentsParser(arguments_definition, [], {'people': str(people_file)}, env={})
+    assert parser.people == [
+        ['John', 'Mary Jane', 'David'], array('q', [16, 17, 18]), array('B', [1, 0, 1]),
+    ]
+
+
+def test_incomplete_row_of_iterator(arguments_definition):
+    rows = iter([['John', '16', 'yes'], ['Mary']])
+    with pytest.raises(RuntimeError, match='got 1 in row 1'):
+        arguments_definition[0].convert_value(rows)
+
+
+def test_path_column():
+    argument = ListOfTuplesArgument(
+        name='files', description='Files', type='list[tuple[path, int]]', cli_arg='--file',
+        container='columns',
+    )
+    assert argument.convert_value(argument.parse_value('a.txt 1; b.txt 2')) == [
+        [Path('a.txt'), Path('b.txt')], array('q', [1, 2]),
+    ]
+
+
+@pytest.mark.skipif(find_spec('numpy') is not None, reason='numpy is installed')
+def test_numpy_not_installed():
+    with pytest.raises(ValueError):
+        ListOfTuplesArgument(
+            name='people', description='People', type='list[tuple[str, int]]', cli_arg='--person',
+            container='numpy_columns',
+        )
+
+
+def test_numpy_columns():
+    numpy = pytest.importorskip('numpy')
+    argument = ListOfTuplesArgument(
+        name='people', description='People', type='list[tuple[str, int, bool]]', cli_arg='--person',
+        container='numpy_columns',
+    )
+    names, ages, flags = argument.convert_value(argument.parse_value('John 16 yes; Mary 17 no'))
+    assert names == ['John', 'Mary']
+    assert ages.dtype == numpy.int64
+    assert ages.tolist() == [16, 17]
+    assert flags.dtype == numpy.bool_
+    assert flags.tolist() == [True, False]
@@ -0,0 +1,146 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+import toml
+
+from script_args_parser import ArgumentsParser, ArgumentsSchema, dataclass_argument, DefinitionsCache
+from script_args_parser.arguments import CUSTOM_TYPES_MAPPING
+from script_args_parser.cache import default_cache_dir
+
+
+@dataclass_argument
+@dataclass
+class CachedDataClass:
+    value_1: str
+    value_2: str
+
+
+@pytest.fixture
+def toml_file_path(tmp_path):
+    mappings = {
+        'first_arg': {
+            'type': 'list[int]',
+            'description': 'Some fancy description',
+            'cli_arg': '--cli-option-name',
+            'default_value': '1; 2; 3',
+        },
+        'second_arg': {
+            'type': 'CachedDataClass',
+            'description': 'Some dataclass',
+            'cli_arg': '--dataclass',
+        },
+    }
+    toml_file_path = tmp_path / 'arguments.toml'
+    toml_file_path.write_text(toml.dumps(mappings))
+    return toml_file_path
+
+
+@pytest.fixture
+def toml_loads_calls(monkeypatch):
+    calls: list[str] = []
+    original_parse = ArgumentsSchema._parse_toml_definitions
+
+    def counting_parse(toml_string):
+        calls.append(toml_string)
+        return original_parse(toml_string)
+    monkeypatch.setattr(ArgumentsSchema, '_parse_toml_definitions', staticmethod(counting_parse))
+    return calls
+
+
+def parse(toml_file_path: Path, cache: DefinitionsCache) -> ArgumentsParser:
+    return ArgumentsParser.from_files(toml_file_path, [], definitions_cache=cache)
+
+
+def test_second_parse_uses_cache(tmp_path, toml_file_path, toml_loads_calls):
+    cache = DefinitionsCache(tmp_path / 'cache')
+    first = parse(toml_file_path, cache)
+    second = parse(toml_file_path, cache)
+    assert len(toml_loads_calls) == 1
+    assert first.first_arg == second.first_arg == [1, 2, 3]
+    assert first.arguments == second.arguments
+
+
+def test_cached_arguments_convert_custom_types(tmp_path, toml_file_path):
+    cache = DefinitionsCache(tmp_path / 'cache')
+    parse(toml_file_path, cache)
+    parser = ArgumentsParser.from_files(toml_file_path, [], definitions_cache=cache)
+    parser = parser._schema.parse([], {'second_arg': ['a', 'b']})
+    assert parser.second_arg == CachedDataClass('a', 'b')
+
+
+def test_changed_file_is_parsed_again(tmp_path, toml_file_path, toml_loads_calls):
+    cache = DefinitionsCache(tmp_path / 'cache')
+    parse(toml_file_path, cache)
+    toml_file_path.write_text(toml_file_path.read_text().replace('1; 2; 3', '4; 5'))
+    parser = parse(toml_file_path, cache)
+    assert len(toml_loads_calls) == 2
+    assert parser.first_arg == [4, 5]
+
+
+def test_same_size_and_mtime_but_different_content(tmp_path, toml_file_path, toml_loads_calls):
+    cache = DefinitionsCache(tmp_path / 'cache')
+    parse(toml_file_path, cache)
+    stat = toml_file_path.stat()
+    toml_file_path.write_text(toml_file_path.read_text().replace('1; 2; 3', '3; 2; 1'))
+    os.utime(toml_file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    parser = parse(toml_file_path, cache)
+    assert len(toml_loads_calls) == 2
+    assert parser.first_arg == [3, 2, 1]
+
+
+def test_corrupted_entry_is_rebuilt(tmp_path, toml_file_path, toml_loads_calls):
+    cache_dir = tmp_path / 'cache'
+    cache = DefinitionsCache(cache_dir)
+    parse(toml_file_path, cache)
+    for entry in cache_dir.iterdir():
+        entry.write_bytes(b'not a pickle')
+    assert parse(toml_file_path, cache).first_arg == [1, 2, 3]
+    assert parse(toml_file_path, cache).first_arg == [1, 2, 3]
+    assert len(toml_loads_calls) == 2
+
+
+def test_not_writable_cache_dir(tmp_path, toml_file_path):
+    cache_dir = tmp_path / 'cache'
+    cache_dir.write_text('a file, not a directory')
+    assert parse(toml_file_path, DefinitionsCache(cache_dir)).first_arg == [1, 2, 3]
+
+
+def test_default_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr('sys.platform', 'linux')
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    assert default_cache_dir() == tmp_path / 'script_args_parser'
+    assert DefinitionsCache().cache_dir == tmp_path / 'script_args_parser'
+
+
+def test_registering_custom_type_invalidates_entry(tmp_path, toml_file_path, toml_loads_calls):
+    cache = DefinitionsCache(tmp_path / 'cache')
+    parse(toml_file_path, cache)
+    CUSTOM_TYPES_MAPPING['UtCacheType'] = str
+    try:
+        parse(toml_file_path, cache)
+    finally:
+        del CUSTOM_TYPES_MAPPING['UtCacheType']
+    assert len(toml_loads_calls) == 2
+
+
+def test_upgrading_library_invalidates_entry(monkeypatch, tmp_path, toml_file_path, toml_loads_calls):
+    cache = DefinitionsCache(tmp_path / 'cache')
+    parse(toml_file_path, cache)
+    monkeypatch.setattr('script_args_parser.cache._package_version', lambda: '99.0.0')
+    parse(toml_file_path, cache)
+    parse(toml_file_path, cache)
+    assert len(toml_loads_calls) == 2
+
+
+def test_cached_and_parsed_file_are_read_as_utf_8(tmp_path):
+    toml_file_path = tmp_path / 'arguments.toml'
+    definition = {'name': {'type': 'str', 'description': 'Zażółć gęślą jaźń', 'cli_arg': '--name'}}
+    toml_file_path.write_bytes(toml.dumps(definition).encode('utf-8'))
+    cache = DefinitionsCache(tmp_path / 'cache')
+    parsed = ArgumentsSchema.from_file(toml_file_path)
+    stored = ArgumentsSchema.from_file(toml_file_path, cache)
+    cached = ArgumentsSchema.from_file(toml_file_path, cache)
+    assert parsed.arguments[0].description == stored.arguments[0].description == 'Zażółć gęślą jaźń'
+    assert cached.arguments == parsed.arguments
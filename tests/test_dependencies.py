@@ -0,0 +1,112 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import pytest
+
+from script_args_parser import ArgumentsParser, ArgumentsSchema
+from script_args_parser.arguments import Argument, IntArgument, PathArgument
+from script_args_parser.dependencies import DependencyGraph
+
+
+def path_argument(
+    name: str, parent_path: Optional[str] = None, default_value: Optional[str] = None
+) -> PathArgument:
+    return PathArgument(
+        name=name,
+        description=f'{name} value',
+        type='path',
+        cli_arg=f'--{name}',
+        parent_path=parent_path,
+        default_value=default_value,
+    )
+
+
+@pytest.fixture
+def arguments_definition():
+    return [
+        path_argument('pictures_folder', default_value='./images'),
+        path_argument('picture_name', 'user_folder', 'beautiful.jpg'),
+        path_argument('user_folder', 'pictures_folder', 'the_best_user'),
+        path_argument('other_folder', default_value='other'),
+    ]
+
+
+def test_result_does_not_depend_on_definition_order(arguments_definition):
+    parser = ArgumentsParser(arguments_definition, [])
+    assert parser.picture_name == Path('images/the_best_user/beautiful.jpg')
+    parser = ArgumentsParser(list(reversed(arguments_definition)), [])
+    assert parser.picture_name == Path('images/the_best_user/beautiful.jpg')
+
+
+def test_levels(arguments_definition):
+    graph = DependencyGraph(arguments_definition)
+    assert graph.levels == [['pictures_folder', 'other_folder'], ['user_folder'], ['picture_name']]
+    assert graph.order == ['pictures_folder', 'other_folder', 'user_folder', 'picture_name']
+
+
+def test_not_defined_reference_ignored():
+    graph = DependencyGraph([path_argument('file', 'not_defined')])
+    assert graph.levels == [['file']]
+    with pytest.raises(ValueError):
+        ArgumentsParser([path_argument('file', 'not_defined', 'file.txt')], [])
+
+
+@pytest.mark.parametrize('arguments', [
+    [path_argument('first', 'first')],
+    [path_argument('first', 'second'), path_argument('second', 'first')],
+    [path_argument('first', 'third'), path_argument('second', 'first'), path_argument('third', 'second')],
+])
+def test_cycle_detected_when_schema_created(arguments):
+    with pytest.raises(ValueError, match='cycle'):
+        ArgumentsSchema(arguments)
+
+
+def test_post_process_with_executor(arguments_definition):
+    schema = ArgumentsSchema(arguments_definition)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        parser = schema.parse(['--other_folder', 'another'], executor=executor)
+    assert parser.arguments_values == {
+        'pictures_folder': Path('images'),
+        'picture_name': Path('images/the_best_user/beautiful.jpg'),
+        'user_folder': Path('images/the_best_user'),
+        'other_folder': Path('another'),
+    }
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    def __init__(self) -> None:
+        super().__init__(max_workers=2)
+        self.submitted: list[Any] = []
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> 'Future[Any]':
+        self.submitted.append(getattr(fn, '__self__', fn))
+        return super().submit(fn, *args, **kwargs)
+
+
+def test_only_post_processed_arguments_submitted(arguments_definition):
+    arguments = [
+        *arguments_definition,
+        path_argument('other_picture', 'other_folder', 'other.jpg'),
+        IntArgument(name='plain', description='Plain', type='int', cli_arg='--plain', default_value='1'),
+        IntArgument(
+            name='doubled', description='Doubled', type='int', cli_arg='--doubled', default_value='2',
+            post_operations='{value} * 2',
+        ),
+        Argument(name='name', description='Name', type='str', cli_arg='--name', default_value='name'),
+    ]
+    with RecordingExecutor() as executor:
+        parser = ArgumentsSchema(arguments).parse([], executor=executor)
+    assert [x.name for x in executor.submitted] == ['user_folder', 'other_picture']
+    assert parser.other_picture == Path('other/other.jpg')
+    assert (parser.plain, parser.doubled, parser.name) == (1, 4, 'name')
+
+
+def test_has_post_processing():
+    assert not path_argument('folder').has_post_processing
+    assert path_argument('file', 'folder').has_post_processing
+    assert not Argument(name='name', description='Name', type='str', cli_arg='--name').has_post_processing
+    assert not IntArgument(name='number', description='Number', type='int', cli_arg='--n').has_post_processing
+    assert IntArgument(
+        name='number', description='Number', type='int', cli_arg='--n', post_operations='{value} + 1',
+    ).has_post_processing
@@ -0,0 +1,89 @@
+import pickle
+
+import pytest
+
+from script_args_parser import ArgumentsParser
+from script_args_parser.arguments import IntArgument
+from script_args_parser.expressions import ArithmeticExpression
+
+
+@pytest.mark.parametrize('template, value, expected', [
+    ('{value}', 5, 5),
+    ('({value} + 3) * 10', 3, 60),
+    ('{value} * 60', 2, 120),
+    ('{value} // 4 - {value} % 4', 10, 0),
+    ('-{value} ** 2', 3, -9),
+    ('{value} ** -1 + 2 ** 100', 2, 0.5 + 2 ** 100),
+    ('({value} + 1) ** 0.5', 3, 2),
+    ('{value} / 2', 5, 2.5),
+    ('max({value}, 10)', 3, 10),
+    ('abs(round({value} / 3))', -10, 3),
+    ('  {value}+1  ', 1, 2),
+])
+def test_evaluate(template, value, expected):
+    assert ArithmeticExpression(template).evaluate(value) == expected
+
+
+@pytest.mark.parametrize('template', [
+    '__import__("os").system("echo")',
+    '{value}.__class__',
+    '[x for x in range({value})]',
+    'open("file")',
+    '"text" * {value}',
+    'True + {value}',
+    'value_2 + {value}',
+    'round({value}, ndigits=2)',
+    '{value} if {value} else 0',
+    '{value} +',
+    '{other} + 1',
+    '{value} ** 10 ** 10',
+    '{value} ** 101',
+    '{value} ** -101',
+    '{value} ** {value}',
+    '{value} ** "1"',
+    '({value} ** 100) ** 100',
+    'max({value} ** 2, 2) ** 2',
+])
+def test_not_allowed(template):
+    with pytest.raises(ValueError):
+        ArithmeticExpression(template)
+
+
+def test_pickle():
+    expression = pickle.loads(pickle.dumps(ArithmeticExpression('{value} * 2')))
+    assert expression.evaluate(4) == 8
+
+
+def test_invalid_post_operations_rejected_at_creation():
+    with pytest.raises(ValueError):
+        IntArgument(
+            name='integer',
+            description='Integer value',
+            type='int',
+            cli_arg='--some-integer',
+            post_operations='__import__("os").getcwd()',
+        )
+
+
+def test_changed_post_operations():
+    argument = IntArgument(
+        name='integer',
+        description='Integer value',
+        type='int',
+        cli_arg='--some-integer',
+        post_operations='{value} * 2',
+    )
+    assert ArgumentsParser([argument], ['--some-integer', '3']).integer == 6
+    argument.post_operations = '{value} * 3'
+    assert ArgumentsParser([argument], ['--some-integer', '3']).integer == 9
+
+
+def test_no_value_with_post_operations():
+    argument = IntArgument(
+        name='integer',
+        description='Integer value',
+        type='int',
+        cli_arg='--some-integer',
+        post_operations='{value} * 2',
+    )
+    assert ArgumentsParser([argument], []).integer is None
@@ -0,0 +1,123 @@
+from array import array
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from script_args_parser import ArgumentsParser
+from script_args_parser.arguments import argument_factory, ListArgument, ListOfTuplesArgument
+
+
+@pytest.fixture
+def ids_file(tmp_path):
+    path = tmp_path / 'ids.txt'
+    path.write_text('1\n2\n\n   \n3\r\n4')
+    return path
+
+
+@pytest.fixture
+def people_file(tmp_path):
+    path = tmp_path / 'people.txt'
+    path.write_text('John 16\n"Mary Jane" 17\n')
+    return path
+
+
+@pytest.fixture
+def arguments_definition():
+    return [
+        ListArgument(
+            name='ids',
+            description='Identifiers',
+            type='list[int]',
+            cli_arg='--ids-file',
+            env_var='UT_FROM_FILE_IDS',
+            from_file=True,
+        ),
+        ListOfTuplesArgument(
+            name='people',
+            description='People',
+            type='list[tuple[str, int]]',
+            cli_arg='--people-file',
+            from_file=True,
+        ),
+    ]
+
+
+def test_cli_values(arguments_definition, ids_file, people_file, tmp_path):
+    other_file = tmp_path / 'other_ids.txt'
+    other_file.write_text('5\n')
+    parser = ArgumentsParser(
+        arguments_definition,
+        ['--ids-file', str(ids_file), '--ids-file', str(other_file), '--people-file', str(people_file)],
+        env={},
+    )
+    assert parser.ids == [1, 2, 3, 4, 5]
+    assert parser.people == [['John', 16], ['Mary Jane', 17]]
+
+
+def test_user_values(arguments_definition, ids_file, people_file):
+    user_values = {'ids': [str(ids_file)], 'people': people_file}
+    parser = ArgumentsParser(arguments_definition, [], user_values, env={})
+    assert parser.ids == [1, 2, 3, 4]
+    assert parser.people == [['John', 16], ['Mary Jane', 17]]
+
+
+def test_env_and_default_values(arguments_definition, ids_file, people_file):
+    arguments_definition[1].default_value = str(people_file)
+    parser = ArgumentsParser(arguments_definition, [], env={'UT_FROM_FILE_IDS': str(ids_file)})
+    assert parser.ids == [1, 2, 3, 4]
+    assert parser.people == [['John', 16], ['Mary Jane', 17]]
+
+
+@pytest.mark.parametrize('container', ['iterator', 'array'])
+def test_list_container(arguments_definition, ids_file, container):
+    arguments_definition[0].container = container
+    parser = ArgumentsParser(arguments_definition, ['--ids-file', str(ids_file)], env={})
+    assert list(parser.ids) == [1, 2, 3, 4]
+    assert isinstance(parser.ids, Iterator if container == 'iterator' else array)
+
+
+def test_iterator_reads_file_on_iteration(arguments_definition, people_file):
+    arguments_definition[1].container = 'iterator'
+    parser = ArgumentsParser(arguments_definition, ['--people-file', str(people_file)], env={})
+    people_file.write_text('David 18\n')
+    assert list(parser.people) == [['David', 18]]
+    assert list(parser.people) == []
+
+
+def test_not_existing_file(arguments_definition, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ArgumentsParser(arguments_definition, ['--ids-file', str(tmp_path / 'not_existing.txt')], env={})
+
+
+@pytest.mark.parametrize('value', [12, [Path('ids.txt'), 12]])
+def test_not_path_value(arguments_definition, value):
+    with pytest.raises(TypeError):
+        ArgumentsParser(arguments_definition, [], {'ids': value}, env={})
+
+
+def test_wrong_tuple_in_file(arguments_definition, tmp_path):
+    people_file = tmp_path / 'people.txt'
+    people_file.write_text('John 16\nDavid\n')
+    with pytest.raises(RuntimeError, match='row 1'):
+        ArgumentsParser(arguments_definition, ['--people-file', str(people_file)], env={})
+
+
+def test_definition_from_toml(ids_file):
+    argument = argument_factory('ids', {
+        'type': 'list[int]', 'description': 'Identifiers', 'cli_arg': '--ids', 'from_file': 'yes',
+    })
+    assert isinstance(argument, ListArgument)
+    assert argument.from_file is True
+    assert argument.convert_value(argument.parse_value(str(ids_file))) == [1, 2, 3, 4]
+
+
+def test_not_supported_tuples_container():
+    with pytest.raises(ValueError):
+        ListOfTuplesArgument(
+            name='people',
+            description='People',
+            type='list[tuple[str]]',
+            cli_arg='--people',
+            container='array',
+        )
@@ -0,0 +1,61 @@
+import subprocess
+import sys
+
+import pytest
+
+
+DEFERRED_MODULES = [
+    'argparse', 'concurrent.futures', 'hashlib', 'logging', 'pathlib', 'pickle',
+    'script_args_parser.expressions', 'shlex', 'tempfile', 'toml', 'tomllib', 'yaml',
+]
+
+
+def imported_modules(code: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True, check=True,
+    )
+    return {
+        line.split('|')[-1].strip() for line in result.stderr.splitlines()
+        if line.startswith('import time:') and 'cumulative' not in line
+    }
+
+
+@pytest.fixture(scope='module')
+def startup_modules():
+    return imported_modules('pass')
+
+
+@pytest.mark.parametrize('code', [
+    'import script_args_parser',
+    'from script_args_parser.arguments import argument_factory',
+    'from script_args_parser import ArgumentsParser, dataclass_argument',
+])
+def test_heavy_modules_not_imported(code, startup_modules):
+    modules = imported_modules(code)
+    assert 'script_args_parser' in modules
+    assert not set(DEFERRED_MODULES) & (modules - startup_modules)
+
+
+def test_package_import_loads_no_submodules():
+    modules = imported_modules('import script_args_parser')
+    assert not [x for x in modules if x.startswith('script_args_parser.')]
+
+
+def test_modules_imported_on_use(tmp_path):
+    arguments_file = tmp_path / 'arguments.toml'
+    arguments_file.write_text('[name]\ntype = "path"\ndescription = "Path"\ncli_arg = "--name"\n')
+    modules = imported_modules(
+        'from script_args_parser import ArgumentsParser\n'
+        f'assert ArgumentsParser.from_files({str(arguments_file)!r}, ["--name", "file"]).name.name == "file"'
+    )
+    assert {'argparse', 'pathlib', 'script_args_parser.backends'} <= modules
+
+
+def test_expressions_imported_by_post_operations():
+    modules = imported_modules(
+        'from script_args_parser.arguments import argument_factory\n'
+        'definition = {"type": "int", "description": "Int", "cli_arg": "--value"}\n'
+        'definition["post_operations"] = "{value} * 2"\n'
+        'assert argument_factory("value", definition).post_process(2, {}) == 4'
+    )
+    assert 'script_args_parser.expressions' in modules
@@ -0,0 +1,198 @@
+import pickle
+from dataclasses import FrozenInstanceError
+from typing import Any
+
+import pytest
+import toml
+
+from script_args_parser import (
+    ArgumentsInterner,
+    ArgumentsParser,
+    ArgumentsSchema,
+    DefinitionsCache,
+    ParsingStats,
+)
+from script_args_parser.arguments import argument_factory, CUSTOM_TYPES_MAPPING
+
+
+COMMON_DEFINITIONS = {
+    'log_level': {
+        'type': 'str',
+        'description': 'Logging level',
+        'cli_arg': '--log-level',
+        'default_value': 'INFO',
+    },
+    'retries': {
+        'type': 'list[int]',
+        'description': 'Delays of retries',
+        'cli_arg': '--retry',
+        'default_value': [1, 2, 3],
+    },
+}
+
+
+@pytest.fixture
+def interner():
+    return ArgumentsInterner()
+
+
+@pytest.fixture
+def definitions_files(tmp_path):
+    paths = []
+    for i in range(2):
+        own_definition = {'type': 'int', 'description': 'Own', 'cli_arg': '--own'}
+        definitions = {**COMMON_DEFINITIONS, f'own_{i}': own_definition}
+        path = tmp_path / f'arguments_{i}.toml'
+        path.write_text(toml.dumps(definitions))
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def custom_type():
+    yield 'UtInterningType'
+    CUSTOM_TYPES_MAPPING.pop('UtInterningType', None)
+
+
+def definition(**kwargs: Any) -> dict[str, Any]:
+    return {'type': 'str', 'description': 'Description', 'cli_arg': '--arg', **kwargs}
+
+
+def test_identical_definitions_share_argument(interner):
+    first = interner.get_argument('name', definition(default_value='value'))
+    second = interner.get_argument('name', definition(default_value='value'))
+    assert first is second
+    assert len(interner) == 1
+
+
+@pytest.mark.parametrize('name, other_definition', [
+    ('other_name', definition()),
+    ('name', definition(default_value='other')),
+    ('name', definition(type='int')),
+    ('name', definition(default_value=1)),
+])
+def test_different_definitions_do_not_share_argument(interner, name, other_definition):
+    first = interner.get_argument('name', definition(default_value=True))
+    second = interner.get_argument(name, other_definition)
+    assert first is not second
+    assert len(interner) == 2
+
+
+def test_order_of_definition_keys_does_not_matter(interner):
+    first = interner.get_argument('name', {'type': 'str', 'description': 'Description', 'cli_arg': '--arg'})
+    second = interner.get_argument('name', {'cli_arg': '--arg', 'description': 'Description', 'type': 'str'})
+    assert first is second
+
+
+def test_not_hashable_value_is_not_shared(interner):
+    first = interner.get_argument('name', definition(default_value={'a'}))
+    second = interner.get_argument('name', definition(default_value={'a'}))
+    assert first is not second
+    assert first == second
+    assert interner.intern(first) is first
+
+
+def test_equal_arguments_are_interned(interner):
+    shared = interner.get_argument('name', definition(default_value=['a', 'b']))
+    toml_string = toml.dumps({'name': definition(default_value=['a', 'b'])})
+    created = ArgumentsSchema._parse_toml_definitions(toml_string)
+    assert created[0] is not shared
+    assert interner.intern_all(created) == [shared]
+    assert interner.intern_all(created)[0] is shared
+
+
+def test_schemas_share_arguments(interner, definitions_files):
+    first, second = (ArgumentsSchema.from_file(x, interner=interner) for x in definitions_files)
+    assert first.arguments_by_name['log_level'] is second.arguments_by_name['log_level']
+    assert first.arguments_by_name['retries'] is second.arguments_by_name['retries']
+    assert first.arguments_by_name['own_0'] is not second.arguments_by_name['own_1']
+    assert len(interner) == 4
+
+
+def test_parsing_with_shared_arguments(interner, definitions_files):
+    first = ArgumentsParser.from_files(definitions_files[0], ['--retry', '5'], interner=interner)
+    second = ArgumentsParser.from_files(definitions_files[1], ['--own', '3'], interner=interner)
+    assert (first.log_level, first.retries, first.own_0) == ('INFO', [5], None)
+    assert (second.log_level, second.retries, second.own_1) == ('INFO', [1, 2, 3], 3)
+
+
+def test_cached_arguments_are_interned(interner, definitions_files, tmp_path):
+    cache = DefinitionsCache(tmp_path / 'cache')
+    ArgumentsSchema.from_file(definitions_files[0], cache)
+    cached = ArgumentsSchema.from_file(definitions_files[0], cache, interner=interner)
+    created = ArgumentsSchema.from_file(definitions_files[1], interner=interner)
+    assert cached.arguments_by_name['log_level'] is created.arguments_by_name['log_level']
+
+
+def test_registering_types_drops_interned_arguments(interner, custom_type):
+    first = interner.get_argument('name', definition())
+    CUSTOM_TYPES_MAPPING[custom_type] = str
+    assert interner.get_argument('name', definition()) is not first
+
+
+def test_clear(interner):
+    first = interner.get_argument('name', definition())
+    interner.clear()
+    assert len(interner) == 0
+    assert interner.get_argument('name', definition()) is not first
+
+
+def test_measured_loading_shares_arguments(interner, definitions_files):
+    stats = ParsingStats()
+    first, second = (ArgumentsSchema.from_file(x, stats=stats, interner=interner) for x in definitions_files)
+    assert first.arguments_by_name['log_level'] is second.arguments_by_name['log_level']
+    assert stats.stages['create_arguments'].calls == 2
+
+
+@pytest.mark.parametrize('field, value', [
+    ('default_value', 'other'), ('env_var', 'UT_OTHER'), ('required', True),
+])
+def test_interned_argument_cannot_be_modified(interner, definitions_files, field, value):
+    first, second = (ArgumentsSchema.from_file(x, interner=interner) for x in definitions_files)
+    argument = first.arguments_by_name['log_level']
+    options = argument.argparse_options
+    with pytest.raises(FrozenInstanceError):
+        setattr(argument, field, value)
+    with pytest.raises(FrozenInstanceError):
+        delattr(argument, field)
+    assert second.arguments_by_name['log_level'].argparse_options is options
+    assert second.parse([], env={'UT_OTHER': 'other'}).log_level == 'INFO'
+
+
+def test_not_interned_argument_can_be_modified(interner):
+    interner.get_argument('name', definition())
+    argument = argument_factory('name', definition())
+    argument.default_value = 'other'
+    assert argument.default_value == 'other'
+
+
+@pytest.mark.parametrize('arg_type', ['str', 'int', 'switch', 'list[int]', 'list[tuple[str, int]]'])
+def test_interned_argument_behaves_like_created_one(interner, arg_type):
+    created = argument_factory('name', definition(type=arg_type))
+    interned = interner.get_argument('name', definition(type=arg_type))
+    assert isinstance(interned, type(created))
+    assert interned == created and created == interned
+    assert interned != argument_factory('other', definition(type=arg_type))
+    assert repr(interned) == repr(created)
+    assert interned.argparse_options == created.argparse_options
+    assert interned.converters == created.converters
+    unpickled = pickle.loads(pickle.dumps(interned))
+    assert type(unpickled) is type(created)
+    assert unpickled == interned
+    unpickled.default_value = 'other'
+
+
+def test_interning_interned_argument(interner):
+    argument = interner.get_argument('name', definition())
+    assert interner.intern(argument) is argument
+    assert interner.intern(argument_factory('name', definition())) is argument
+    assert len(interner) == 1
+
+
+def test_interned_arguments_stored_in_cache(interner, definitions_files, tmp_path):
+    cache = DefinitionsCache(tmp_path / 'cache')
+    first = ArgumentsSchema.from_file(definitions_files[0], cache, interner=interner)
+    assert len(list((tmp_path / 'cache').iterdir())) == 1
+    second = ArgumentsSchema.from_file(definitions_files[0], cache, interner=interner)
+    assert second.arguments == first.arguments
+    assert second.arguments_by_name['retries'] is first.arguments_by_name['retries']
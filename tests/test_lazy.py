@@ -0,0 +1,121 @@
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from script_args_parser import ArgumentsParser, ArgumentsSchema
+from script_args_parser.arguments import Argument, CUSTOM_TYPES_MAPPING, IntArgument, PathArgument
+
+
+@pytest.fixture
+def converted_values() -> Generator[list[str], None, None]:
+    converted: list[str] = []
+
+    def counting_converter(value):
+        converted.append(value)
+        return value.upper()
+    CUSTOM_TYPES_MAPPING['UtCountedType'] = counting_converter
+    yield converted
+    del CUSTOM_TYPES_MAPPING['UtCountedType']
+
+
+@pytest.fixture
+def schema():
+    return ArgumentsSchema([
+        Argument(
+            name='counted',
+            description='Value of custom type',
+            type='UtCountedType',
+            cli_arg='--counted',
+            default_value='counted value',
+        ),
+        IntArgument(
+            name='broken',
+            description='Value that cannot be converted',
+            type='int',
+            cli_arg='--broken',
+            default_value='not a number',
+        ),
+        PathArgument(
+            name='file',
+            description='Path with parent',
+            type='path',
+            cli_arg='--file',
+            parent_path='folder',
+            default_value='file.txt',
+        ),
+        PathArgument(
+            name='folder',
+            description='Parent path',
+            type='path',
+            cli_arg='--folder',
+            default_value='folder',
+        ),
+        Argument(
+            name='required',
+            description='Required value',
+            type='str',
+            cli_arg='--required',
+            required=True,
+        ),
+    ])
+
+
+def test_eager_mode_converts_everything(schema, converted_values):
+    with pytest.raises(ValueError):
+        schema.parse([], env={})
+
+
+def test_not_accessed_values_not_resolved(schema, converted_values):
+    parser = schema.parse([], env={}, lazy=True)
+    assert parser.arguments_values == {}
+    assert converted_values == []
+
+
+def test_value_resolved_once(schema, converted_values):
+    parser = schema.parse(['--counted', 'from cli'], env={}, lazy=True)
+    assert parser.counted == 'FROM CLI'
+    assert parser.counted == 'FROM CLI'
+    assert converted_values == ['from cli']
+    assert parser.arguments_values == {'counted': 'FROM CLI'}
+
+
+def test_conversion_error_raised_on_access(schema):
+    parser = schema.parse([], env={}, lazy=True)
+    with pytest.raises(ValueError):
+        parser.broken
+
+
+def test_dependencies_resolved(schema):
+    parser = ArgumentsParser(schema, ['--folder', 'root'], env={}, lazy=True)
+    assert parser.file == Path('root/file.txt')
+    assert parser.arguments_values == {'folder': Path('root'), 'file': Path('root/file.txt')}
+
+
+def test_required_not_validated_until_access(schema):
+    parser = schema.parse([], env={}, lazy=True)
+    with pytest.raises(RuntimeError):
+        parser.required
+
+
+def test_validate_required(schema, converted_values):
+    parser = schema.parse([], env={}, lazy=True)
+    with pytest.raises(RuntimeError):
+        parser.validate_required()
+    parser = schema.parse(['--required', 'value'], env={}, lazy=True)
+    parser.validate_required()
+    assert converted_values == []
+    assert parser.arguments_values == {}
+
+
+def test_setattr_before_access(schema):
+    parser = schema.parse([], env={}, lazy=True)
+    parser.broken = 10
+    assert parser.broken == 10
+    assert parser.arguments_values == {'broken': 10}
+
+
+def test_unknown_attribute(schema):
+    parser = schema.parse([], env={}, lazy=True)
+    with pytest.raises(AttributeError):
+        parser.not_existing
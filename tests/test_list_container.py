@@ -0,0 +1,101 @@
+from array import array
+from importlib.util import find_spec
+
+import pytest
+
+from script_args_parser import ArgumentsParser
+from script_args_parser.arguments import argument_factory, ListArgument
+
+
+@pytest.fixture
+def arguments_definition():
+    return [
+        ListArgument(
+            name='ids',
+            description='Identifiers',
+            type='list[int]',
+            cli_arg='--id',
+            env_var='UT_CONTAINER_IDS',
+            container='array',
+        ),
+        ListArgument(
+            name='flags',
+            description='Flags',
+            type='list[bool]',
+            cli_arg='--flag',
+            container='array',
+        ),
+    ]
+
+
+def test_default_container():
+    argument = argument_factory('ids', {'type': 'list[int]', 'description': 'Identifiers', 'cli_arg': '--id'})
+    assert argument.convert_value(['1', '2']) == [1, 2]
+
+
+def test_container_from_definition():
+    argument = argument_factory('ids', {
+        'type': 'list[int]', 'description': 'Identifiers', 'cli_arg': '--id', 'container': 'array',
+    })
+    assert isinstance(argument, ListArgument)
+    assert argument.container == 'array'
+
+
+def test_cli_values(arguments_definition):
+    parser = ArgumentsParser(
+        arguments_definition, ['--id', '1', '--id', '-2', '--flag', 'yes', '--flag', 'no'], env={},
+    )
+    assert parser.ids == array('q', [1, -2])
+    assert parser.flags == array('B', [1, 0])
+    assert memoryview(parser.ids).nbytes == 16
+
+
+def test_user_values(arguments_definition):
+    parser = ArgumentsParser(arguments_definition, [], {'ids': [1, 2, 3], 'flags': [True, False]}, env={})
+    assert parser.ids == array('q', [1, 2, 3])
+    assert parser.flags == array('B', [1, 0])
+
+
+def test_semicolon_separated_values(arguments_definition):
+    parser = ArgumentsParser(arguments_definition, [], env={'UT_CONTAINER_IDS': '10; 20; 30'})
+    assert parser.ids == array('q', [10, 20, 30])
+    assert parser.flags is None
+
+
+def test_empty_list(arguments_definition):
+    parser = ArgumentsParser(arguments_definition, [], {'ids': []}, env={})
+    assert parser.ids == array('q')
+
+
+def test_value_out_of_range(arguments_definition):
+    with pytest.raises(OverflowError):
+        ArgumentsParser(arguments_definition, ['--id', str(2**63)], env={})
+
+
+@pytest.mark.parametrize('items_type, container', [
+    ('int', 'tuple'),
+    ('str', 'array'),
+    ('path', 'numpy'),
+])
+def test_not_supported_container(items_type, container):
+    with pytest.raises(ValueError):
+        ListArgument(
+            name='list', description='List', type=f'list[{items_type}]', cli_arg='--item',
+            container=container,
+        )
+
+
+@pytest.mark.skipif(find_spec('numpy') is not None, reason='numpy is installed')
+def test_numpy_not_installed():
+    with pytest.raises(ValueError):
+        ListArgument(name='list', description='List', type='list[int]', cli_arg='--item', container='numpy')
+
+
+def test_numpy_container():
+    numpy = pytest.importorskip('numpy')
+    argument = ListArgument(
+        name='list', description='List', type='list[int]', cli_arg='--item', container='numpy',
+    )
+    converted = argument.convert_value(argument.parse_value('1; 2; 3'))
+    assert converted.dtype == numpy.int64
+    assert converted.tolist() == [1, 2, 3]
@@ -110,6 +110,24 @@ def test_no_cli_default_too_much_values(arguments_definition):
         ArgumentsParser(arguments_definition, cli)
 
 
+def test_wrong_number_of_values_reports_row(arguments_definition):
+    arguments_definition[0].default_value = 'v1 1 v2; v3 2 v4; v5 3; v6 4 v7'
+    with pytest.raises(RuntimeError, match=r"got 2 in row 2: \['v5', '3'\]"):
+        ArgumentsParser(arguments_definition, [], env={})
+
+
+def test_many_rows(arguments_definition):
+    arguments_definition[0].default_value = ';'.join(f'name{i} {i} "value {i}"' for i in range(10_000))
+    parser = ArgumentsParser(arguments_definition, [], env={})
+    assert parser.arguments_values['list_of_tuples'] == [[f'name{i}', i, f'value {i}'] for i in range(10_000)]
+
+
+def test_user_values_with_incomplete_rows(arguments_definition):
+    user_values = {'list_of_tuples': [['v1', '1', 'v2'], ['v3'], ['v4', '2', 'v5']]}
+    parser = ArgumentsParser(arguments_definition, [], user_values, env={})
+    assert parser.arguments_values['list_of_tuples'] == [['v1', 1, 'v2'], ['v3'], ['v4', 2, 'v5']]
+
+
 def test_no_cli_default_set_single_empty_tuple(arguments_definition_str):
     arguments_definition_str[0].default_value = 'v1;;v2'
     cli: list[str] = []
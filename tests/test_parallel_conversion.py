@@ -0,0 +1,214 @@
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import get_context
+from pathlib import Path
+
+import pytest
+
+from script_args_parser import ArgumentsParser, CUSTOM_TYPES_MAPPING, dataclass_argument, parallel_converter
+from script_args_parser.arguments import (
+    Argument,
+    argument_factory,
+    ListArgument,
+    ListOfTuplesArgument,
+    TupleArgument,
+)
+from script_args_parser.decorators import is_parallel_converter
+
+
+@parallel_converter
+def slow_upper(value):
+    time.sleep(0.01)
+    return value.upper()
+
+
+@parallel_converter
+def checked_int(value):
+    if (delay := float(value)) < 0:
+        raise ValueError(f'Negative value: {value}')
+    time.sleep(delay)
+    return int(delay)
+
+
+@parallel_converter
+def thread_name(value):
+    return threading.current_thread().name
+
+
+def sequential_thread_name(value):
+    return threading.current_thread().name
+
+
+@dataclass_argument(parallel=True)
+@dataclass
+class ParallelDataClass:
+    value: str
+
+
+@dataclass_argument
+@dataclass
+class SequentialDataClass:
+    value: str
+
+
+@pytest.fixture(autouse=True)
+def converters():
+    CUSTOM_TYPES_MAPPING.update({
+        'upper': slow_upper, 'checked_int': checked_int, 'thread_name': thread_name,
+        'sequential_thread_name': sequential_thread_name,
+    })
+    yield
+    for name in ['upper', 'checked_int', 'thread_name', 'sequential_thread_name']:
+        del CUSTOM_TYPES_MAPPING[name]
+
+
+@pytest.fixture
+def arguments():
+    return [
+        Argument(name='first', description='Parallel value', type='upper', cli_arg='--first'),
+        Argument(name='second', description='Sequential value', type='str', cli_arg='--second'),
+        ListArgument(name='third', description='Parallel list', type='list[upper]', cli_arg='--third'),
+        TupleArgument(
+            name='fourth',
+            description='Parallel tuple',
+            type='tuple[upper, ParallelDataClass]',
+            cli_arg='--fourth',
+        ),
+        Argument(name='fifth', description='Not given value', type='upper', cli_arg='--fifth'),
+    ]
+
+
+@pytest.fixture
+def user_values():
+    return {
+        'first': 'one',
+        'second': 'two',
+        'third': ['three', 'four'],
+        'fourth': ['five', {'value': 'six'}],
+    }
+
+
+def test_markers():
+    assert is_parallel_converter(slow_upper)
+    assert is_parallel_converter(CUSTOM_TYPES_MAPPING['ParallelDataClass'])
+    assert not is_parallel_converter(CUSTOM_TYPES_MAPPING['SequentialDataClass'])
+    assert not is_parallel_converter(str)
+
+
+def test_same_values_as_sequential(arguments, user_values):
+    expected = ArgumentsParser(arguments, [], user_values, env={}).arguments_values
+    with ThreadPoolExecutor(4) as executor:
+        parser = ArgumentsParser(arguments, [], user_values, env={}, executor=executor)
+    assert parser.arguments_values == expected
+    assert list(parser.arguments_values) == ['first', 'second', 'third', 'fourth', 'fifth']
+    assert parser.fourth == ['FIVE', ParallelDataClass('six')]
+
+
+def test_only_marked_converters_on_executor():
+    arguments = [
+        Argument(name='parallel', description='Parallel', type='thread_name', cli_arg='--parallel'),
+        ListOfTuplesArgument(
+            name='mixed', description='Mixed', type='list[tuple[thread_name, sequential_thread_name]]',
+            cli_arg='--mixed',
+        ),
+        ListOfTuplesArgument(
+            name='built_in', description='With built-in', type='list[tuple[str, thread_name, int, bool]]',
+            cli_arg='--built-in',
+        ),
+    ]
+    cli_params = ['--parallel', 'x', '--mixed', 'a', 'b', '--built-in', 'a', 'b', '1', 'yes']
+    with ThreadPoolExecutor(1, thread_name_prefix='converter') as executor:
+        parser = ArgumentsParser(arguments, cli_params, env={}, executor=executor)
+    assert parser.parallel.startswith('converter')
+    assert parser.mixed == [[threading.current_thread().name] * 2]
+    assert parser.built_in[0][0] == 'a' and parser.built_in[0][2:] == [1, True]
+    assert parser.built_in[0][1].startswith('converter')
+
+
+@pytest.mark.parametrize('definition, parallel_convertible', [
+    ({'type': 'thread_name'}, True),
+    ({'type': 'tuple[str, ParallelDataClass, path]'}, True),
+    ({'type': 'list[str]'}, False),
+    ({'type': 'tuple[thread_name, SequentialDataClass]'}, False),
+    ({'type': 'switch'}, False),
+    ({'type': 'Path'}, False),
+    ({'type': 'Int', 'post_operations': '{value} + 1'}, False),
+])
+def test_parallel_convertible(definition, parallel_convertible):
+    argument = argument_factory('name', {'description': 'Description', 'cli_arg': '--name', **definition})
+    assert argument.parallel_convertible is parallel_convertible
+
+
+def test_not_registered_type_not_parallel():
+    argument = Argument(name='name', description='Not registered', type='not_registered', cli_arg='--name')
+    assert not argument.parallel_convertible
+
+
+def test_types_without_types_mapping_converters(arguments, user_values):
+    arguments += [
+        argument_factory('switch', {'type': 'switch', 'description': 'Switch', 'cli_arg': '--switch'}),
+        argument_factory('file', {'type': 'Path', 'description': 'Path', 'cli_arg': '--file'}),
+        argument_factory('count', {
+            'type': 'Int', 'description': 'Int', 'cli_arg': '--count', 'post_operations': '{value} * 2',
+        }),
+    ]
+    cli_params = ['--switch', '--file', 'file.txt', '--count', '2']
+    expected = ArgumentsParser(arguments, cli_params, user_values, env={}).arguments_values
+    with ThreadPoolExecutor(2) as executor:
+        parser = ArgumentsParser(arguments, cli_params, user_values, env={}, executor=executor)
+    assert parser.arguments_values == expected
+    assert (parser.switch, parser.file, parser.count) == (True, Path('file.txt'), 4)
+
+
+def test_errors_in_definition_order():
+    arguments = [
+        Argument(name=name, description='Delay', type='checked_int', cli_arg=f'--{name}')
+        for name in ['slow', 'fast']
+    ]
+    with ThreadPoolExecutor(2) as executor:
+        with pytest.raises(ValueError, match='-0.05'):
+            ArgumentsParser(arguments, ['--slow', '-0.05', '--fast', '-1'], env={}, executor=executor)
+
+
+def test_parsing_error_raised_in_order(arguments):
+    arguments[0].type = 'checked_int'
+    with ThreadPoolExecutor(2) as executor:
+        with pytest.raises(ValueError, match='Negative'):
+            ArgumentsParser(arguments, ['--first', '-1'], {'fourth': 'one'}, env={}, executor=executor)
+        with pytest.raises(RuntimeError, match='fourth'):
+            ArgumentsParser(arguments, [], {'fourth': 'one'}, env={}, executor=executor)
+
+
+def test_missing_required_value(arguments):
+    arguments[0].required = True
+    with ThreadPoolExecutor(2) as executor:
+        with pytest.raises(RuntimeError, match='first'):
+            ArgumentsParser(arguments, [], env={}, executor=executor)
+
+
+def test_required_value_converted_to_none(arguments):
+    CUSTOM_TYPES_MAPPING['none'] = parallel_converter(lambda x: None)
+    arguments[0].type = 'none'
+    arguments[0].required = True
+    try:
+        with ThreadPoolExecutor(2) as executor:
+            with pytest.raises(RuntimeError, match='first'):
+                ArgumentsParser(arguments, ['--first', 'value'], env={}, executor=executor)
+    finally:
+        del CUSTOM_TYPES_MAPPING['none']
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='converters are inherited by forked workers')
+def test_process_pool(arguments, user_values):
+    with ProcessPoolExecutor(2, mp_context=get_context('fork')) as executor:
+        parser = ArgumentsParser(arguments, [], user_values, env={}, executor=executor)
+    assert parser.arguments_values == {
+        'first': 'ONE',
+        'second': 'two',
+        'third': ['THREE', 'FOUR'],
+        'fourth': ['FIVE', ParallelDataClass('six')],
+        'fifth': None,
+    }
@@ -0,0 +1,149 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+import toml
+import yaml
+
+from script_args_parser import ArgumentsParser, ArgumentsSchema, DefinitionsCache, ParsingStats
+from script_args_parser.arguments import Argument, IntArgument, PathArgument
+from script_args_parser.profiling import measure_stage, StageStats
+
+
+ARGUMENTS_STAGES = ['fallback', 'parse', 'convert', 'post_process']
+
+
+@pytest.fixture
+def arguments():
+    return [
+        Argument(
+            name='name',
+            description='String value',
+            type='str',
+            cli_arg='--name',
+        ),
+        IntArgument(
+            name='count',
+            description='Integer value',
+            type='int',
+            cli_arg='--count',
+            default_value='2',
+            post_operations='{value} * 2',
+        ),
+        PathArgument(
+            name='file',
+            description='Path value',
+            type='path',
+            cli_arg='--file',
+            default_value='file.txt',
+            parent_path='folder',
+        ),
+        PathArgument(
+            name='folder',
+            description='Parent path',
+            type='path',
+            cli_arg='--folder',
+            default_value='folder',
+        ),
+    ]
+
+
+@pytest.fixture
+def files(tmp_path):
+    arguments_file = tmp_path / 'arguments.toml'
+    arguments_file.write_text(toml.dumps({
+        'name': {'type': 'str', 'description': 'String value', 'cli_arg': '--name'},
+        'count': {'type': 'int', 'description': 'Integer value', 'cli_arg': '--count'},
+    }))
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text(yaml.dump({'count': 3}))
+    return arguments_file, config_file
+
+
+def test_record():
+    stats = ParsingStats()
+    stats.record('parse', 1.5, 'first')
+    stats.record('parse', 0.5, 'second')
+    stats.record('read_cli', 2.0)
+    assert stats.stages == {'parse': StageStats(2.0, 2), 'read_cli': StageStats(2.0, 1)}
+    assert stats.arguments == {
+        'first': {'parse': StageStats(1.5, 1)},
+        'second': {'parse': StageStats(0.5, 1)},
+    }
+
+
+def test_measure_records_on_error():
+    stats = ParsingStats()
+    with pytest.raises(ValueError):
+        with stats.measure('convert', 'first'):
+            raise ValueError()
+    assert stats.stages['convert'].calls == 1
+    assert stats.arguments['first']['convert'].calls == 1
+
+
+def test_measure_stage_without_stats():
+    with measure_stage(None, 'parse', 'first'):
+        pass
+
+
+def test_parser_stats(arguments):
+    stats = ParsingStats()
+    parser = ArgumentsParser(arguments, ['--name', 'value'], env={}, stats=stats)
+    assert parser.count == 4
+    assert set(stats.stages) == {
+        'create_schema', 'read_cli', 'resolve_values', *ARGUMENTS_STAGES, 'post_process_values',
+    }
+    assert all(x.seconds >= 0 for x in stats.stages.values())
+    assert stats.stages['parse'].calls == 4
+    assert stats.stages['resolve_values'].calls == 1
+    assert list(stats.arguments) == ['name', 'count', 'file', 'folder']
+    assert all(list(x) == ARGUMENTS_STAGES for x in stats.arguments.values())
+
+
+def test_not_resolved_values_not_parsed(arguments):
+    stats = ParsingStats()
+    ArgumentsParser(arguments, [], env={}, stats=stats)
+    assert 'parse' not in stats.arguments['name']
+    assert stats.arguments['name']['fallback'].calls == 1
+
+
+def test_lazy_parser_stats(arguments):
+    stats = ParsingStats()
+    parser = ArgumentsSchema(arguments).parse([], env={}, lazy=True, stats=stats)
+    assert list(stats.stages) == ['read_cli']
+    assert parser.file == Path('folder/file.txt')
+    assert list(stats.arguments) == ['folder', 'file']
+
+
+def test_executor_stats(arguments):
+    stats = ParsingStats()
+    with ThreadPoolExecutor(2) as executor:
+        ArgumentsParser(arguments, [], env={}, executor=executor, stats=stats)
+    assert stats.stages['post_process'].calls == 4
+
+
+def test_from_files_stats(files):
+    arguments_file, config_file = files
+    stats = ParsingStats()
+    parser = ArgumentsParser.from_files(arguments_file, [], config_file, stats=stats)
+    assert parser.count == 3
+    assert {'read_file', 'load_toml', 'create_arguments', 'create_schema', 'load_yaml'} <= set(stats.stages)
+    assert stats.stages['create_arguments'].calls == 1
+
+
+def test_from_files_cached_stats(tmp_path, files):
+    arguments_file, config_file = files
+    cache = DefinitionsCache(tmp_path / 'cache')
+    ArgumentsParser.from_files(arguments_file, [], config_file, cache)
+    stats = ParsingStats()
+    ArgumentsParser.from_files(arguments_file, [], config_file, cache, stats=stats)
+    assert 'load_cached_definitions' in stats.stages
+    assert 'load_toml' not in stats.stages
+
+
+def test_as_dict(arguments):
+    stats = ParsingStats()
+    ArgumentsParser(arguments, ['--name', 'value'], env={}, stats=stats)
+    stats_dict = stats.as_dict()
+    assert stats_dict['stages']['parse'] == {'seconds': stats.stages['parse'].seconds, 'calls': 4}
+    assert stats_dict['arguments']['count']['post_process']['calls'] == 1
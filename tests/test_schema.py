@@ -0,0 +1,114 @@
+import os
+from tempfile import NamedTemporaryFile
+
+import pytest
+import toml
+
+from script_args_parser import ArgumentsParser, ArgumentsSchema
+from script_args_parser.arguments import Argument, IntArgument, ListArgument
+
+
+@pytest.fixture
+def schema():
+    return ArgumentsSchema([
+        Argument(
+            name='name',
+            description='String value',
+            type='str',
+            cli_arg='--name',
+            env_var='UT_SCHEMA_NAME',
+            default_value='default name',
+        ),
+        IntArgument(
+            name='count',
+            description='Integer value',
+            type='int',
+            cli_arg='--count',
+            default_value='0',
+            post_operations='{value} * 2',
+        ),
+        ListArgument(
+            name='items',
+            description='List value',
+            type='list[int]',
+            cli_arg='--item',
+        ),
+    ])
+
+
+def test_parse_many_times(schema):
+    first = schema.parse(['--name', 'first', '--count', '1', '--item', '1', '--item', '2'], env={})
+    second = schema.parse([], {'count': 5, 'items': '3; 4'}, env={})
+    assert first.arguments_values == {'name': 'first', 'count': 2, 'items': [1, 2]}
+    assert second.arguments_values == {'name': 'default name', 'count': 10, 'items': [3, 4]}
+    assert first._schema is second._schema is schema
+
+
+@pytest.mark.parametrize('name', ['env', 'schema', 'lazy', 'executor', 'stats'])
+def test_argument_named_like_parser_state(name):
+    schema = ArgumentsSchema([
+        Argument(name=name, description='String value', type='str', cli_arg='--value'),
+        IntArgument(name='count', description='Integer value', type='int', cli_arg='--count'),
+    ])
+    parser = schema.parse(['--value', 'given', '--count', '1'], env={})
+    assert getattr(parser, name) == 'given'
+    setattr(parser, name, 'changed')
+    assert parser.arguments_values[name] == 'changed'
+    assert getattr(schema.parse([], {name: 'user value'}, env={}, lazy=True), name) == 'user value'
+
+
+def test_cli_parser_reused(schema):
+    cli_parser = schema.cli_parser
+    schema.parse(['--name', 'first'], env={})
+    schema.parse(['--name', 'second'], env={})
+    assert schema.cli_parser is cli_parser
+
+
+def test_no_cli_params_many_times(schema):
+    first = schema.read_cli_arguments([])
+    first['name'] = 'changed'
+    assert schema.read_cli_arguments([]) == {'name': None, 'count': None, 'items': None}
+    assert schema.parse([], {'count': 1}, env={}).count == 2
+    assert schema.parse([], env={}).count == 0
+
+
+def test_env_given(schema):
+    parser = schema.parse([], env={'UT_SCHEMA_NAME': 'from env'})
+    assert parser.name == 'from env'
+
+
+def test_env_not_given(schema):
+    old_environ = dict(os.environ)
+    os.environ['UT_SCHEMA_NAME'] = 'from os env'
+    try:
+        parser = schema.parse([])
+    finally:
+        os.environ.clear()
+        os.environ.update(old_environ)
+    assert parser.name == 'from os env'
+
+
+def test_parser_created_from_schema(schema):
+    parser = ArgumentsParser(schema, ['--count', '3'], env={})
+    assert parser.count == 6
+    assert parser.arguments is schema.arguments
+
+
+def test_from_file():
+    mappings = {
+        'first_arg': {
+            'type': 'int',
+            'description': 'Some fancy description',
+            'cli_arg': '--cli-option-name',
+            'default_value': '7',
+        }
+    }
+    toml_file = NamedTemporaryFile(mode='w', delete=False)
+    try:
+        toml.dump(mappings, toml_file)
+        toml_file.close()
+        schema = ArgumentsSchema.from_file(toml_file.name)
+    finally:
+        os.unlink(toml_file.name)
+    assert schema.parse([]).first_arg == 7
+    assert schema.parse(['--cli-option-name', '8']).first_arg == 8
@@ -0,0 +1,224 @@
+import random
+import shlex
+from typing import Any
+
+import pytest
+
+from script_args_parser.tokenizers import (
+    split_by_semicolon,
+    split_list_items,
+    split_records,
+    split_shell_words,
+)
+
+
+def legacy_split_by_semicolon(argument_value: str) -> list[Any]:
+    """
+    Reference implementation based on shlex, that was used before.
+
+    :param argument_value: string to be split
+    :return: list of found items
+    """
+    if argument_value == '':
+        return ['']
+    argument_value = ' ' + argument_value + ' '
+    while argument_value.find(';;') != -1:
+        argument_value = argument_value.replace(';;', '; ;', 1)
+    parser = shlex.shlex(argument_value)
+    parser.whitespace_split = True
+    parser.whitespace = ';'
+    return list(parser)
+
+
+def legacy_split_list_items(argument_value: str) -> list[str]:
+    """
+    Reference implementation of list items unquoting, that was used before.
+
+    :param argument_value: string to be split
+    :return: list of found items
+    """
+    ret_val = []
+    for value in split_by_semicolon(argument_value):
+        parsed_value = shlex.split(value)
+        ret_val.append(parsed_value[0] if parsed_value else '')
+    return ret_val
+
+
+def legacy_split_records(argument_value: str) -> list[list[str]]:
+    """
+    Reference implementation of splitting list of tuples, that was used before.
+
+    :param argument_value: string to be split
+    :return: list of found records
+    """
+    return [shlex.split(value) or [''] for value in split_by_semicolon(argument_value)]
+
+
+def assert_same_result(function: Any, reference: Any, argument_value: str) -> None:
+    try:
+        expected = reference(argument_value)
+    except ValueError as ex:
+        with pytest.raises(ValueError, match=str(ex)):
+            function(argument_value)
+    else:
+        assert function(argument_value) == expected
+
+
+def assert_same_as_legacy(argument_value: str) -> None:
+    try:
+        expected = legacy_split_by_semicolon(argument_value)
+    except ValueError as ex:
+        with pytest.raises(ValueError, match=str(ex)):
+            split_by_semicolon(argument_value)
+    else:
+        assert split_by_semicolon(argument_value) == expected
+
+
+@pytest.mark.parametrize('argument_value', [
+    '',
+    ' ',
+    ';',
+    ';;',
+    ';;;;',
+    'a',
+    'a;b',
+    'a; b ;c',
+    'a;;b',
+    'a;;;b',
+    ';a;',
+    "John; David; 'Some;Very;Strange;Name'",
+    "a;'b;c'",
+    "a;'b;;c'd;e",
+    'a;"b c";d',
+    "a;'b\"c';d",
+    "a;\"b'c\";d",
+    "a;b'c;d'",
+    'a#b;c',
+    'a;#b;c\nd;e',
+    'a;b#c\nd;e',
+    'a;b#c',
+    "a;'b#c';d",
+    "a;'b\nc';d",
+    'a\n;b\t;\rc',
+])
+def test_known_values(argument_value):
+    assert_same_as_legacy(argument_value)
+
+
+@pytest.mark.parametrize('argument_value', [
+    "a;'b",
+    'a;"b;c',
+    ";'",
+])
+def test_no_closing_quotation(argument_value):
+    with pytest.raises(ValueError, match='No closing quotation'):
+        split_by_semicolon(argument_value)
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_random_values(seed):
+    randomizer = random.Random(seed)
+    alphabet = ['a', 'b', 'xyz', ' ', ';', ';', ';;', "'", '"', '#', '\n', '\t']
+    for _ in range(200):
+        argument_value = ''.join(randomizer.choices(alphabet, k=randomizer.randint(0, 20)))
+        assert_same_as_legacy(argument_value)
+
+
+def test_long_value():
+    argument_value = ';'.join(f"item {i}; 'quoted;{i}';;" for i in range(2000))
+    assert split_by_semicolon(argument_value) == legacy_split_by_semicolon(argument_value)
+
+
+SHELL_VALUES = [
+    '',
+    ' \t\r\n ',
+    'a b  c',
+    ' padded ',
+    "'quoted value'",
+    '"double quoted"',
+    "''",
+    '""',
+    "a'b c'd",
+    'a"b c"d',
+    'a\\ b',
+    '"a\\"b"',
+    '"a\\b\\\\c"',
+    "'a\\b'",
+    '\\\n',
+    'a\x0bb',
+    "'unclosed",
+    '"unclosed',
+    '"unclosed\\"',
+    '"escaped\\',
+    '"escaped\\\\',
+    '"escaped\\\n',
+    'trailing\\',
+    "a 'b",
+]
+
+
+@pytest.mark.parametrize('value', SHELL_VALUES)
+def test_shell_words_known_values(value):
+    assert_same_result(split_shell_words, shlex.split, value)
+
+
+@pytest.mark.parametrize('argument_value', [
+    *SHELL_VALUES,
+    'a;b',
+    ' a ; b ;c ',
+    ';;',
+    'first word; second word',
+    "'a;b'; \"c d\"",
+    "a;'b';;'';\"\"",
+    'a\\;b',
+    'a;#b;c\nd',
+    '1; 2; 3',
+])
+def test_list_items_known_values(argument_value):
+    assert_same_result(split_list_items, legacy_split_list_items, argument_value)
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_random_shell_and_list_values(seed):
+    randomizer = random.Random(seed)
+    alphabet = ['a', 'xyz', ' ', '\t', '\n', '\r', '\x0b', ';', "'", '"', "''", '\\', '#', 'ł']
+    for _ in range(500):
+        argument_value = ''.join(randomizer.choices(alphabet, k=randomizer.randint(0, 16)))
+        assert_same_result(split_shell_words, shlex.split, argument_value)
+        assert_same_result(split_list_items, legacy_split_list_items, argument_value)
+
+
+@pytest.mark.parametrize('argument_value', [
+    *SHELL_VALUES,
+    'a 1;b 2',
+    ' a  1 ; b\t2 ;c 3 ',
+    'a 1;;b 2;',
+    "a 'b c';'d;e' f",
+    'a "b \\"c";d\\ e f',
+    'a 1#comment\n;b 2',
+])
+def test_records_known_values(argument_value):
+    assert_same_result(split_records, legacy_split_records, argument_value)
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_random_records_values(seed):
+    randomizer = random.Random(seed)
+    alphabet = ['a', 'xyz', ' ', ' ', '\t', '\n', ';', ';', "'", '"', '\\', '#']
+    for _ in range(500):
+        argument_value = ''.join(randomizer.choices(alphabet, k=randomizer.randint(0, 16)))
+        assert_same_result(split_records, legacy_split_records, argument_value)
+
+
+def test_long_records_value():
+    argument_value = ';'.join(f" name{i} {i} ;'quoted; {i}' {i};escaped\\ {i} {i}" for i in range(2000))
+    assert split_records(argument_value) == legacy_split_records(argument_value)
+    plain_value = ';'.join(f' name{i}  {i} ' for i in range(2000))
+    assert split_records(plain_value) == [[f'name{i}', str(i)] for i in range(2000)]
+
+
+def test_long_list_value():
+    argument_value = ';'.join(f" item{i} ;'quoted; {i}';;escaped\\ {i}" for i in range(2000))
+    assert split_list_items(argument_value) == legacy_split_list_items(argument_value)
+    plain_value = ';'.join(f' {i} ' for i in range(2000))
+    assert split_list_items(plain_value) == [str(i) for i in range(2000)]
@@ -0,0 +1,83 @@
+from collections.abc import Generator
+
+import pytest
+
+from script_args_parser import ArgumentsParser
+from script_args_parser.arguments import (
+    _VersionedMapping,
+    Argument,
+    CUSTOM_TYPES_MAPPING,
+    ListArgument,
+    TupleArgument,
+)
+
+
+@pytest.fixture
+def custom_type() -> Generator[str, None, None]:
+    yield 'UtCustomType'
+    CUSTOM_TYPES_MAPPING.pop('UtCustomType', None)
+
+
+def test_converters_are_cached():
+    argument = ListArgument(name='list', description='List value', type='list[int]', cli_arg='--list')
+    assert argument.converters == [int]
+    assert argument.converters is argument.converters
+
+
+def test_tuple_converters_order():
+    argument = TupleArgument(
+        name='tuple', description='Tuple value', type='tuple[int, str, bool]', cli_arg='--tuple',
+    )
+    assert argument.converters[:2] == [int, str]
+    assert argument.converters[2] is argument.types_mapping['bool']
+
+
+def test_custom_type_registered_after_argument_creation(custom_type):
+    argument = Argument(name='custom', description='Custom value', type=custom_type, cli_arg='--custom')
+    with pytest.raises(KeyError):
+        argument.converters
+    CUSTOM_TYPES_MAPPING[custom_type] = str.upper
+    parser = ArgumentsParser([argument], ['--custom', 'value'])
+    assert parser.custom == 'VALUE'
+
+
+def test_custom_type_replaced(custom_type):
+    CUSTOM_TYPES_MAPPING[custom_type] = str.upper
+    argument = ListArgument(
+        name='list', description='List value', type=f'list[{custom_type}]', cli_arg='--list',
+    )
+    assert argument.convert_value(['a', 'b']) == ['A', 'B']
+    CUSTOM_TYPES_MAPPING.update({custom_type: str.lower})
+    assert argument.convert_value(['A', 'B']) == ['a', 'b']
+
+
+def test_custom_type_removed(custom_type):
+    CUSTOM_TYPES_MAPPING[custom_type] = str.upper
+    argument = Argument(name='custom', description='Custom value', type=custom_type, cli_arg='--custom')
+    assert argument.convert_value('a') == 'A'
+    del CUSTOM_TYPES_MAPPING[custom_type]
+    with pytest.raises(KeyError):
+        argument.convert_value('a')
+
+
+def test_types_mapping_is_a_copy(custom_type):
+    argument = Argument(name='custom', description='Custom value', type='str', cli_arg='--custom')
+    argument.types_mapping[custom_type] = str.upper
+    assert custom_type not in argument.types_mapping
+
+
+@pytest.mark.parametrize('modify', [
+    lambda x: x.__setitem__('int', int),
+    lambda x: x.__delitem__('str'),
+    lambda x: x.__ior__({'int': int}),
+    lambda x: x.clear(),
+    lambda x: x.pop('str'),
+    lambda x: x.popitem(),
+    lambda x: x.setdefault('int', int),
+    lambda x: x.update(int=int),
+])
+def test_mapping_modification_changes_version(modify):
+    mapping = _VersionedMapping(str=str)
+    version = mapping.version
+    modify(mapping)
+    assert mapping.version != version